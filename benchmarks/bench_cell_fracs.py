@@ -0,0 +1,61 @@
+"""Benchmarks Mesh.cell_fracs_to_mats() and Mesh.tag_cell_fracs() on a
+structured mesh whose volume elements each hold one to three of a handful of
+geometry cells, as produced by dagmc.discretize_geom().
+
+Run as a script::
+
+    python bench_cell_fracs.py [number of volume elements per side]
+"""
+from __future__ import print_function, division
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pyne.utils import QAWarning
+warnings.simplefilter("ignore", QAWarning)
+from pyne.material import Material
+from pyne.mesh import Mesh
+
+CELL_MATS = {1: Material({'H1': 0.11, 'O16': 0.89}, density=1.0),
+             2: Material({'Fe56': 0.95, 'C12': 0.05}, density=7.8),
+             3: Material({'Zr90': 1.0}, density=6.5),
+             4: Material({'U235': 0.04, 'U238': 0.96}, density=10.5)}
+
+
+def gen_cell_fracs(n, seed=42):
+    """Makes sorted cell_fracs with 1 - 3 cells per volume element, using
+    a few distinct volume fractions so that mixtures repeat.
+    """
+    rng = np.random.RandomState(seed)
+    dtype = [('idx', np.int64), ('cell', np.int64), ('vol_frac', np.float64),
+             ('rel_error', np.float64)]
+    rows = []
+    for i in range(n):
+        ncells = rng.randint(1, 4)
+        cells = np.sort(rng.choice(list(CELL_MATS), ncells, replace=False))
+        fracs = rng.randint(1, 5, ncells).astype(float)
+        fracs /= fracs.sum()
+        rows.extend((i, c, f, 0.0) for c, f in zip(cells, fracs))
+    return np.array(rows, dtype=dtype)
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    coords = np.linspace(0.0, 1.0, side + 1)
+    m = Mesh(structured=True, structured_coords=[coords, coords, coords])
+    cell_fracs = gen_cell_fracs(len(m))
+    print("volume elements: {0}, cell_fracs rows: {1}".format(len(m),
+          len(cell_fracs)))
+    t0 = time.time()
+    m.cell_fracs_to_mats(cell_fracs, CELL_MATS)
+    t1 = time.time()
+    m.tag_cell_fracs(cell_fracs)
+    t2 = time.time()
+    print("cell_fracs_to_mats: {0:.3f} s".format(t1 - t0))
+    print("tag_cell_fracs:     {0:.3f} s".format(t2 - t1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmarks the chainsolve Transmuter, comparing the dense matrix
+exponential traversal against the fast Bateman traversal on an activated
+stainless steel composition.
+
+Run as a script::
+
+    python bench_chainsolve.py
+"""
+from __future__ import print_function, division
+import time
+import warnings
+
+import numpy as np
+
+from pyne.utils import QAWarning
+warnings.simplefilter("ignore", QAWarning)
+from pyne.material import Material
+from pyne.transmute.chainsolve import Transmuter
+
+# SS316 by mass fraction
+STEEL = Material({'Fe56': 0.5995, 'Fe54': 0.0390, 'Fe57': 0.0140,
+                  'Cr52': 0.1420, 'Cr53': 0.0165, 'Cr50': 0.0075,
+                  'Ni58': 0.0810, 'Ni60': 0.0320, 'Ni62': 0.0045,
+                  'Mn55': 0.0200, 'Mo98': 0.0060, 'Mo96': 0.0040,
+                  'Mo95': 0.0040, 'Mo92': 0.0035, 'Si28': 0.0075,
+                  'Co59': 0.0010, 'C12': 0.0008, 'N14': 0.0010},
+                 mass=1.0, density=7.99)
+
+T = 3.15e7  # one year [s]
+PHI = 1e14 * np.ones(175) / 175.0  # [n/cm^2/s]
+TOL = 1e-10
+
+
+def bench(fast):
+    tm = Transmuter(t=T, phi=PHI, tol=TOL, fast=fast)
+    # warm up the cross section cache
+    tm.transmute(Material({'H1': 1.0}, mass=1.0))
+    t0 = time.time()
+    y = tm.transmute(STEEL)
+    t1 = time.time()
+    # a second call with the same parameters reuses the per-root results
+    tm.transmute(STEEL)
+    t2 = time.time()
+    return y, t1 - t0, t2 - t1
+
+
+def main():
+    y_dense, t_dense, t_dense_again = bench(False)
+    y_fast, t_fast, t_fast_again = bench(True)
+    print("dense: {0:.3f} s (repeat {1:.3f} s)".format(t_dense, t_dense_again))
+    print("fast:  {0:.3f} s (repeat {1:.3f} s)".format(t_fast, t_fast_again))
+    print("speedup: {0:.1f}x".format(t_dense / t_fast))
+    relerr = max(abs(y_fast.comp.get(nuc, 0.0) - frac) / frac for nuc, frac in
+                 y_dense.comp.items() if frac > 1e-12)
+    print("number of nuclides: {0}".format(len(y_dense.comp)))
+    print("max relative difference: {0:.3e}".format(relerr))
+
+
+if __name__ == "__main__":
+    main()
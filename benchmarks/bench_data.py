@@ -0,0 +1,59 @@
+"""Benchmarks the array decay data lookups in pyne.data against calling the
+scalar functions once per nuclide, as when building activity maps.
+
+Run as a script::
+
+    python bench_data.py [number of nuclides]
+"""
+from __future__ import print_function, division
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pyne.utils import QAWarning
+warnings.simplefilter("ignore", QAWarning)
+from pyne import data, nucname
+
+FUNCS = ["half_life", "decay_const", "atomic_mass", "ext_air_dose"]
+
+
+def make_nuclides(n, seed=42):
+    """Draws n ids, with repeats, from the ground states of Z < 100."""
+    rng = np.random.RandomState(seed)
+    pool = [zz * 10000000 + aa * 10000 for zz in range(1, 100)
+            for aa in range(zz, 3 * zz + 1) if nucname.isnuclide(
+                zz * 10000000 + aa * 10000)]
+    return np.asarray(pool, dtype=np.int32)[rng.randint(len(pool), size=n)]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    ids = make_nuclides(n)
+    print("nuclides: {0}, distinct: {1}".format(n, len(np.unique(ids))))
+    pylist = ids.tolist()
+    for func in FUNCS:
+        f = getattr(data, func)
+        f_many = getattr(data, func + "_many")
+        f_many(ids[:1])  # load the data and build the tables
+        t0 = time.time()
+        expected = [f(nuc) for nuc in pylist]
+        t1 = time.time()
+        result = f_many(ids)
+        t2 = time.time()
+        np.testing.assert_array_equal(result, expected)
+        print("{0:12s} per-call {1:.3f} s, array {2:.3f} s, speedup {3:.1f}x"
+              "".format(func, t1 - t0, t2 - t1, (t1 - t0) / (t2 - t1)))
+    parents = np.unique(ids)
+    t0 = time.time()
+    children, offsets = data.decay_children_many(parents)
+    froms = np.repeat(parents, np.diff(offsets))
+    brs = data.branch_ratio_many(froms, children)
+    t1 = time.time()
+    print("decay_children_many + branch_ratio_many for {0} parents: "
+          "{1:.3f} s".format(len(parents), t1 - t0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmarks pyne.nucname.convert_array against calling the scalar
+nucname functions once per nuclide.
+
+Run as a script::
+
+    python bench_nucname.py [number of nuclides]
+"""
+from __future__ import print_function, division
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pyne.utils import QAWarning
+warnings.simplefilter("ignore", QAWarning)
+from pyne import nucname
+
+FUNCS = ["id", "name", "zzaaam", "mcnp", "serpent", "alara"]
+
+
+def make_nuclides(n, seed=42):
+    """Draws n ids, with repeats, from the ground state nuclides of Z < 100.
+    """
+    rng = np.random.RandomState(seed)
+    pool = [zz * 10000000 + aa * 10000 for zz in range(1, 100)
+            for aa in range(zz, 3 * zz + 1) if nucname.isnuclide(
+                zz * 10000000 + aa * 10000)]
+    return np.asarray(pool, dtype=np.int32)[rng.randint(len(pool), size=n)]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    ids = make_nuclides(n)
+    names = nucname.convert_array("name", ids)
+    print("nuclides: {0}, distinct: {1}".format(n, len(np.unique(ids))))
+    for label, nucs in [("int", ids), ("str", names)]:
+        pylist = nucs.tolist()
+        for func in FUNCS:
+            f = getattr(nucname, func)
+            t0 = time.time()
+            expected = [f(nuc) for nuc in pylist]
+            t1 = time.time()
+            result = nucname.convert_array(func, nucs)
+            t2 = time.time()
+            assert result.tolist() == expected
+            print("{0:8s} {1:3s} input: per-call {2:.3f} s, array {3:.3f} s, "
+                  "speedup {4:.1f}x".format(func, label, t1 - t0, t2 - t1,
+                                            (t1 - t0) / (t2 - t1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmarks pyne.source_sampling.Sampler setup and batched particle
+sampling on a synthetic structured mesh with a multigroup source.
+
+Run as a script::
+
+    python bench_source_sampling.py [volume elements per side] [groups]
+"""
+from __future__ import print_function, division
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from pyne.utils import QAWarning
+warnings.simplefilter("ignore", QAWarning)
+from pyne.mesh import Mesh, IMeshTag
+from pyne.source_sampling import Sampler
+
+MODES = [("analog", 0), ("uniform", 1), ("user", 2)]
+
+
+def make_source_mesh(filename, side, num_groups, seed=42):
+    """Writes a cube of side**3 hexes with random source and bias densities
+    in num_groups energy groups.
+    """
+    rng = np.random.RandomState(seed)
+    coords = np.linspace(0.0, 1.0, side + 1)
+    m = Mesh(structured=True, structured_coords=[coords, coords, coords],
+             mats=None)
+    m.src = IMeshTag(num_groups, float)
+    m.src[:] = rng.random_sample((len(m), num_groups))
+    m.bias = IMeshTag(num_groups, float)
+    m.bias[:] = rng.random_sample((len(m), num_groups))
+    m.mesh.save(filename)
+    return len(m)
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    num_groups = int(sys.argv[2]) if len(sys.argv) > 2 else 175
+    filename = "bench_source_sampling.h5m"
+    num_ves = make_source_mesh(filename, side, num_groups)
+    e_bounds = np.linspace(0.0, 1.0, num_groups + 1)
+    tag_names = {"src_tag_name": "src", "bias_tag_name": "bias"}
+    print("volume elements: {0}, energy groups: {1}".format(num_ves,
+                                                            num_groups))
+    try:
+        for name, mode in MODES:
+            t0 = time.time()
+            sampler = Sampler(filename, tag_names, e_bounds, mode)
+            t1 = time.time()
+            times = sampler.setup_times
+            print("{0:8s} setup: {1:.3f} s (load {2:.3f} s, geom {3:.3f} s, "
+                  "tags {4:.3f} s)".format(name, t1 - t0, times["load"],
+                                           times["geom"], times["tags"]))
+        n = 10**6
+        t0 = time.time()
+        sampler.particle_birth_many(n, 1953)
+        t1 = time.time()
+        print("particle_birth_many: {0:.0f} particles/s".format(n/(t1 - t0)))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,10 +18,14 @@ generates ACE-format cross sections.
 
 from __future__ import division, unicode_literals
 import io
+import os
+import json
+import mmap as _mmap
 import struct
+import time
 from warnings import warn
 from pyne.utils import QAWarning
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 
 cimport numpy as np
 import numpy as np
@@ -111,6 +115,92 @@ def ascii_to_binary(ascii_file, binary_file):
     binary.close()
 
 
+def union_grid(tables):
+    """union_grid(tables)
+
+    Returns the union of the energy grids of NeutronTables, e.g. all of the
+    nuclides in a material, on which they can be evaluated together.
+
+    Parameters
+    ----------
+    tables : iterable of NeutronTables
+        Tables whose energy grids are combined.
+
+    Returns
+    -------
+    energy : ndarray
+        Sorted, unique energies in MeV.
+    """
+    return np.unique(np.concatenate([table.energy for table in tables]))
+
+
+def macroscopic_total(mat, tables, energies=None):
+    """macroscopic_total(mat, tables, energies=None)
+
+    Computes the macroscopic total cross section of a material from the
+    microscopic total cross sections of its nuclides, weighted by their atom
+    densities from Material.to_atom_dens().
+
+    Parameters
+    ----------
+    mat : Material
+        The material, with a density in g/cc.
+    tables : dict
+        Maps nuclides in any nucname form to the NeutronTables to use for
+        them.  Every nuclide of the material must be present.
+    energies : array-like, optional
+        Energies in MeV at which to evaluate the cross section.  By default,
+        the union of the energy grids of the tables is used.
+
+    Returns
+    -------
+    energies : ndarray
+        Energies in MeV.
+    sigma_t : ndarray
+        The macroscopic total cross section in 1/cm at each energy.
+    """
+    bynuc = dict((nucname.id(nuc), table) for nuc, table in tables.items())
+    atom_dens = mat.to_atom_dens()
+    missing = [nucname.name(nuc) for nuc in atom_dens if nuc not in bynuc]
+    if len(missing) > 0:
+        raise KeyError("no ACE table for " + ", ".join(sorted(missing)))
+    if energies is None:
+        energies = union_grid([bynuc[nuc] for nuc in atom_dens])
+    energies = np.asarray(energies, dtype=float)
+    sigma_t = np.zeros(len(energies), dtype=float)
+    for nuc, dens in atom_dens.items():
+        # barns to cm^2
+        sigma_t += 1e-24 * dens * bynuc[nuc].evaluate(1, energies)[0]
+    return energies, sigma_t
+
+
+_TocEntry = namedtuple('_TocEntry', ['awr', 'temp', 'nxs', 'jxs', 'xss_offset',
+                                     'end'])
+
+
+def _is_header(line):
+    """Returns whether a line of an ASCII library is the first line of a
+    table header.
+    """
+    words = line.split()
+    if len(words) < 3:
+        return False
+    try:
+        float(words[0])
+        return False
+    except ValueError:
+        pass
+    # 2.0 style headers start with the format version, e.g. 2.0.0
+    if words[0][1:2] == '.':
+        return True
+    try:
+        float(words[1])
+        float(words[2])
+    except ValueError:
+        return False
+    return True
+
+
 class Library(object):
     """
     A Library objects represents an ACE-formatted file which may contain
@@ -131,11 +221,35 @@ class Library(object):
     verbose : bool
         Determines whether output is printed to the stdout when reading a
         Library
+    toc : OrderedDict or None
+        For memory-mapped or indexed libraries, the table of contents mapping
+        table names to (awr, temp, nxs, jxs, xss_offset, end) named
+        tuples, where xss_offset is the byte offset of the XSS array and end
+        the byte offset of the next table.  This is built by the first read().
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, mmap=False, index=False):
+        """Parameters
+        ----------
+        filename : str
+            Path of the ACE library file to load.
+        mmap : bool, optional
+            For binary libraries, memory-map the file.  Reading then only
+            scans the table headers and the xss array of each table read is
+            a read-only view into the mapped file rather than a copy.  This
+            is ignored for ASCII libraries.
+        index : bool or str, optional
+            Keep the table of contents in a sidecar index file, by default
+            filename + '.idx', or the given path.  The index is built by the
+            first read() and reused as long as the size and modification time
+            of the library match, so that reading a few tables seeks straight
+            to them rather than scanning the library.
+
+        """
         # Determine whether file is ASCII or binary
         self.f = None
+        self._fb = None
+        self.filename = filename
         try:
             self.f = io.open(filename, 'rb')
             # Grab 10 lines of the library
@@ -158,8 +272,16 @@ class Library(object):
         self.verbose = False
         self.tables = {}
 
-    def read(self, table_names=None):
-        """read(table_names=None)
+        self.mmap = None
+        self.toc = None
+        if mmap and self.binary:
+            self.mmap = _mmap.mmap(self.f.fileno(), 0, access=_mmap.ACCESS_READ)
+        if index is True:
+            index = filename + '.idx'
+        self.index = index or None
+
+    def read(self, table_names=None, blocks=None):
+        """read(table_names=None, blocks=None)
 
         Read through and parse the ACE-format library.
 
@@ -168,6 +290,11 @@ class Library(object):
         table_names : None, str, or iterable, optional
             Tables from the file to read in.  If None, reads in all of the
             tables. If str, reads in only the single table of a matching name.
+        blocks : None, str, or iterable, optional
+            Data blocks of NeutronTables to decode now, see
+            NeutronTable.blocks, or 'all'.  Otherwise only the cross sections
+            are decoded as tables are read and the remaining blocks are
+            decoded on first access.
         """
         if isinstance(table_names, basestring):
             table_names = [table_names]
@@ -175,11 +302,23 @@ class Library(object):
         if table_names is not None:
             table_names = set(table_names)
 
-        if self.binary:
+        if self.mmap is not None or self.index is not None:
+            self._read_toc(table_names)
+        elif self.binary:
             self._read_binary(table_names)
         else:
             self._read_ascii(table_names)
 
+        if blocks is not None:
+            if blocks == 'all':
+                blocks = None
+            elif isinstance(blocks, basestring):
+                blocks = [blocks]
+            for name, table in self.tables.items():
+                if isinstance(table, NeutronTable) and (table_names is None
+                                                        or name in table_names):
+                    table.decode(blocks)
+
     def _read_binary(self, table_names, recl_length=4096, entries=512):
         while True:
             start_position = self.f.tell()
@@ -255,6 +394,258 @@ class Library(object):
             # Advance to next record
             self.f.seek(start_position + recl_length*(n_records + 1))
 
+    def read_at(self, offsets, recl_length=4096, entries=512):
+        """read_at(offsets, recl_length=4096, entries=512)
+
+        Reads the tables which start at the given byte offsets, such as those
+        given by an xsdir file, without scanning the rest of the library.
+
+        Parameters
+        ----------
+        offsets : iterable of ints
+            Byte offsets of the start of each table.
+        recl_length : int, optional
+            Record length in bytes of binary libraries.
+        entries : int, optional
+            Number of XSS entries per record of binary libraries.
+        """
+        for offset in offsets:
+            name, entry = self._header_at(offset, recl_length, entries)
+            if name is None:
+                raise ValueError("no ACE table at byte {0} of {1}".format(
+                                 offset, self.filename))
+            if self.toc is not None:
+                self.toc[name] = entry
+            self._read_entry(name, entry)
+
+    def line_offsets(self, lines):
+        """line_offsets(lines)
+
+        Finds the byte offsets of the starts of lines of an ASCII library in
+        a single pass over the file.
+
+        Parameters
+        ----------
+        lines : sequence of ints
+            One-based line numbers, such as xsdir addresses.
+
+        Returns
+        -------
+        offsets : list of ints
+            The byte offset of each line.
+        """
+        cdef int i = 0
+        f = self._bytes_file()
+        targets = sorted(set(lines))
+        found = {}
+        base = 0
+        nlines = 0
+        while i < len(targets) and targets[i] <= 1:
+            found[targets[i]] = 0
+            i += 1
+        f.seek(0)
+        while i < len(targets):
+            chunk = f.read(1 << 22)
+            if len(chunk) == 0:
+                break
+            newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+            # line n starts after the (n - 1)th newline
+            while i < len(targets) and targets[i] - 1 <= nlines + len(newlines):
+                found[targets[i]] = base + newlines[targets[i] - 2 - nlines] + 1
+                i += 1
+            nlines += len(newlines)
+            base += len(chunk)
+        if i < len(targets):
+            raise ValueError("{0} has fewer than {1} lines".format(
+                             self.filename, targets[i]))
+        return [int(found[line]) for line in lines]
+
+    def _bytes_file(self):
+        """Returns a handle on the library opened in binary mode, so that
+        offsets are in bytes for ASCII libraries as well.
+        """
+        if self.binary:
+            return self.f
+        if self._fb is None:
+            self._fb = io.open(self.filename, 'rb')
+        return self._fb
+
+    def _header_at(self, offset, recl_length=4096, entries=512):
+        """Parses the header of the table starting at a byte offset and
+        returns its name and table of contents entry, or (None, None) at the
+        end of the file.
+        """
+        cdef int i
+        if self.binary:
+            if self.mmap is not None:
+                buf = self.mmap[offset:offset + 500]
+            else:
+                self.f.seek(offset)
+                buf = self.f.read(500)
+            if len(buf) < 500:
+                return None, None
+            name, awr, temp = struct.unpack_from(str('=10sdd'), buf)
+            nxs = struct.unpack_from(str('=16i'), buf, 308)
+            jxs = struct.unpack_from(str('=32i'), buf, 372)
+            n_records = (nxs[0] + entries - 1)//entries
+            entry = _TocEntry(awr, temp, np.array((0,) + nxs, dtype=int),
+                              np.array((0,) + jxs, dtype=int),
+                              offset + recl_length,
+                              offset + recl_length*(n_records + 1))
+            return name.strip().decode(), entry
+
+        f = self._bytes_file()
+        f.seek(offset)
+        line = f.readline().decode()
+        if 0 == len(line.strip()):
+            return None, None
+        words = line.split()
+        # check if it's a 2.0 style header
+        if words[0][1] == '.':
+            name = words[1]
+            words = f.readline().split()
+            awr = float(words[0])
+            temp = float(words[1])
+            for i in range(int(words[3]) - 2):
+                f.readline()
+            line = f.readline().decode()
+        else:
+            name = words[0]
+            awr = float(words[1])
+            temp = float(words[2])
+        lines = [line] + [f.readline().decode() for i in range(11)]
+        nxs = fromstring_split('0 ' + ' '.join(lines[6:8]), dtype=int)
+        jxs = fromstring_split('0 ' + ' '.join(lines[8:12]), dtype=int)
+
+        # skip over XSS, assuming lines of equal length
+        xss_offset = f.tell()
+        n_lines = (nxs[1] + 3)//4
+        first = f.readline()
+        if 1 < n_lines:
+            f.seek(f.tell() + len(first)*(n_lines - 2) + 1)
+            f.readline()
+        end = f.tell()
+        size = os.path.getsize(self.filename)
+        if end > size or (end < size and
+                          not _is_header(f.readline().decode())):
+            # lines are of unequal length, so count the XSS entries instead
+            f.seek(xss_offset)
+            i = 0
+            while i < nxs[1]:
+                line = f.readline()
+                if len(line) == 0:
+                    break
+                i += len(line.split())
+            end = f.tell()
+        entry = _TocEntry(awr, temp, nxs, jxs, xss_offset, end)
+        return name, entry
+
+    def _scan(self):
+        """Builds the table of contents from the headers of every table."""
+        toc = OrderedDict()
+        offset = 0
+        size = os.path.getsize(self.filename)
+        while offset < size:
+            name, entry = self._header_at(offset)
+            if name is None:
+                break
+            toc[name] = entry
+            offset = entry.end
+        return toc
+
+    def _load_index(self):
+        """Returns the table of contents from the sidecar index, or None if
+        it is missing or out of date.
+        """
+        st = os.stat(self.filename)
+        try:
+            with io.open(self.index, 'r') as f:
+                idx = json.load(f)
+            if idx['size'] != st.st_size or idx['mtime'] != st.st_mtime:
+                return None
+            toc = OrderedDict()
+            for name, awr, temp, nxs, jxs, xss_offset, end in idx['tables']:
+                toc[name] = _TocEntry(awr, temp, np.array(nxs, dtype=int),
+                                      np.array(jxs, dtype=int), xss_offset, end)
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        return toc
+
+    def _write_index(self):
+        st = os.stat(self.filename)
+        tables = [[name, e.awr, e.temp, e.nxs.tolist(), e.jxs.tolist(),
+                   e.xss_offset, e.end]
+                  for name, e in self.toc.items()]
+        idx = {'size': st.st_size, 'mtime': st.st_mtime, 'tables': tables}
+        try:
+            with io.open(self.index, 'w') as f:
+                f.write(json.dumps(idx))
+        except (IOError, OSError):
+            warn("could not write ACE index " + self.index, RuntimeWarning)
+
+    def _read_toc(self, table_names):
+        if self.toc is None:
+            if self.index is not None:
+                self.toc = self._load_index()
+            if self.toc is None:
+                self.toc = self._scan()
+                if self.index is not None:
+                    self._write_index()
+        for name, entry in self.toc.items():
+            # verify that we are supposed to read this table in
+            if (table_names is not None) and (name not in table_names):
+                continue
+            self._read_entry(name, entry)
+
+    def _read_entry(self, name, entry):
+        """Reads the table described by a table of contents entry."""
+        # ensure we have a valid table type
+        if 0 == len(name) or name[-1] not in table_types:
+            warn("Unsupported table: " + name, RuntimeWarning)
+            return
+
+        # get the table
+        table = table_types[name[-1]](name, entry.awr, entry.temp)
+
+        if self.verbose:
+            temp_in_K = round(entry.temp * 1e6 / 8.617342e-5)
+            print("Loading nuclide {0} at {1} K".format(name, temp_in_K))
+        self.tables[name] = table
+
+        table.nxs = entry.nxs.copy()
+        table.jxs = entry.jxs.copy()
+
+        # The XSS array has a leading zero so that the indexing is the same
+        # as Fortran.
+        length = entry.nxs[1]
+        if self.mmap is not None:
+            # The eight bytes before XSS are the zero padding of the header
+            # record, so viewing from there gives the leading zero without a
+            # copy.
+            xss = np.frombuffer(self.mmap, dtype=float, count=length + 1,
+                                offset=entry.xss_offset - 8)
+            if xss[0] != 0.0:
+                xss = np.concatenate([[0.0], xss[1:]])
+        elif self.binary:
+            xss = np.empty(length + 1, dtype=float)
+            xss[0] = 0.0
+            self.f.seek(entry.xss_offset)
+            self.f.readinto(xss[1:])
+        else:
+            f = self._bytes_file()
+            f.seek(entry.xss_offset)
+            datastr = '0.0 ' + f.read(entry.end - entry.xss_offset).decode()
+            if NP_LE_V15:
+                xss = fromstring_split(datastr, dtype=float)
+            else:
+                n_lines = (length + 3)//4
+                xss = fromstring_token(datastr, inplace=True,
+                                       maxsize=4*n_lines+1)
+        table.xss = xss
+
+        # Read all data blocks
+        table._read_all()
+
     def _read_ascii(self, table_names):
         cdef list lines, rawdata
 
@@ -374,6 +765,8 @@ class Library(object):
     def __del__(self):
         if self.f is not None:
             self.f.close()
+        if self._fb is not None:
+            self._fb.close()
 
 
 class AceTable(object):
@@ -456,12 +849,66 @@ class NeutronTable(AceTable):
     temp : float
         Temperature of the target nuclide in eV.
 
+    decode_times : dict
+        Wall-clock seconds spent decoding each data block.
+
+    The cross sections of any reactions, the total (MT 1) and the absorption
+    (MT 27), may be interpolated at arbitrary energies with evaluate().
+
+    Notes
+    -----
+    Only the cross section block is decoded when a table is read.  The other
+    blocks, listed in ``NeutronTable.blocks``, are decoded on first access
+    to any of their attributes, e.g. ``reactions[2].ang_energy_in`` decodes
+    the angular distributions, or all at once with decode().
+
     """
 
+    blocks = ('cross_sections', 'nu', 'angular', 'energy', 'photon',
+              'fission', 'urr')
+
+    _block_readers = {
+        'cross_sections': ('_read_cross_sections',),
+        'nu': ('_read_nu',),
+        'angular': ('_read_angular_distributions',),
+        'energy': ('_read_energy_distributions',),
+        'photon': ('_read_gpd', '_read_mtrp', '_read_lsigp', '_read_sigp',
+                   '_read_landp', '_read_andp', '_read_yp'),
+        'fission': ('_read_fis',),
+        'urr': ('_read_unr',),
+        }
+
+    # attributes of the table and of its reactions set by each block
+    _block_attrs = {
+        'nu_t_type': 'nu', 'nu_t_energy': 'nu', 'nu_t_value': 'nu',
+        'nu_p_type': 'nu', 'nu_p_energy': 'nu', 'nu_p_value': 'nu',
+        'nu_d_energy': 'nu', 'nu_d_value': 'nu',
+        'nu_d_precursor_const': 'nu', 'nu_d_precursor_energy': 'nu',
+        'nu_d_precursor_prob': 'nu', 'nu_d_energy_dist': 'nu',
+        'sigma_photon': 'photon', 'photon_reactions': 'photon',
+        'a_dist_energy_in': 'photon', 'a_dist_mu_out': 'photon',
+        'MT_for_photon_yield': 'photon',
+        'IE_fission': 'fission', 'sigma_f': 'fission',
+        'urr_energy': 'urr', 'urr_table': 'urr',
+        'e_dist_energy_out1': 'energy', 'e_dist_energy_out2': 'energy',
+        'e_dist_energy_outNE': 'energy', 'e_dist_LP': 'energy',
+        'e_dist_EG': 'energy',
+        }
+
+    _reaction_block_attrs = {
+        'ang_energy_in': 'angular', 'ang_cos': 'angular',
+        'ang_pdf': 'angular', 'ang_cdf': 'angular',
+        'energy_dist': 'energy',
+        'LOCA': 'photon', 'LOCB': 'photon', 'e_yield': 'photon',
+        'photon_yield': 'photon',
+        }
+
     def __init__(self, name, awr, temp):
         super(NeutronTable, self).__init__(name, awr, temp)
         self.reactions = OrderedDict()
-        self.photon_reactions = OrderedDict()
+        self.decode_times = {}
+        self._sigma_on_grid = {}
+        self._grid_index = None
 
     def __repr__(self):
         if hasattr(self, 'name'):
@@ -469,23 +916,46 @@ class NeutronTable(AceTable):
         else:
             return "<ACE Continuous-E Neutron Table>"
 
+    def __getattr__(self, name):
+        # only called for attributes which have not been set yet
+        block = NeutronTable._block_attrs.get(name)
+        if block is None or 'decode_times' not in self.__dict__ or \
+                block in self.decode_times:
+            raise AttributeError("{0!r} object has no attribute {1!r}".format(
+                                 type(self).__name__, name))
+        self.decode([block])
+        return object.__getattribute__(self, name)
+
     def _read_all(self):
-        self._read_cross_sections()
-        self._read_nu()
-        self._read_angular_distributions()
-        self._read_energy_distributions()
-        self._read_gpd()
-        self._read_mtrp()
-        self._read_lsigp()
-        self._read_sigp()
-        self._read_landp()
-        self._read_andp()
-        # Read LDLWP block
-        # Read DLWP block
-        # Read YP block
-        self._read_yp()
-        self._read_fis()
-        self._read_unr()
+        self.decode(['cross_sections'])
+
+    def decode(self, blocks=None):
+        """decode(blocks=None)
+
+        Decodes data blocks from the XSS array, if they have not been decoded
+        already, and records the time taken in decode_times.
+
+        Parameters
+        ----------
+        blocks : iterable of str, optional
+            Names of the blocks to decode, from NeutronTable.blocks.  By
+            default, all blocks are decoded.
+        """
+        blocks = self.blocks if blocks is None else list(blocks)
+        for block in blocks:
+            if block not in self._block_readers:
+                raise ValueError("unknown ACE data block {0!r}, expected one "
+                                 "of {1}".format(block, ', '.join(self.blocks)))
+        if 'cross_sections' not in self.decode_times:
+            # the other blocks need the reactions
+            blocks = ['cross_sections'] + list(blocks)
+        for block in blocks:
+            if block in self.decode_times:
+                continue
+            start = time.time()
+            for reader in self._block_readers[block]:
+                getattr(self, reader)()
+            self.decode_times[block] = time.time() - start
 
     def _read_cross_sections(self):
         """Reads and parses the ESZ, MTR, LQR, TRY, LSIG, and SIG blocks. These
@@ -1210,7 +1680,7 @@ class NeutronTable(AceTable):
         NMT = self.nxs[6]
         mts = np.asarray(self.xss[LMT:LMT+NMT], dtype=int)
         rxs = [(mt, Reaction(mt, self)) for mt in mts]
-        self.photon_reactions.update(rxs)
+        self.photon_reactions = OrderedDict(rxs)
 
     def _read_lsigp(self):
         """Determine location of cross sections for each photon-producing reaction
@@ -1359,6 +1829,87 @@ class NeutronTable(AceTable):
     def find_reaction(self, mt):
         return self.reactions.get(mt, None)
 
+    def sigma_on_grid(self, mt):
+        """sigma_on_grid(mt)
+
+        Returns the cross section of a reaction on the whole energy grid of
+        the table, with zeros below its threshold.  MT 1 and 27 give the
+        total and absorption cross sections if there is no such reaction.
+
+        Parameters
+        ----------
+        mt : int
+            The MT number of the reaction.
+
+        Returns
+        -------
+        sigma : ndarray
+            The cross section in barns at each point of the energy grid.
+        """
+        sigma = self._sigma_on_grid.get(mt)
+        if sigma is not None:
+            return sigma
+        if mt in self.reactions:
+            rxn = self.reactions[mt]
+            sigma = np.zeros(len(self.energy), dtype=float)
+            sigma[rxn.IE:rxn.IE + len(rxn.sigma)] = rxn.sigma
+        elif mt == 1:
+            sigma = np.asarray(self.sigma_t, dtype=float)
+        elif mt == 27:
+            sigma = np.asarray(self.sigma_a, dtype=float)
+        else:
+            raise KeyError("no reaction with MT {0} in {1}".format(mt, self.name))
+        self._sigma_on_grid[mt] = sigma
+        return sigma
+
+    def evaluate(self, mts, energies=None):
+        """evaluate(mts, energies=None)
+
+        Evaluates the cross sections of several reactions at once by linear
+        interpolation on the energy grid of the table.  The interpolation
+        indices for the most recent set of energies are cached, so that
+        evaluating further reactions on the same energies, such as a grid
+        from union_grid(), does not search the energy grid again.
+
+        Parameters
+        ----------
+        mts : int or iterable of ints
+            MT numbers of the reactions, see sigma_on_grid().
+        energies : array-like, optional
+            Energies in MeV.  Energies outside of the grid take the value at
+            its nearest end.  By default, the energy grid of the table is used.
+
+        Returns
+        -------
+        sigma : ndarray
+            Cross sections in barns with shape (len(mts), len(energies)).
+        """
+        if np.isscalar(mts):
+            mts = [mts]
+        sigma = np.array([self.sigma_on_grid(mt) for mt in mts], dtype=float)
+        if energies is None:
+            return sigma
+        energies = np.asarray(energies, dtype=float)
+        idx, frac = self._interp_index(energies)
+        return sigma[:, idx] * (1.0 - frac) + sigma[:, idx + 1] * frac
+
+    def _interp_index(self, energies):
+        """Returns the lower grid index and interpolation fraction for each
+        energy, reusing those of the previous call for the same energies.
+        """
+        if self._grid_index is not None:
+            cached, idx, frac = self._grid_index
+            if np.array_equal(cached, energies):
+                return idx, frac
+        grid = np.asarray(self.energy, dtype=float)
+        idx = np.searchsorted(grid, energies, side='right') - 1
+        idx = np.clip(idx, 0, len(grid) - 2)
+        width = grid[idx + 1] - grid[idx]
+        width[width == 0.0] = 1.0
+        frac = np.clip((energies - grid[idx]) / width, 0.0, 1.0)
+        self._grid_index = (energies.copy(), idx, frac)
+        return idx, frac
+
     def __iter__(self):
         # Generators not supported in Cython
         #for r in self.reactions.values():
@@ -1566,6 +2117,17 @@ class Reaction(object):
         """
         return self.table.energy[self.IE]
 
+    def __getattr__(self, name):
+        # decode the block of the parent table that sets this attribute
+        table = self.__dict__.get('table')
+        if isinstance(table, NeutronTable):
+            block = NeutronTable._reaction_block_attrs.get(name)
+            if block is not None and block not in table.decode_times:
+                table.decode([block])
+                return object.__getattribute__(self, name)
+        raise AttributeError("{0!r} object has no attribute {1!r}".format(
+                             type(self).__name__, name))
+
     def __repr__(self):
         name = label(self.MT)
         if name is not None:
@@ -27,6 +27,7 @@ cdef extern from "data.h" namespace "pyne":
     double atomic_mass(int) except +
     double atomic_mass(char *) except +
     double atomic_mass(std_string) except +
+    void atomic_mass(int, int *, double *) except +
 
     # simple_xs functions
     map[std_string, map[int, map[int, double]]] simple_xs_map
@@ -46,6 +47,7 @@ cdef extern from "data.h" namespace "pyne":
     double q_val(int) except +
     double q_val(char *) except +
     double q_val(std_string) except +
+    void q_val(int, int *, double *) except +
 
     map[int, double] gamma_frac_map
     double gamma_frac(int) except +
@@ -81,6 +83,14 @@ cdef extern from "data.h" namespace "pyne":
     std_string dose_lung_model(char *, int) except +
     std_string dose_lung_model(std_string, int) except +
 
+    # dose factor array functions
+    void ext_air_dose(int, int *, int, double *) except +
+    void ext_soil_dose(int, int *, int, double *) except +
+    void ingest_dose(int, int *, int, double *) except +
+    void inhale_dose(int, int *, int, double *) except +
+    void dose_ratio(int, int *, int, double *) except +
+    void dose_fluid_frac(int, int *, int, double *) except +
+
     # Scattering length functions
     map[int, extra_types.complex_t] b_coherent_map
     extra_types.complex_t b_coherent(int) except +
@@ -130,6 +140,12 @@ cdef extern from "data.h" namespace "pyne":
     set[int] decay_children(char *) except +
     set[int] decay_children(std_string) except +
 
+    # decay data array functions
+    void half_life(int, int *, double *, bool) except +
+    void decay_const(int, int *, double *, bool) except +
+    void branch_ratio(int, int *, int *, double *, bool) except +
+    void decay_children(int, int *, int *, vector[int] &, bool) except +
+
     int metastable_id(int, int) except +
     int metastable_id(int) except +
 
@@ -150,6 +166,8 @@ cdef extern from "data.h" namespace "pyne":
     vector[pair[double, double]] gamma_energy(int parent) except +
     vector[pair[double, double]] gamma_energy(double energy,
                                               double error) except +
+    vector[vector[pair[double, double]]] gamma_energy(
+        vector[pair[double, double]] windows) except +
     vector[pair[double, double]] gamma_photon_intensity(int parent) except +
     vector[pair[double, double]] gamma_photon_intensity(double energy,
                                                         double error) except +
@@ -157,23 +175,33 @@ cdef extern from "data.h" namespace "pyne":
     vector[pair[double, double]] gamma_total_intensity(int parent) except +
     vector[pair[int, int]] gamma_from_to(int parent) except +
     vector[pair[int, int]] gamma_from_to(double energy, double error) except +
+    vector[vector[pair[int, int]]] gamma_from_to(
+        vector[pair[double, double]] windows) except +
     vector[pair[int, int]] gamma_parent_child(double energy, double error) except +
+    vector[vector[pair[int, int]]] gamma_parent_child(
+        vector[pair[double, double]] windows) except +
     vector[int] gamma_parent(double energy, double error) except +
+    vector[vector[int]] gamma_parent(vector[pair[double, double]] windows) except +
     vector[int] gamma_child(double energy, double error) except +
+    vector[vector[int]] gamma_child(vector[pair[double, double]] windows) except +
     vector[int] gamma_child(int parent) except +
     vector[pair[double, double]] gamma_xrays(int parent) except +
 
     vector[double] alpha_energy(int parent) except +
     vector[double] alpha_intensity(int parent) except +
     vector[int] alpha_parent(double energy, double error) except +
+    vector[vector[int]] alpha_parent(vector[pair[double, double]] windows) except +
     vector[int] alpha_child(double energy, double error) except +
+    vector[vector[int]] alpha_child(vector[pair[double, double]] windows) except +
     vector[int] alpha_child(int parent) except +
 
     vector[double] beta_endpoint_energy(int parent) except +
     vector[double] beta_average_energy(int parent) except +
     vector[double] beta_intensity(int parent) except +
     vector[int] beta_parent(double energy, double error) except +
+    vector[vector[int]] beta_parent(vector[pair[double, double]] windows) except +
     vector[int] beta_child(double energy, double error) except +
+    vector[vector[int]] beta_child(vector[pair[double, double]] windows) except +
     vector[int] beta_child(int parent) except +
 
     vector[double] ecbp_endpoint_energy(int parent) except +
@@ -181,6 +209,8 @@ cdef extern from "data.h" namespace "pyne":
     vector[double] ec_intensity(int parent) except +
     vector[double] bp_intensity(int parent) except +
     vector[int] ecbp_parent(double energy, double error) except +
+    vector[vector[int]] ecbp_parent(vector[pair[double, double]] windows) except +
     vector[int] ecbp_child(double energy, double error) except +
+    vector[vector[int]] ecbp_child(vector[pair[double, double]] windows) except +
     vector[int] ecbp_child(int parent) except +
     vector[pair[double, double]] ecbp_xrays(int parent) except +
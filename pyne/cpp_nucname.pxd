@@ -2,6 +2,7 @@
 from libcpp.map cimport map
 from libcpp.set cimport set
 from libcpp.string cimport string as std_string
+from libcpp.vector cimport vector
 
 cdef extern from "nucname.h" namespace "pyne::nucname":
     # Conversion dictionaries
@@ -145,3 +146,10 @@ cdef extern from "nucname.h" namespace "pyne::nucname":
 
     # ENSDF id Functions
     int ensdf_to_id(char *) except +
+
+    # Array Functions
+    void convert(std_string, int, int *, int *) except +
+    void convert(std_string, int, char *, int, int *) except +
+    void convert(std_string, int, int *, vector[std_string] &, int *) except +
+    void convert(std_string, int, char *, int, vector[std_string] &,
+                 int *) except +
@@ -8,6 +8,7 @@
 ################################################
 
 
+from libc.stdint cimport uint64_t
 from libcpp cimport bool as cpp_bool
 from libcpp.string cimport string as std_string
 from libcpp.vector cimport vector as cpp_vector
@@ -60,11 +61,15 @@ cdef extern from "source_sampling.h" namespace "pyne":
         Sampler(std_string, std_string, cpp_vector[double], std_string) except +
         Sampler(std_string, std_string, cpp_vector[double], cpp_bool) except +
         Sampler(std_string, cpp_map[std_string, std_string], cpp_vector[double], int) except +
+        Sampler(std_string, cpp_map[std_string, std_string], cpp_vector[double], int, std_string) except +
 
         # attributes
+        cpp_map[std_string, double] setup_times
 
 
         # methods
         SourceParticle particle_birth() except +
         SourceParticle particle_birth(cpp_vector[double]) except +
+        void particle_birth_many(int, uint64_t, double*, double*, double*,
+                                 double*, double*, int*, uint64_t) nogil except +
 
@@ -7,4 +7,7 @@ cdef extern from "transmuters.h" namespace "pyne::transmuters":
 
     map[int, double] cram(vector[double], const map[int, double]) except +ValueError
     map[int, double] cram(vector[double], const map[int, double], const int) except +ValueError
-
+    void cram(vector[double]&, const double*, double*, int) nogil except +ValueError
+    void cram(vector[double]&, const double*, double*, int, const int) nogil except +ValueError
+    void cram_steps(vector[vector[double]]&, const double*, double*, int) nogil except +ValueError
+    void cram_steps(vector[vector[double]]&, const double*, double*, int, const int) nogil except +ValueError
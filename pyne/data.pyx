@@ -10,6 +10,8 @@ from libcpp.map cimport map as cpp_map
 from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string as std_string
 from libcpp.utility cimport pair as cpp_pair
+from libcpp.vector cimport vector as cpp_vector
+from libc.string cimport memcpy
 #from cython cimport pointer
 
 #Standard lib import
@@ -108,6 +110,45 @@ def atomic_mass(nuc):
     return mass
 
 
+def _nuc_id_array(nucs, to_id=True):
+    """Converts nuclides into a C-contiguous int32 array with the shape of
+    nucs. Strings are always converted into id form, integers only if to_id
+    is true.
+
+    The *_many functions which take these arrays look the nuclides up in
+    dense tables, one per dose factor source and one of the decay level
+    data, which are built on first use and then shared by every call.
+    """
+    nucs = np.asarray(nucs)
+    if to_id or nucs.dtype.kind not in 'iu':
+        nucs = pyne.nucname.convert_array('id', nucs)
+    return np.asarray(nucs, dtype=np.int32, order='C')
+
+
+def atomic_mass_many(nucs):
+    """Finds the atomic masses of many nuclides in [amu] in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+
+    Returns
+    -------
+    masses : ndarray of floats
+        Atomic mass of each nuclide [amu], with the shape of nucs.
+
+    Notes
+    -----
+    Each distinct nuclide is looked up only once. If a nuclide is not found,
+    its A-number is returned as a float.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs, False)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.atomic_mass(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                         <double *> np.PyArray_DATA(out))
+    return out
+
 
 #
 # natural_abund functions
@@ -187,6 +228,31 @@ def q_val(nuc):
     return q_val
 
 
+def q_val_many(nucs):
+    """Finds the Q values of many nuclides in [MeV/fission] in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+
+    Returns
+    -------
+    q_vals : ndarray of floats
+        Q value of each nuclide [MeV/fission], with the shape of nucs.
+
+    Notes
+    -----
+    Each distinct nuclide is looked up only once. If a nuclide is not found,
+    0 is returned.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs, False)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.q_val(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                   <double *> np.PyArray_DATA(out))
+    return out
+
+
 #
 # gamma_frac functions
 #
@@ -525,7 +591,7 @@ def dose_fluid_frac(nuc, source=0):
     else:
         raise pyne.nucname.NucTypeError(nuc)
 
-    if dose_fluid_frac < 0:
+    if fluid_frac < 0:
         return float('nan')
 
     return fluid_frac
@@ -622,6 +688,207 @@ def dose_lung_model(nuc, source=0):
     return lung_mod
 
 
+#
+# dose factor array functions
+#
+def _dose_source(source):
+    """Returns the int for a dose factor source given as an int or a key."""
+    srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
+    if isinstance(source, basestring):
+        return srcmap[source]
+    elif isinstance(source, int) and 0 <= source <= 2:
+        return source
+    raise ValueError('source must be one of {0}'.format(srcmap))
+
+
+def ext_air_dose_many(nucs, source=0):
+    """Finds the external air dose factors of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    ext_air_dose : ndarray of floats
+        Dose factor from external air exposure [mrem/hr per Ci/m^3] of each
+        nuclide, with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.ext_air_dose(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                          <int> _dose_source(source),
+                          <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
+def dose_ratio_many(nucs, source=0):
+    """Finds the ratios of external air dose factor to inhalation dose factor
+    of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    ratio : ndarray of floats
+        Ratio of external air dose factor to inhalation dose factor of each
+        nuclide, with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.dose_ratio(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                        <int> _dose_source(source),
+                        <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
+def ext_soil_dose_many(nucs, source=0):
+    """Finds the external soil dose factors of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    ext_soil_dose : ndarray of floats
+        Dose factor from 15 cm of external soil exposure [mrem/hr per Ci/m^2]
+        of each nuclide, with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.ext_soil_dose(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                           <int> _dose_source(source),
+                           <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
+def ingest_dose_many(nucs, source=0):
+    """Finds the ingestion dose factors of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    ingest_dose : ndarray of floats
+        Dose factor from exposure due to ingestion [mrem/pCi] of each nuclide,
+        with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.ingest_dose(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                         <int> _dose_source(source),
+                         <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
+def dose_fluid_frac_many(nucs, source=0):
+    """Finds the fractions of activity absorbed in body fluids of many nuclides
+    in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    fluid_frac : ndarray of floats
+        Fraction of activity absorbed in body fluids of each nuclide, with the
+        shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.dose_fluid_frac(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                             <int> _dose_source(source),
+                             <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
+def inhale_dose_many(nucs, source=0):
+    """Finds the inhalation dose factors of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides.
+    source : int or str
+        The int or corresponding dictionary key for the source dataset.
+        Allowed values are:
+        'EPA': 0, 'DOE' : 1, 'GENII' : 2
+
+    Returns
+    -------
+    inhale_dose : ndarray of floats
+        Dose factor from exposure due to inhalation [mrem/pCi] of each nuclide,
+        with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are given NaN.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.inhale_dose(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                         <int> _dose_source(source),
+                         <double *> np.PyArray_DATA(out))
+    out[out < 0] = np.nan
+    return out
+
+
 #
 # scattering length functions
 #
@@ -1050,6 +1317,134 @@ def decay_children(nuc, use_metastable=True):
 
     return dc
 
+
+def half_life_many(nucs, use_metastable=True):
+    """Finds the half-lives of many nuclides in [seconds] in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides, if metastable is false these are state ids
+    use_metastable : bool
+        Assume state of input nuc_ids refers to metastable state. Defaults to
+        True.
+
+    Returns
+    -------
+    hls : ndarray of floats
+        Half-life of each nuclide [seconds], with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are assumed to be stable and given inf.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs, use_metastable)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.half_life(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                       <double *> np.PyArray_DATA(out), use_metastable)
+    return out
+
+
+def decay_const_many(nucs, use_metastable=True):
+    """Finds the decay constants of many nuclides in [1/seconds] in one
+    call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides, if metastable is false these are state ids
+    use_metastable : bool
+        Assume state of input nuc_ids refers to metastable state. Defaults to
+        True.
+
+    Returns
+    -------
+    dcs : ndarray of floats
+        Decay constant of each nuclide [1/seconds], with the shape of nucs.
+
+    Notes
+    -----
+    Nuclides that are not found are assumed to be stable and given zero.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs, use_metastable)
+    cdef np.ndarray out = np.empty(ids.shape, dtype=np.float64)
+    cpp_data.decay_const(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                         <double *> np.PyArray_DATA(out), use_metastable)
+    return out
+
+
+def branch_ratio_many(from_nucs, to_nucs, use_metastable=True):
+    """Finds the branch ratios of many from -> to nuclide pairs [fraction]
+    in one call.
+
+    Parameters
+    ----------
+    from_nucs : array_like of ints or strs
+        Parent nuclides, if metastable is false these are state ids
+    to_nucs : array_like of ints or strs
+        Child nuclides, if metastable is false these are state ids. This is
+        broadcast against from_nucs.
+    use_metastable : bool
+        Assume state of input nuc_ids refers to metastable state. Defaults to
+        True.
+
+    Returns
+    -------
+    brs : ndarray of floats
+        Branch ratio of each nuclide pair [fraction], with the broadcast shape
+        of from_nucs and to_nucs.
+
+    Notes
+    -----
+    Pairs that are not found are assumed to be impossible and given zero.
+    """
+    from_ids, to_ids = np.broadcast_arrays(_nuc_id_array(from_nucs),
+                                           _nuc_id_array(to_nucs))
+    cdef np.ndarray froms = np.asarray(from_ids, order='C')
+    cdef np.ndarray tos = np.asarray(to_ids, order='C')
+    cdef np.ndarray out = np.empty(froms.shape, dtype=np.float64)
+    cpp_data.branch_ratio(<int> froms.size, <int *> np.PyArray_DATA(froms),
+                          <int *> np.PyArray_DATA(tos),
+                          <double *> np.PyArray_DATA(out), use_metastable)
+    return out
+
+
+def decay_children_many(nucs, use_metastable=True):
+    """Finds the decay children of many nuclides in one call.
+
+    Parameters
+    ----------
+    nucs : array_like of ints or strs
+        Input nuclides, if metastable is false these are state ids
+    use_metastable : bool
+        Assume state of input nuc_ids refers to metastable state. Defaults to
+        True
+
+    Returns
+    -------
+    children : 1D ndarray of ints
+        Decay children of all the nuclides in id form, each nuclide's in
+        sorted order.
+    offsets : 1D ndarray of ints
+        The children of the i-th nuclide of the flattened nucs are
+        children[offsets[i]:offsets[i+1]].
+
+    Notes
+    -----
+    Nuclides that are not found or are stable have no children.
+    """
+    cdef np.ndarray ids = _nuc_id_array(nucs, use_metastable).ravel()
+    cdef np.ndarray offsets = np.empty(ids.size + 1, dtype=np.int32)
+    cdef cpp_vector[int] cpp_children
+    cpp_data.decay_children(<int> ids.size, <int *> np.PyArray_DATA(ids),
+                            <int *> np.PyArray_DATA(offsets), cpp_children,
+                            use_metastable)
+    cdef np.ndarray children = np.empty(cpp_children.size(), dtype=np.int32)
+    if 0 < cpp_children.size():
+        memcpy(np.PyArray_DATA(children), &cpp_children[0],
+               cpp_children.size() * sizeof(int))
+    return children, offsets
+
 def all_children(nuc):
     """
     returns child nuclides from both level and decay data
@@ -1319,6 +1714,32 @@ def decay_beta_branch_ratio_byparent(parent):
     ratios = cpp_data.decay_beta_branch_ratios(<int> parent)
     return ratios
 
+cdef cpp_vector[cpp_pair[double, double]] _energy_windows(en, enerror) except *:
+    """Converts sequences of energies and errors into the (energy, error)
+    windows taken by the batched energy lookups, the *_many functions below.
+    The error defaults to 1% of the energy if it is not provided.
+
+    Each window covers energy - |error| to energy + |error|, including both
+    bounds. The lookups return one row per window in the order of the
+    flattened energies, each holding the matching entries in increasing
+    order of energy. Windows which match no entries give empty rows.
+    """
+    cdef int i
+    cdef np.ndarray[np.float64_t, ndim=1] ens = np.ascontiguousarray(en,
+                                                    dtype=np.float64).ravel()
+    cdef np.ndarray[np.float64_t, ndim=1] errs
+    if enerror is None:
+        errs = ens * 0.01
+    else:
+        errs = np.ascontiguousarray(np.broadcast_to(
+            np.asarray(enerror, dtype=np.float64), (ens.shape[0],)))
+    cdef cpp_vector[cpp_pair[double, double]] windows
+    windows.reserve(ens.shape[0])
+    for i in range(ens.shape[0]):
+        windows.push_back(cpp_pair[double, double](ens[i], errs[i]))
+    return windows
+
+
 def gamma_energy(parent):
     """
     Returns a list of gamma ray energies from ENSDF decay dataset from a given
@@ -1359,6 +1780,26 @@ def gamma_energy_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.gamma_energy(<double> en, <double> enerror)
 
+def gamma_energy_byen_many(en, enerror=None):
+    """
+    Returns a list of gamma ray energies and errors from ENSDF decay dataset
+    for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of pairs
+        For each energy window, an array of gamma ray energies and errors
+    """
+    return cpp_data.gamma_energy(_energy_windows(en, enerror))
+
 
 def gamma_photon_intensity(parent):
     """
@@ -1473,6 +1914,27 @@ def gamma_from_to_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.gamma_from_to(<double> en,<double> enerror)
 
+def gamma_from_to_byen_many(en, enerror=None):
+    """
+    Returns a list of gamma ray level pairs in state_id form from ENSDF decay
+    dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of pairs
+        For each energy window, an array of gamma ray level pairs in state_id
+        form
+    """
+    return cpp_data.gamma_from_to(_energy_windows(en, enerror))
+
 def gamma_parent_child(en, enerror=None):
     """
     Returns a list of gamma ray parents from ENSDF decay dataset
@@ -1495,6 +1957,27 @@ def gamma_parent_child(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.gamma_parent_child(<double> en, <double> enerror)
 
+def gamma_parent_child_many(en, enerror=None):
+    """
+    Returns a list of gamma ray parent/child pairs in state_id form from ENSDF
+    decay dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of pairs
+        For each energy window, an array of gamma ray parent/child pairs in
+        state_id form
+    """
+    return cpp_data.gamma_parent_child(_energy_windows(en, enerror))
+
 
 def gamma_parent(en, enerror=None):
     """
@@ -1518,6 +2001,26 @@ def gamma_parent(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.gamma_parent(<double> en, <double> enerror)
 
+def gamma_parent_many(en, enerror=None):
+    """
+    Returns a list of gamma ray parents in state_id form from ENSDF decay
+    dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of gamma ray parents in state_id form
+    """
+    return cpp_data.gamma_parent(_energy_windows(en, enerror))
+
 def gamma_child_byen(en, enerror=None):
     """
     Returns a list of gamma ray children from ENSDF decay dataset
@@ -1540,6 +2043,26 @@ def gamma_child_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.gamma_child(<double> en, <double> enerror)
 
+def gamma_child_byen_many(en, enerror=None):
+    """
+    Returns a list of gamma ray children in state_id form from ENSDF decay
+    dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of gamma ray children in state_id form
+    """
+    return cpp_data.gamma_child(_energy_windows(en, enerror))
+
 def gamma_child_byparent(parent):
     """
     Returns a list of gamma ray children from ENSDF decay dataset
@@ -1634,6 +2157,26 @@ def alpha_parent(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.alpha_parent(<double> en, <double> enerror)
 
+def alpha_parent_many(en, enerror=None):
+    """
+    Returns a list of alpha parents in state_id form from ENSDF decay dataset
+    for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of alpha parents in state_id form
+    """
+    return cpp_data.alpha_parent(_energy_windows(en, enerror))
+
 def alpha_child_byen(en, enerror=None):
     """
     Returns a list of alpha children from ENSDF decay dataset
@@ -1656,6 +2199,26 @@ def alpha_child_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.alpha_child(<double> en, <double> enerror)
 
+def alpha_child_byen_many(en, enerror=None):
+    """
+    Returns a list of alpha children in state_id form from ENSDF decay dataset
+    for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of alpha children in state_id form
+    """
+    return cpp_data.alpha_child(_energy_windows(en, enerror))
+
 def alpha_child_byparent(parent):
     """
     Returns a list of alpha children from ENSDF decay dataset
@@ -1746,6 +2309,26 @@ def beta_parent(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.beta_parent(<double> en, <double> enerror)
 
+def beta_parent_many(en, enerror=None):
+    """
+    Returns a list of beta minus parents in nuc_id form from ENSDF decay
+    dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of beta minus parents in nuc_id form
+    """
+    return cpp_data.beta_parent(_energy_windows(en, enerror))
+
 def beta_child_byen(en, enerror=None):
     """
     Returns a list of beta minus children from ENSDF decay dataset
@@ -1768,6 +2351,26 @@ def beta_child_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.beta_child(<double> en, <double> enerror)
 
+def beta_child_byen_many(en, enerror=None):
+    """
+    Returns a list of beta minus children in nuc_id form from ENSDF decay
+    dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of beta minus children in nuc_id form
+    """
+    return cpp_data.beta_child(_energy_windows(en, enerror))
+
 def beta_child_byparent(parent):
     """
     Returns a list of beta minus children from ENSDF decay dataset
@@ -1875,6 +2478,27 @@ def ecbp_parent(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.ecbp_parent(<double> en, <double> enerror)
 
+def ecbp_parent_many(en, enerror=None):
+    """
+    Returns a list of electron capture/beta plus parents in nuc_id form from
+    ENSDF decay dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of electron capture/beta plus parents
+        in nuc_id form
+    """
+    return cpp_data.ecbp_parent(_energy_windows(en, enerror))
+
 def ecbp_child_byen(en, enerror=None):
     """
     Returns a list of beta plus/electron capture parents from ENSDF decay
@@ -1897,6 +2521,27 @@ def ecbp_child_byen(en, enerror=None):
         enerror = en * 0.01
     return cpp_data.ecbp_child(<double> en, <double> enerror)
 
+def ecbp_child_byen_many(en, enerror=None):
+    """
+    Returns a list of electron capture/beta plus children in nuc_id form from
+    ENSDF decay dataset for each of many energy windows.
+
+    Parameters
+    ----------
+    en : array of doubles
+        energies in keV
+    enerror : double or array of doubles
+        energy errors (range which you want to search) this defaults
+        to 1% of the energy if it is not provided
+
+    Returns
+    -------
+    ratios : list of arrays of ints
+        For each energy window, an array of electron capture/beta plus children
+        in nuc_id form
+    """
+    return cpp_data.ecbp_child(_energy_windows(en, enerror))
+
 def ecbp_child_byparent(parent):
     """
     Returns a list of beta plus children from ENSDF decay dataset
@@ -15,6 +15,7 @@ from __future__ import print_function, division, unicode_literals
 
 import re
 import os
+import json
 from collections import OrderedDict, Iterable
 from warnings import warn
 from pyne.utils import QAWarning
@@ -22,9 +23,9 @@ from pyne.utils import QAWarning
 cimport numpy as np
 import numpy as np
 from numpy.polynomial.polynomial import Polynomial
-from numpy.polynomial.legendre import Legendre
-from scipy.interpolate import interp1d
+from numpy.polynomial.legendre import Legendre, leggauss
 cimport cython
+from libc.math cimport log, exp, sqrt
 
 from pyne cimport cpp_nucname
 from pyne import nucname
@@ -56,22 +57,135 @@ def _radiation_type(value):
         return (p[int(value)], p[int(10*value % 10)])
 
 
+def section_index(filename, cache=True):
+    """section_index(filename, cache=True)
+
+    Finds the byte offsets of every section of an ENDF tape in a single pass,
+    so that sections can be read by seeking directly to them.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the ENDF tape.
+    cache : bool or str, optional
+        Whether to keep the index in a sidecar file, filename + '.idx' or the
+        given path.  The cached index is reused as long as the size and
+        modification time of the tape are unchanged.
+
+    Returns
+    -------
+    sections : list of tuples
+        (MAT, MF, MT, start, stop) for each section in tape order, where start
+        is the offset of its first line and stop that of its SEND record.
+        Each material is preceded by a (MAT, 0, 0, start, stop) entry
+        spanning the whole material through its MEND record.
+    """
+    if cache is True:
+        cache = filename + '.idx'
+    st = os.stat(filename)
+    if cache:
+        try:
+            with open(cache, 'r') as f:
+                idx = json.load(f)
+            if idx['size'] == st.st_size and idx['mtime'] == st.st_mtime:
+                return [tuple(sec) for sec in idx['sections']]
+        except (IOError, OSError, ValueError, KeyError):
+            pass
+
+    buf = np.fromfile(filename, dtype=np.uint8)
+    ends = np.flatnonzero(buf == 10) + 1
+    if len(ends) == 0 or ends[-1] != len(buf):
+        ends = np.append(ends, len(buf))
+    starts = np.append(0, ends[:-1])
+    # Control fields are in columns 67-75 of lines long enough to have them
+    ctrl = np.full((len(starts), 9), 32, dtype=np.uint8)
+    full = (ends - starts) > 75
+    ctrl[full] = buf[starts[full, None] + np.arange(66, 75)]
+    digits = ctrl.astype(int) - 48
+    digits[(digits < 0) | (digits > 9)] = 0
+    mat = digits[:, :4].dot([1000, 100, 10, 1])
+    mat[(ctrl[:, :4] == 45).any(axis=1)] *= -1
+    mf = digits[:, 4:6].dot([10, 1])
+    mt = digits[:, 6:].dot([100, 10, 1])
+
+    # runs of lines belonging to the same section
+    key = np.where((mat > 0) & (mf > 0) & (mt > 0), (mat*100 + mf)*1000 + mt, -1)
+    runs = np.flatnonzero(np.append(True, key[1:] != key[:-1]))
+    run_ends = np.append(runs[1:], len(key))
+    offsets = np.append(starts, len(buf))
+    # materials end with a MEND record or the TEND record
+    bounds = np.append(np.flatnonzero(mat <= 0), len(mat))
+    sections = []
+    material = None
+    for i, j in zip(runs, run_ends):
+        if key[i] < 0:
+            continue
+        if material is None or starts[i] >= material[4]:
+            k = bounds[np.searchsorted(bounds, i)]
+            if k < len(mat) and mat[k] == 0:
+                k += 1
+            material = (int(mat[i]), 0, 0, int(starts[i]), int(offsets[k]))
+            sections.append(material)
+        sections.append((int(mat[i]), int(mf[i]), int(mt[i]), int(starts[i]),
+                         int(offsets[j])))
+
+    if cache:
+        idx = {'size': st.st_size, 'mtime': st.st_mtime, 'sections': sections}
+        try:
+            with open(cache, 'w') as f:
+                json.dump(idx, f)
+        except (IOError, OSError):
+            warn("could not write ENDF index " + cache, RuntimeWarning)
+    return sections
+
+
+def _materials(sections):
+    """Groups a section index by material, returning (MAT, start, stop,
+    {(MF, MT): (start, stop)}) tuples in tape order.
+    """
+    materials = []
+    for mat, mf, mt, start, stop in sections:
+        if mf == 0:
+            materials.append((mat, start, stop, {}))
+        else:
+            materials[-1][3][mf, mt] = (start, stop)
+    return materials
+
+
+def _index_filename(fh):
+    """Returns the path of an ENDF tape given as a path or file handle,
+    raising a ValueError if it is not a file which may be indexed.
+    """
+    filename = fh if isinstance(fh, basestring) else getattr(fh, 'name', None)
+    if not isinstance(filename, basestring) or not os.path.isfile(filename):
+        raise ValueError("only ENDF tapes read from files may be indexed")
+    return filename
+
+
 class Library(rxdata.RxLib):
-    """A class for a file which contains multiple ENDF evaluations."""
-    def __init__(self, fh):
+    """A class for a file which contains multiple ENDF evaluations.
+
+    Parameters
+    ----------
+    fh : str or file handle
+        The ENDF tape.
+    index : bool or str, optional
+        Locate sections with section_index() rather than from the MF=1, MT=451
+        directory of each material, caching the index in a sidecar file
+        (True) or at the given path.
+    """
+    def __init__(self, fh, index=False):
         self.mts = {}
         self.structure = {}
         self.mat_dict = {}
         self.more_files = True
-        self.intdict = {1: self._histogram, 2: self._linlin, 3: self._linlog, 4:
-                        self._loglin, 5: self._loglog, 6:
-                        self._chargedparticles, 11: self._histogram,
-                        12: self._linlin, 13: self._linlog, 14: self._loglin,
-                        15: self._loglog, 21: self._histogram, 22: self._linlin,
-                        23: self._linlog, 24: self._loglin, 25: self._loglog}
         self.chars_til_now = 0
         self.offset = 0
         self.fh = fh
+        self._materials = None
+        if index:
+            filename = _index_filename(fh)
+            self._materials = _materials(section_index(filename, cache=index))
         self._set_line_length()
         # read first line (Tape ID)
         self._read_tpid()
@@ -202,7 +316,13 @@ class Library(rxdata.RxLib):
         # Find where the end of the material is and then jump to it.
         # The end is 3 lines after the last mf,mt
         # combination (SEND, FEND, MEND)
-        self.chars_til_now = (stop + 3)*self.line_length - self.offset
+        if self._materials:
+            # use the byte offsets found by indexing the tape instead
+            mat, mat_start, mat_stop, mfs = self._materials.pop(0)
+            self.mat_dict[nuc]['mfs'].update(mfs)
+            self.chars_til_now = mat_stop
+        else:
+            self.chars_til_now = (stop + 3)*self.line_length - self.offset
         fh.seek(self.chars_til_now)
         nextline = fh.readline()
         self.more_files = (nextline != '' and nextline[68:70] != '-1')
@@ -370,146 +490,6 @@ class Library(rxdata.RxLib):
         total_lines = 1 + meta_len + data_len
         return head, intdata, total_lines
 
-    def _histogram(self, e_int, xs, low, high):
-        if low in e_int:
-            # truncate at lower bound
-            xs = xs[e_int >= low]
-            e_int = e_int[e_int >= low]
-        elif low is not None and low > e_int[0]:
-            # truncate at lower bound and prepend interpolated endpoint
-            low_xs = xs[e_int < low][-1]
-            xs = np.insert(xs[e_int > low], 0, low_xs)
-            e_int = np.insert(e_int[e_int > low], 0, low)
-        if high in e_int:
-            # truncate at higher bound
-            xs = xs[e_int <= high]
-            e_int = e_int[e_int <= high]
-        elif high is not None:
-            # truncate at higher bound and prepend interpolated endpoint
-            high_xs = xs[e_int < high][-1]
-            xs = np.append(xs[e_int < high], high_xs)
-            e_int = np.append(e_int[e_int < high], high)
-        de_int = float(e_int[-1]-e_int[0])
-        return np.nansum((e_int[1:]-e_int[:-1]) * xs[:-1]/de_int)
-
-    def _linlin(self, e_int, xs, low, high):
-        if low is not None or high is not None:
-            interp = interp1d(e_int, xs)
-            if low in e_int:
-                xs = xs[e_int >= low]
-                e_int = e_int[e_int >= low]
-            elif low is not None and low > e_int[0]:
-                low_xs = interp(low)
-                xs = np.insert(xs[e_int > low], 0, low_xs)
-                e_int = np.insert(e_int[e_int > low], 0, low)
-            if high in e_int:
-                xs = xs[e_int <= high]
-                e_int = e_int[e_int <= high]
-            elif high is not None:
-                high_xs = interp(high)
-                xs = np.append(xs[e_int < high], high_xs)
-                e_int = np.append(e_int[e_int < high], high)
-        de_int = float(e_int[-1]-e_int[0])
-        return np.nansum((e_int[1:]-e_int[:-1]) * (xs[1:]+xs[:-1])/2./de_int)
-
-    def _linlog(self, e_int, xs, low, high):
-        if low is not None or high is not None:
-            interp = interp1d(np.log(e_int), xs)
-            if low in e_int:
-                xs = xs[e_int >= low]
-                e_int = e_int[e_int >= low]
-            elif low is not None and low > e_int[0]:
-                low_xs = interp(np.log(low))
-                xs = np.insert(xs[e_int > low], 0, low_xs)
-                e_int = np.insert(e_int[e_int > low], 0, low)
-            if high in e_int:
-                xs = xs[e_int <= high]
-                e_int = e_int[e_int <= high]
-            elif high is not None:
-                high_xs = interp(np.log(high))
-                xs = np.append(xs[e_int < high], high_xs)
-                e_int = np.append(e_int[e_int < high], high)
-
-        de_int = float(e_int[-1]-e_int[0])
-        x1 = e_int[:-1]
-        x2 = e_int[1:]
-        y1 = xs[:-1]
-        y2 = xs[1:]
-        A = (y1-y2)/(np.log(x1/x2))
-        B = y1-A*np.log(x1)
-        return np.nansum(A*(x2*np.log(x2) -
-                            x1*np.log(x1)-x2+x1) + B*(x2-x1))/de_int
-
-    def _loglin(self, e_int, xs, low, high):
-        if low is not None or high is not None:
-            interp = interp1d(e_int, np.log(xs))
-            if low in e_int:
-                xs = xs[e_int >= low]
-                e_int = e_int[e_int >= low]
-            elif low is not None and low > e_int[0]:
-                low_xs = np.e ** interp(low)
-                xs = np.insert(xs[e_int > low], 0, low_xs)
-                e_int = np.insert(e_int[e_int > low], 0, low)
-            if high in e_int:
-                xs = xs[e_int <= high]
-                e_int = e_int[e_int <= high]
-            elif high is not None:
-                high_xs = np.e ** interp(high)
-                xs = np.append(xs[e_int < high], high_xs)
-                e_int = np.append(e_int[e_int < high], high)
-
-        de_int = float(e_int[-1]-e_int[0])
-        x1 = e_int[:-1]
-        x2 = e_int[1:]
-        y1 = xs[:-1]
-        y2 = xs[1:]
-        A = (np.log(y1)-np.log(y2))/(x1-x2)
-        B = np.log(y1) - A*x1
-        return np.nansum((y2-y1)/A)/de_int
-
-    def _loglog(self, e_int, xs, low, high):
-        if low is not None or high is not None:
-            interp = interp1d(np.log(e_int), np.log(xs))
-            if low in e_int:
-                xs = xs[e_int >= low]
-                e_int = e_int[e_int >= low]
-            elif low is not None and low > e_int[0]:
-                low_xs = np.e ** interp(np.log(low))
-                xs = np.insert(xs[e_int > low], 0, low_xs)
-                e_int = np.insert(e_int[e_int > low], 0, low)
-            if high in e_int:
-                xs = xs[e_int <= high]
-                e_int = e_int[e_int <= high]
-            elif high is not None:
-                high_xs = np.e ** interp(np.log(high))
-                xs = np.append(xs[e_int < high], high_xs)
-                e_int = np.append(e_int[e_int < high], high)
-
-        de_int = float(e_int[-1]-e_int[0])
-        x1 = e_int[:-1]
-        x2 = e_int[1:]
-        y1 = xs[:-1]
-        y2 = xs[1:]
-        A = - np.log(y2/y1)/np.log(x1/x2)
-        B = - (np.log(y1)*np.log(x2) - np.log(y2)*np.log(x1))/np.log(x1/x2)
-        return np.nansum(np.e**B / (A+1) * (x2**(A+1) - x1**(A+1))/de_int)
-
-    def _chargedparticles(self, e_int, xs, flags=None):
-        q = flags['Q']
-        if q > 0:
-            T = 0
-        else:
-            T = q
-        de_int = float(e_int[-1]-e_int[0])
-        x1 = e_int[:-1]
-        x2 = e_int[1:]
-        y1 = xs[:-1]
-        y2 = xs[1:]
-        B = np.log(y2*x2/(x1*y1)) / (1/(x1-T)**0.5 - 1/(x2-T)**0.5)
-        A = np.e**(B/(x1-T)**0.5)*y1*x1
-        # FIXME
-        raise NotImplementedError('see docs for more details.')
-
     def integrate_tab_range(self, intscheme, e_int, xs, low=None, high=None):
         """integrate_tab_range(intscheme, e_int, xs, low=None, high=None)
         Integrates across one tabulation range.
@@ -530,10 +510,11 @@ class Library(rxdata.RxLib):
         sigma_g : float
             The group xs.
         """
-        with np.errstate(divide='ignore', invalid='ignore'):
-            # each of these functions returns a normalized integration
-            # over the range
-            return self.intdict[intscheme](e_int, xs, low, high)
+        e_int = np.asarray(e_int, dtype=float)
+        low = e_int[0] if low is None else max(low, e_int[0])
+        high = e_int[-1] if high is None else min(high, e_int[-1])
+        sigma = integrate(e_int, xs, [e_int[-1]], [intscheme], [low, high])[0]
+        return sigma/(high - low)
 
     def _cont_and_update(self, flags, keys, data, total_lines):
         flags.update(self._get_cont(keys, data[total_lines]))
@@ -1077,6 +1058,35 @@ class Library(rxdata.RxLib):
         return fromendf_tok(s)
 
 
+def read_fields(fh, n):
+    """read_fields(fh, n)
+
+    Reads n consecutive 11-character fields of an ENDF record, six to a line,
+    converting them all at once with fromendf_tok.
+
+    Parameters
+    ----------
+    fh : file
+        File positioned at the first line holding the fields.
+    n : int
+        Number of fields to read.
+
+    Returns
+    -------
+    data : ndarray, 1d, float64
+        The n values.
+    """
+    cdef int i, n_lines
+    n_lines = (n + 5)//6
+    lines = [fh.readline() for i in range(n_lines)]
+    s = ''.join(lines)
+    if len(s) != 81*n_lines:
+        # pad or truncate lines to the 80 columns fromendf_tok expects
+        s = ''.join([line.rstrip('\r\n').ljust(80)[:80] + '\n'
+                     for line in lines])
+    return fromendf_tok(s)[:n]
+
+
 def at_end_of_tape(f):
     """Indicate whether file is positioned at the end of an ENDF tape.
 
@@ -1229,7 +1239,21 @@ class Evaluation(object):
 
     """
 
-    def __init__(self, filename_or_handle, verbose=True):
+    def __init__(self, filename_or_handle, verbose=True, index=False):
+        """Parameters
+        ----------
+        filename_or_handle : str or file handle
+            The ENDF file, positioned at the start of the evaluation.
+        verbose : bool, optional
+            Whether to print each section as it is read.
+        index : bool or str, optional
+            Locate sections with section_index(), caching the index in a
+            sidecar file (True) or at the given path, so that reading
+            specific reactions seeks directly to them.  This requires the
+            evaluation to be read from a file.
+        """
+        if index:
+            filename = _index_filename(filename_or_handle)
         if hasattr(filename_or_handle, 'read'):
             self._fh = filename_or_handle
         else:
@@ -1262,6 +1286,19 @@ class Evaluation(object):
         # Save starting position for this evaluation
         self._fh.seek(position)
 
+        # Byte offsets of the sections of this evaluation
+        self._sections = None
+        if index:
+            for mat, start, stop, sections in _materials(section_index(
+                    filename, cache=index)):
+                if start == position:
+                    self._sections = sections
+                    break
+            else:
+                warn("no material in the index of {0} starts at byte {1}, "
+                     "sections will be read sequentially".format(
+                     filename, position), RuntimeWarning)
+
         # First we need to read MT=1, MT=451 which has a description of the ENDF
         # file and a list of what data exists in the file
         self._read_header()
@@ -1285,12 +1322,21 @@ class Evaluation(object):
 
         """
 
-        # Make sure file is positioned correctly
-        self._fh.seek(self._start_position)
-
         if isinstance(reactions, tuple):
             reactions = [reactions]
 
+        if reactions and self._sections is not None:
+            # Seek directly to each requested section in the order of the file
+            reactions = [rx for rx in reactions if rx in self._sections and
+                         rx[0] not in skip_mf and rx[1] not in skip_mt]
+            for MF, MT in sorted(reactions, key=self._sections.get):
+                self._fh.seek(self._sections[MF, MT][0])
+                self._read_section(MF, MT)
+            return
+
+        # Make sure file is positioned correctly
+        self._fh.seek(self._start_position)
+
         while True:
             # Find next section
             while True:
@@ -1320,107 +1366,110 @@ class Evaluation(object):
                 seek_section_end(self._fh)
                 continue
 
+            self._read_section(MF, MT)
+
+    def _read_section(self, MF, MT):
+        """Reads the section of the file positioned at its first line."""
+        # File 1 data
+        if MF == 1:
+            if MT == 452:
+                # Number of total neutrons per fission
+                self._read_total_nu()
+            elif MT == 455:
+                # Number of delayed neutrons per fission
+                self._read_delayed_nu()
+            elif MT == 456:
+                # Number of prompt neutrons per fission
+                self._read_prompt_nu()
+            elif MT == 458:
+                # Components of energy release due to fission
+                self._read_fission_energy()
+            elif MT == 460:
+                self._read_delayed_photon()
+
+        elif MF == 2:
+            # Resonance parameters
+            if MT == 151:
+                self._read_resonances()
+            else:
+                seek_section_end(self._fh)
 
-            # File 1 data
-            if MF == 1:
-                if MT == 452:
-                    # Number of total neutrons per fission
-                    self._read_total_nu()
-                elif MT == 455:
-                    # Number of delayed neutrons per fission
-                    self._read_delayed_nu()
-                elif MT == 456:
-                    # Number of prompt neutrons per fission
-                    self._read_prompt_nu()
-                elif MT == 458:
-                    # Components of energy release due to fission
-                    self._read_fission_energy()
-                elif MT == 460:
-                    self._read_delayed_photon()
-
-            elif MF == 2:
-                # Resonance parameters
-                if MT == 151:
-                    self._read_resonances()
-                else:
-                    seek_section_end(self._fh)
-
-            elif MF == 3:
-                # Reaction cross sections
-                self._read_reaction_xs(MT)
-
-            elif MF == 4:
-                # Angular distributions
-                self._read_angular_distribution(MT)
-
-            elif MF == 5:
-                # Energy distributions
-                self._read_energy_distribution(MT)
-
-            elif MF == 6:
-                # Product energy-angle distributions
-                self._read_product_energy_angle(MT)
-
-            elif MF == 7:
-                # Thermal scattering data
-                if MT == 2:
-                    self._read_thermal_elastic()
-                if MT == 4:
-                    self._read_thermal_inelastic()
-
-            elif MF == 8:
-                # decay and fission yield data
-                if MT == 454:
-                    self._read_independent_yield()
-                elif MT == 459:
-                    self._read_cumulative_yield()
-                elif MT == 457:
-                    self._read_decay()
-                else:
-                    self._read_radioactive_nuclide(MT)
+        elif MF == 3:
+            # Reaction cross sections
+            self._read_reaction_xs(MT)
+
+        elif MF == 4:
+            # Angular distributions
+            self._read_angular_distribution(MT)
+
+        elif MF == 5:
+            # Energy distributions
+            self._read_energy_distribution(MT)
+
+        elif MF == 6:
+            # Product energy-angle distributions
+            self._read_product_energy_angle(MT)
+
+        elif MF == 7:
+            # Thermal scattering data
+            if MT == 2:
+                self._read_thermal_elastic()
+            if MT == 4:
+                self._read_thermal_inelastic()
+
+        elif MF == 8:
+            # decay and fission yield data
+            if MT == 454:
+                self._read_independent_yield()
+            elif MT == 459:
+                self._read_cumulative_yield()
+            elif MT == 457:
+                self._read_decay()
+            else:
+                self._read_radioactive_nuclide(MT)
 
-            elif MF == 9:
-                # multiplicities
-                self._read_multiplicity(MT)
+        elif MF == 9:
+            # multiplicities
+            self._read_multiplicity(MT)
 
-            elif MF == 10:
-                # cross sections for production of radioactive nuclides
-                self._read_production_xs(MT)
+        elif MF == 10:
+            # cross sections for production of radioactive nuclides
+            self._read_production_xs(MT)
 
-            elif MF == 12:
-                # Photon production yield data
-                self._read_photon_production_yield(MT)
+        elif MF == 12:
+            # Photon production yield data
+            self._read_photon_production_yield(MT)
 
-            elif MF == 13:
-                # Photon production cross sections
-                self._read_photon_production_xs(MT)
+        elif MF == 13:
+            # Photon production cross sections
+            self._read_photon_production_xs(MT)
 
-            elif MF == 14:
-                # Photon angular distributions
-                self._read_photon_angular_distribution(MT)
+        elif MF == 14:
+            # Photon angular distributions
+            self._read_photon_angular_distribution(MT)
 
-            elif MF == 15:
-                # Photon continuum energy distributions
-                self._read_photon_energy_distribution(MT)
+        elif MF == 15:
+            # Photon continuum energy distributions
+            self._read_photon_energy_distribution(MT)
 
-            elif MF == 23:
-                # photon interaction data
-                self._read_photon_interaction(MT)
+        elif MF == 23:
+            # photon interaction data
+            self._read_photon_interaction(MT)
 
-            elif MF == 26:
-                # secondary distributions for photon interactions
-                self._read_electron_products(MT)
+        elif MF == 26:
+            # secondary distributions for photon interactions
+            self._read_electron_products(MT)
 
-            elif MF == 27:
-                # atomic form factors or scattering functions
-                self._read_scattering_functions(MT)
+        elif MF == 27:
+            # atomic form factors or scattering functions
+            self._read_scattering_functions(MT)
 
-            elif MF == 28:
-                # atomic relaxation data
-                self._read_atomic_relaxation()
+        elif MF == 28:
+            # atomic relaxation data
+            self._read_atomic_relaxation()
 
-            else:
-                seek_file_end(self._fh)
+        else:
+            seek_file_end(self._fh)
 
     def _read_header(self):
         self._print_info(1, 451)
@@ -2624,16 +2673,7 @@ class Evaluation(object):
         NPL = items[4]
 
         # read items
-        itemsList = []
-        m = 0
-        for i in range((NPL-1)//6 + 1):
-            line = self._fh.readline()
-            toRead = min(6, NPL-m)
-            for j in range(toRead):
-                val = endftod(line[0:11])
-                itemsList.append(val)
-                line = line[11:]
-            m = m + toRead
+        itemsList = read_fields(self._fh, NPL).tolist()
         if onlyList:
             return itemsList
         else:
@@ -2666,6 +2706,212 @@ class Evaluation(object):
         return '<Evaluation: {0}, {1}>'.format(name, library)
 
 
+# Gauss-Legendre quadrature for the charged-particle law, which has no
+# closed form integral
+cdef double _GL_POINTS[8]
+cdef double _GL_WEIGHTS[8]
+_points, _weights = leggauss(8)
+for _i in range(8):
+    _GL_POINTS[_i] = _points[_i]
+    _GL_WEIGHTS[_i] = _weights[_i]
+del _points, _weights, _i
+
+
+@cython.cdivision(True)
+cdef double _interp_law(int law, double x0, double x1, double y0, double y1,
+                        double x, double t):
+    """Interpolates between (x0, y0) and (x1, y1) with an ENDF law. The laws
+    that are logarithmic in y are zero between the points if either is zero.
+    """
+    cdef double b
+    if law == 1 or x1 == x0:
+        return y0
+    elif 4 <= law and (y0 == 0.0 or y1 == 0.0):
+        return y0 if x == x0 else (y1 if x == x1 else 0.0)
+    elif law == 2:
+        return y0 + (x - x0)/(x1 - x0)*(y1 - y0)
+    elif law == 3:
+        return y0 + log(x/x0)/log(x1/x0)*(y1 - y0)
+    elif law == 4:
+        return y0*exp((x - x0)/(x1 - x0)*log(y1/y0))
+    elif law == 5:
+        return y0*exp(log(x/x0)/log(x1/x0)*log(y1/y0))
+    # charged-particle law, y = A/x exp(-B/sqrt(x - T))
+    b = log(y1*x1/(y0*x0))/(1.0/sqrt(x0 - t) - 1.0/sqrt(x1 - t))
+    return y0*x0/x*exp(b/sqrt(x0 - t) - b/sqrt(x - t))
+
+
+@cython.cdivision(True)
+cdef double _integrate_law(int law, double x0, double x1, double y0,
+                           double y1, double a, double b, double t):
+    """Integrates the interpolant between (x0, y0) and (x1, y1) with an ENDF
+    law from a to b, where x0 <= a < b <= x1.
+    """
+    cdef int i
+    cdef double ya, yb, r, m, total
+    # pieces with a zero endpoint under a law logarithmic in y, e.g. a zero
+    # cross section at a threshold, contribute nothing
+    if 4 <= law and (y0 == 0.0 or y1 == 0.0):
+        return 0.0
+    ya = _interp_law(law, x0, x1, y0, y1, a, t)
+    yb = _interp_law(law, x0, x1, y0, y1, b, t)
+    if law == 1:
+        total = y0*(b - a)
+    elif law == 2:
+        total = 0.5*(ya + yb)*(b - a)
+    elif law == 3:
+        r = log(b/a)
+        total = ya*(b - a) + (yb - ya)/r*(b*r - b + a)
+    elif law == 4:
+        if ya == yb:
+            total = ya*(b - a)
+        else:
+            total = (yb - ya)*(b - a)/log(yb/ya)
+    elif law == 5:
+        r = log(b/a)
+        m = log(yb/ya)/r
+        if m == -1.0:
+            total = ya*a*r
+        else:
+            total = ya*a/(m + 1.0)*(exp((m + 1.0)*r) - 1.0)
+    else:
+        total = 0.0
+        for i in range(8):
+            total += _GL_WEIGHTS[i]*_interp_law(law, x0, x1, y0, y1,
+                0.5*(a + b) + 0.5*(b - a)*_GL_POINTS[i], t)
+        total *= 0.5*(b - a)
+    # Other undefined pieces, e.g. logarithms of negative values, are dropped
+    return 0.0 if total != total else total
+
+
+cdef int _bisect_right(np.ndarray[np.float64_t, ndim=1] a, double v):
+    cdef int lo = 0
+    cdef int hi = a.shape[0]
+    cdef int mid
+    while lo < hi:
+        mid = (lo + hi)//2
+        if v < a[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _kernel_args(x, y, bounds, laws):
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    bounds = np.ascontiguousarray(bounds, dtype=np.float64)
+    laws = np.asarray(laws, dtype=np.int32)
+    # two-dimensional interpolation codes 11-15 and 21-25
+    laws = np.ascontiguousarray(np.where(laws > 10, laws % 10, laws))
+    return x, y, bounds, laws
+
+
+@cython.boundscheck(False)
+def interpolate(x, y, bounds, laws, xnew, double t=0.0):
+    """interpolate(x, y, bounds, laws, xnew, t=0.0)
+
+    Evaluates tabulated data at many points with the ENDF interpolation laws
+    of its regions.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Tabulated points, with x ascending.
+    bounds : array-like
+        Upper x bound of each interpolation region, e.g. x[NBT - 1].
+    laws : array-like of int
+        ENDF interpolation law of each region, 1-5 or the charged-particle
+        law 6.
+    xnew : array-like
+        Points at which to evaluate the data.  Points outside of the tabulated
+        range evaluate to zero.
+    t : float, optional
+        Threshold T of the charged-particle law.
+
+    Returns
+    -------
+    ynew : ndarray
+        The interpolated values.
+    """
+    cdef int i, j, k, n, nr
+    cdef double v
+    cdef np.ndarray[np.float64_t, ndim=1] cx, cy, cbounds, cxnew, ynew
+    cdef np.ndarray[np.int32_t, ndim=1] claws
+    cx, cy, cbounds, claws = _kernel_args(x, y, bounds, laws)
+    cxnew = np.ascontiguousarray(xnew, dtype=np.float64)
+    n = cx.shape[0]
+    nr = cbounds.shape[0]
+    ynew = np.zeros(cxnew.shape[0], dtype=np.float64)
+    for j in range(cxnew.shape[0]):
+        v = cxnew[j]
+        if v < cx[0] or v > cx[n - 1]:
+            continue
+        if v == cx[n - 1]:
+            ynew[j] = cy[n - 1]
+            continue
+        i = _bisect_right(cx, v) - 1
+        k = min(_bisect_right(cbounds, v), nr - 1)
+        ynew[j] = _interp_law(claws[k], cx[i], cx[i + 1], cy[i], cy[i + 1],
+                              v, t)
+    return ynew
+
+
+@cython.boundscheck(False)
+def integrate(x, y, bounds, laws, edges, double t=0.0):
+    """integrate(x, y, bounds, laws, edges, t=0.0)
+
+    Integrates tabulated data over each of many bins in a single pass, with
+    the ENDF interpolation laws of its regions.  Bins are split wherever they
+    cross a tabulated point or region bound and the interpolant is
+    integrated exactly on each piece.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Tabulated points, with x ascending.
+    bounds : array-like
+        Upper x bound of each interpolation region, e.g. x[NBT - 1].
+    laws : array-like of int
+        ENDF interpolation law of each region, 1-5 or the charged-particle
+        law 6.
+    edges : array-like
+        Ascending bin edges.  Parts of bins outside of the tabulated range
+        contribute nothing.
+    t : float, optional
+        Threshold T of the charged-particle law.
+
+    Returns
+    -------
+    integrals : ndarray
+        The integral over each bin, length len(edges) - 1.
+    """
+    cdef int g, i, k, n, nr
+    cdef double c, hi, nxt, total
+    cdef np.ndarray[np.float64_t, ndim=1] cx, cy, cbounds, cedges, integrals
+    cdef np.ndarray[np.int32_t, ndim=1] claws
+    cx, cy, cbounds, claws = _kernel_args(x, y, bounds, laws)
+    cedges = np.ascontiguousarray(edges, dtype=np.float64)
+    n = cx.shape[0]
+    nr = cbounds.shape[0]
+    integrals = np.zeros(max(cedges.shape[0] - 1, 0), dtype=np.float64)
+    for g in range(integrals.shape[0]):
+        c = max(cedges[g], cx[0])
+        hi = min(cedges[g + 1], cx[n - 1])
+        total = 0.0
+        while c < hi:
+            i = _bisect_right(cx, c) - 1
+            k = _bisect_right(cbounds, c)
+            if k == nr:
+                break
+            nxt = min(hi, cx[i + 1], cbounds[k])
+            total += _integrate_law(claws[k], cx[i], cx[i + 1], cy[i],
+                                    cy[i + 1], c, nxt, t)
+            c = nxt
+        integrals[g] = total
+    return integrals
+
+
 class Tab1(object):
     """A one-dimensional tabulated function.
 
@@ -2720,30 +2966,14 @@ class Tab1(object):
         params = [C1, C2, L1, L2]
 
         # Read the interpolation region data, namely NBT and INT
-        nbt = np.zeros(n_regions)
-        interp = np.zeros(n_regions)
-        m = 0
-        for i in range((n_regions - 1)//3 + 1):
-            line = fh.readline()
-            toRead = min(3, n_regions - m)
-            for j in range(toRead):
-                nbt[m] = int(line[0:11])
-                interp[m] = int(line[11:22])
-                line = line[22:]
-                m += 1
+        data = read_fields(fh, 2*n_regions)
+        nbt = data[0::2].copy()
+        interp = data[1::2].copy()
 
         # Read tabulated pairs x(n) and y(n)
-        x = np.zeros(n_pairs)
-        y = np.zeros(n_pairs)
-        m = 0
-        for i in range((n_pairs - 1)//3 + 1):
-            line = fh.readline()
-            toRead = min(3, n_pairs - m)
-            for j in range(toRead):
-                x[m] = endftod(line[:11])
-                y[m] = endftod(line[11:22])
-                line = line[22:]
-                m += 1
+        data = read_fields(fh, 2*n_pairs)
+        x = data[0::2].copy()
+        y = data[1::2].copy()
 
         return params, cls(x, y, nbt, interp)
 
@@ -2751,52 +2981,12 @@ class Tab1(object):
         # Check if input is array or scalar
         if isinstance(x, Iterable):
             iterable = True
-            x = np.array(x)
+            x = np.array(x, dtype=float)
         else:
             iterable = False
             x = np.array([x], dtype=float)
 
-        # Create output array
-        y = np.zeros_like(x)
-
-        # Get indices for interpolation
-        idx = np.searchsorted(self.x, x, side='right') - 1
-
-        # Find lowest valid index
-        i_low = np.searchsorted(idx, 0)
-
-        for k in range(len(self.nbt)):
-            # Determine which x values are within this interpolation range
-            i_high = np.searchsorted(idx, self.nbt[k] - 1)
-
-            # Get x values and bounding (x,y) pairs
-            xk = x[i_low:i_high]
-            xi = self.x[idx[i_low:i_high]]
-            xi1 = self.x[idx[i_low:i_high] + 1]
-            yi = self.y[idx[i_low:i_high]]
-            yi1 = self.y[idx[i_low:i_high] + 1]
-
-            if self.interp[k] == 1:
-                # Histogram
-                y[i_low:i_high] = yi
-
-            elif self.interp[k] == 2:
-                # Linear-linear
-                y[i_low:i_high] = yi + (xk - xi)/(xi1 - xi)*(yi1 - yi)
-
-            elif self.interp[k] == 3:
-                # Linear-log
-                y[i_low:i_high] = yi + np.log(xk/xi)/np.log(xi1/xi)*(yi1 - yi)
-
-            elif self.interp[k] == 4:
-                # Log-linear
-                y[i_low:i_high] = yi*np.exp((xk - xi)/(xi1 - xi)*np.log(yi1/yi))
-
-            elif self.interp[k] == 5:
-                # Log-log
-                y[i_low:i_high] = yi*np.exp(np.log(xk/xi)/np.log(xi1/xi)*np.log(yi1/yi))
-
-            i_low = i_high
+        y = interpolate(self.x, self.y, self.x[self.nbt - 1], self.interp, x)
 
         # In some cases, the first/last point of x may be less than the first
         # value of self.x due only to precision, so we check if they're close
@@ -2819,51 +3009,25 @@ class Tab1(object):
             integrals from the bottom of the range to each tabulated point.
 
         """
+        partial_sum = self.integrate(self.x)
+        return np.concatenate(([0.], np.cumsum(partial_sum)))
 
-        # Create output array
-        partial_sum = np.zeros(len(self.x) - 1)
-
-        i_low = 0
-        for k in range(len(self.nbt)):
-            # Determine which x values are within this interpolation range
-            i_high = self.nbt[k] - 1
-
-            # Get x values and bounding (x,y) pairs
-            x0 = self.x[i_low:i_high]
-            x1 = self.x[i_low + 1:i_high + 1]
-            y0 = self.y[i_low:i_high]
-            y1 = self.y[i_low + 1:i_high + 1]
-
-            if self.interp[k] == 1:
-                # Histogram
-                partial_sum[i_low:i_high] = y0*(x1 - x0)
-
-            elif self.interp[k] == 2:
-                # Linear-linear
-                m = (y1 - y0)/(x1 - x0)
-                partial_sum[i_low:i_high] = (y0 - m*x0)*(x1 - x0) + \
-                                            m*(x1**2 - x0**2)/2
-
-            elif self.interp[k] == 3:
-                # Linear-log
-                logx = np.log(x1/x0)
-                m = (y1 - y0)/logx
-                partial_sum[i_low:i_high] = y0 + m*(x1*(logx - 1) + x0)
-
-            elif self.interp[k] == 4:
-                # Log-linear
-                m = np.log(y1/y0)/(x1 - x0)
-                partial_sum[i_low:i_high] = y0/m*(np.exp(m*(x1 - x0)) - 1)
-
-            elif self.interp[k] == 5:
-                # Log-log
-                m = np.log(y1/y0)/np.log(x1/x0)
-                partial_sum[i_low:i_high] = y0/((m + 1)*x0**m)*(
-                    x1**(m + 1) - x0**(m + 1))
-
-            i_low = i_high
+    def integrate(self, edges):
+        """Integrals of the tabulated function over many bins at once.
 
-        return np.concatenate(([0.], np.cumsum(partial_sum)))
+        Parameters
+        ----------
+        edges : array_like
+            Ascending bin edges, e.g. of an energy group structure.
+
+        Returns
+        -------
+        ndarray
+            Integral over each bin, of length len(edges) - 1.
+
+        """
+        return integrate(self.x, self.y, self.x[self.nbt - 1], self.interp,
+                         edges)
 
 
 class EnergyDistribution(object):
@@ -3045,17 +3209,9 @@ class ENDFTab2Record(object):
         self.params = [C1, C2, L1, L2, NR, NZ]
 
         # Read the interpolation region data, namely NBT and INT
-        m = 0
-        for i in range((NR-1)//3 + 1):
-            line = fh.readline()
-            toRead = min(3,NR-m)
-            for j in range(toRead):
-                NBT = int(line[0:11])
-                INT = int(line[11:22])
-                self.NBT.append(NBT)
-                self.INT.append(INT)
-                line = line[22:]
-            m = m + toRead
+        data = read_fields(fh, 2*NR).astype(int)
+        self.NBT.extend(data[0::2].tolist())
+        self.INT.extend(data[1::2].tolist())
 
 
 class AngularDistribution(object):
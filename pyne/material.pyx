@@ -15,6 +15,7 @@ from libcpp cimport bool as cpp_bool
 
 # Python imports
 import collections
+import json
 cimport numpy as np
 import numpy as np
 from warnings import warn
@@ -2263,36 +2264,30 @@ cdef class _MaterialLibrary(object):
             The path in the heirarchy to the nuclide array in an HDF5 file.
 
         """
-        cdef std_string s
-        cdef cpp_jsoncpp.Reader reader = cpp_jsoncpp.Reader()
-        cdef cpp_jsoncpp.Value attribs
         cdef int i
         cdef _Material mat
         cdef dict _lib = (<_MaterialLibrary> self)._lib
-        cdef np.ndarray mattable
         with tb.open_file(file, 'r') as f:
             matstable = f.get_node(datapath)[:]
             nucs = f.get_node(nucpath)[:]
             matsmetadata = f.get_node(datapath + '_metadata').read()
         for i in range(len(matstable)):
-            row = matstable[i]
-            comp = dict((<int> k, v) for k, v in zip(nucs, row[3]) if v != 0.0)
-            mat = Material(comp, mass=row[0], density=row[1],
-                                    atoms_per_molecule=row[2])
-            strmetadata = "".join(map(chr, matsmetadata[i]))
-            strmetadata = strmetadata.encode()
-            s = std_string(<char *> strmetadata)
-            attribs = cpp_jsoncpp.Value()
-            reader.parse(s, attribs)
-            (<_Material> mat).mat_pointer.metadata = attribs
+            mat = _hdf5_row_to_material(matstable[i], nucs, matsmetadata[i])
             if "name" in mat.metadata:
                 name = mat.metadata["name"]
             else:
                 name = "_" + str(i)
-            _lib[name] = mat
+            if _DELETED in mat.metadata:
+                _lib.pop(name, None)
+            else:
+                _lib[name] = mat
 
-    def write_hdf5(self, filename, datapath="/materials", nucpath="/nucid"):
-        """Writes this material library to an HDF5 file.
+    def write_hdf5(self, filename, datapath="/materials", nucpath="/nucid",
+                   chunksize=100):
+        """Writes this material library to an HDF5 file. The whole library is
+        written with the file opened once; the compositions and metadata are
+        assembled chunksize rows at a time and appended to chunked, compressed
+        datasets with the same layout as Material.write_hdf5().
 
         Parameters
         ----------
@@ -2302,21 +2297,122 @@ cdef class _MaterialLibrary(object):
             The path in the heirarchy to the data table in an HDF5 file.
         nucpath : str, optional
             The path in the heirarchy to the nuclide array in an HDF5 file.
+            If this array already exists it is reused, otherwise it is created
+            from the union of the nuclides in the library.
+        chunksize : int, optional
+            The number of rows per chunk for new tables and the number of
+            materials assembled in memory between writes.
 
         """
+        cdef int start, stop
         cdef _Material mat
         cdef dict _lib = (<_MaterialLibrary> self)._lib
         cdef set nucids = set()
-        for mat in _lib.values():
-            nucids.update(mat.comp.keys())
+        keys = list(_lib.keys())
         with tb.open_file(filename, 'a') as f:
-            nucgrp, nucdsname = os.path.split(nucpath)
-            f.create_array(nucgrp, nucdsname, np.array(sorted(nucids)),
-                          createparents=True)
-        for key, mat in _lib.items():
-            if "name" not in mat.metadata:
-                mat.metadata["name"] = key
-            mat.write_hdf5(filename, datapath=datapath, nucpath=nucpath)
+            if nucpath in f:
+                nucs = f.get_node(nucpath)[:]
+            else:
+                for mat in _lib.values():
+                    nucids.update(mat.comp.keys())
+                nucs = np.array(sorted(nucids), dtype=np.int32)
+                nucgrp, nucdsname = os.path.split(nucpath)
+                f.create_array(nucgrp, nucdsname, nucs, createparents=True)
+            if len(keys) == 0:
+                return
+            table, metadata = _hdf5_library_nodes(f, datapath, nucpath, nucs,
+                                                  chunksize)
+            for start in range(0, len(keys), chunksize):
+                stop = min(start + chunksize, len(keys))
+                mats = []
+                for key in keys[start:stop]:
+                    mat = _lib[key]
+                    if "name" not in mat.metadata:
+                        mat.metadata["name"] = key
+                    mats.append(mat)
+                rows, rowsmetadata = _materials_to_hdf5_rows(mats, nucs)
+                table.append(rows)
+                for rowmetadata in rowsmetadata:
+                    metadata.append(rowmetadata)
+            table.flush()
+            metadata.flush()
+
+
+cdef _Material _hdf5_row_to_material(row, nucs, rowmetadata):
+    """Builds a material from a row of a material library table and the
+    matching row of its metadata dataset.
+    """
+    cdef std_string s
+    cdef cpp_jsoncpp.Reader reader = cpp_jsoncpp.Reader()
+    cdef cpp_jsoncpp.Value attribs
+    cdef _Material mat
+    comp = dict((<int> k, v) for k, v in zip(nucs, row[3]) if v != 0.0)
+    mat = Material(comp, mass=row[0], density=row[1],
+                   atoms_per_molecule=row[2])
+    strmetadata = "".join(map(chr, rowmetadata))
+    strmetadata = strmetadata.encode()
+    s = std_string(<char *> strmetadata)
+    attribs = cpp_jsoncpp.Value()
+    reader.parse(s, attribs)
+    mat.mat_pointer.metadata = attribs
+    return mat
+
+
+cdef tuple _materials_to_hdf5_rows(list mats, nucs):
+    """Assembles the material library table rows for a list of materials,
+    in the order of the nuclides in nucs, and their JSON metadata as int8
+    arrays.  Nuclides which are not in nucs are not written out.
+    """
+    cdef int i, j
+    cdef _Material mat
+    cdef cpp_map[int, int] nucidx
+    cdef cpp_map[int, double].iterator it
+    cdef cpp_jsoncpp.FastWriter writer = cpp_jsoncpp.FastWriter()
+    cdef std_string s
+    cdef np.ndarray[np.float64_t, ndim=2] comps
+    for j in range(len(nucs)):
+        nucidx[nucs[j]] = j
+    rows = np.zeros(len(mats), dtype=_hdf5_library_dtype(len(nucs)))
+    comps = rows['comp']
+    rowsmetadata = []
+    for i in range(len(mats)):
+        mat = mats[i]
+        rows['mass'][i] = mat.mat_pointer.mass
+        rows['density'][i] = mat.mat_pointer.density
+        rows['atoms_per_molecule'][i] = mat.mat_pointer.atoms_per_molecule
+        it = mat.mat_pointer.comp.begin()
+        while it != mat.mat_pointer.comp.end():
+            if 0 < nucidx.count(deref(it).first):
+                comps[i, nucidx[deref(it).first]] = deref(it).second
+            inc(it)
+        s = writer.write(mat.mat_pointer.metadata)
+        rowsmetadata.append(np.frombuffer(bytes(s), dtype=np.int8))
+    return rows, rowsmetadata
+
+
+def _hdf5_library_dtype(nnucs):
+    return np.dtype([('mass', np.float64), ('density', np.float64),
+                     ('atoms_per_molecule', np.float64),
+                     ('comp', np.float64, (nnucs,))])
+
+
+def _hdf5_library_nodes(f, datapath, nucpath, nucs, chunksize):
+    """Returns the material table and metadata nodes at datapath in the open
+    file f, creating them as chunked, compressed datasets if needed.
+    """
+    if datapath in f:
+        return f.get_node(datapath), f.get_node(datapath + '_metadata')
+    filters = tb.Filters(complevel=1, complib='zlib')
+    datagrp, datadsname = os.path.split(datapath)
+    table = f.create_table(datagrp, datadsname, _hdf5_library_dtype(len(nucs)),
+                           filters=filters, chunkshape=(chunksize,),
+                           createparents=True)
+    table.attrs.nucpath = np.bytes_(nucpath.encode())
+    metadata = f.create_vlarray(datagrp, datadsname + '_metadata',
+                                tb.Int8Atom(), filters=filters,
+                                chunkshape=(chunksize,))
+    return table, metadata
+
 
 class MaterialLibrary(_MaterialLibrary, collections.MutableMapping):
     """The material library is a collection of unique keys mapped to
@@ -2328,4 +2424,172 @@ class MaterialLibrary(_MaterialLibrary, collections.MutableMapping):
         libs = "{" + ", ".join(libs) + "}"
         return "pyne.material.MaterialLibrary({0})".format(libs)
 
+# metadata key of the rows which mark materials as deleted from a table
+_DELETED = "_deleted"
+
+
+class LazyMaterialLibrary(collections.MutableMapping):
+    """A material library which is backed by the material table of an HDF5
+    file.  Opening the library only reads the metadata to build an index
+    from material names to table rows; materials are read from the table
+    when they are accessed and kept in a least-recently-used cache of at most
+    cache_size entries.
+
+    Materials which are set on the library are written back to the file
+    when they are evicted from the cache, on flush(), or on close().  A row is
+    rewritten in place when its metadata fits in the existing row and is
+    appended to the table otherwise.  Nuclides which are not in the nuclide
+    array of the file are not written out.  Materials returned by the library
+    which are modified in place are not written back unless they are set on
+    the library again.  Deleting a material overwrites or appends a row whose
+    metadata marks the name as deleted, so that it is skipped when the file
+    is read again.  A library which is garbage collected with unsaved
+    materials is flushed with a warning.
+    """
+
+    def __init__(self, filename, datapath="/materials", nucpath="/nucid",
+                 cache_size=1000, mode='r'):
+        """Parameters
+        ----------
+        filename : str
+            A path to an HDF5 file.
+        datapath : str, optional
+            The path in the heirarchy to the data table in an HDF5 file.
+        nucpath : str, optional
+            The path in the heirarchy to the nuclide array in an HDF5 file.
+        cache_size : int, optional
+            The maximum number of materials kept in memory.
+        mode : str, optional
+            The mode the file is opened with, 'r' for read-only access or
+            'a' to allow materials to be written back.
+
+        """
+        self.filename = filename
+        self.datapath = datapath
+        self.nucpath = nucpath
+        self.cache_size = cache_size
+        self._h5 = tb.open_file(filename, mode)
+        self._table = self._h5.get_node(datapath)
+        self._metadata = self._h5.get_node(datapath + '_metadata')
+        self._nucs = self._h5.get_node(nucpath)[:]
+        self._index = {}
+        for i, rowmetadata in enumerate(self._metadata.read()):
+            attrs = json.loads(rowmetadata.tobytes().decode())
+            if isinstance(attrs, dict) and "name" in attrs:
+                name = attrs["name"]
+            else:
+                name = "_" + str(i)
+            if isinstance(attrs, dict) and _DELETED in attrs:
+                self._index.pop(name, None)
+            else:
+                self._index[name] = i
+        self._cache = collections.OrderedDict()
+        self._dirty = set()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            mat = self._cache.pop(key)
+        else:
+            row = self._index[key]
+            mat = _hdf5_row_to_material(self._table[row], self._nucs,
+                                        self._metadata[row])
+        self._cache[key] = mat
+        self._evict()
+        return mat
+
+    def __setitem__(self, key, value):
+        if self._h5.mode == 'r':
+            raise IOError("{0} was opened read-only".format(self.filename))
+        self._index.setdefault(key, None)
+        self._cache.pop(key, None)
+        self._cache[key] = ensure_material(value)
+        self._dirty.add(key)
+        self._evict()
+
+    def __delitem__(self, key):
+        if self._h5.mode == 'r':
+            raise IOError("{0} was opened read-only".format(self.filename))
+        if self._index[key] is not None:
+            self._write_back([key], [Material(metadata={"name": key,
+                                                        _DELETED: True})])
+        del self._index[key]
+        self._cache.pop(key, None)
+        self._dirty.discard(key)
+
+    def __del__(self):
+        h5 = getattr(self, '_h5', None)
+        if h5 is None or not h5.isopen:
+            return
+        if len(self._dirty) > 0:
+            warn("{0} was not closed, writing {1} unsaved materials".format(
+                 self.filename, len(self._dirty)), RuntimeWarning)
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return "pyne.material.LazyMaterialLibrary({0!r}, datapath={1!r}, " \
+               "nucpath={2!r})".format(self.filename, self.datapath,
+                                       self.nucpath)
+
+    def _evict(self):
+        while len(self._cache) > self.cache_size:
+            key, mat = self._cache.popitem(last=False)
+            if key in self._dirty:
+                self._write_back([key], [mat])
+
+    def _write_back(self, keys, mats):
+        for key, mat in zip(keys, mats):
+            if "name" not in mat.metadata:
+                mat.metadata["name"] = key
+        rows, rowsmetadata = _materials_to_hdf5_rows(list(mats), self._nucs)
+        for j, key in enumerate(keys):
+            i = self._index[key]
+            rowmetadata = rowsmetadata[j]
+            if i is not None and len(rowmetadata) <= len(self._metadata[i]):
+                # pad with whitespace, which the JSON readers skip
+                pad = np.empty(len(self._metadata[i]) - len(rowmetadata),
+                               dtype=np.int8)
+                pad.fill(ord(' '))
+                self._table.modify_rows(i, i + 1, rows=rows[j:j + 1])
+                self._metadata[i] = np.concatenate([rowmetadata, pad])
+            else:
+                self._index[key] = self._table.nrows
+                self._table.append(rows[j:j + 1])
+                self._metadata.append(rowmetadata)
+            self._dirty.discard(key)
+
+    def flush(self):
+        """Writes the materials which have been set on this library since
+        they were last written out to the HDF5 file.
+        """
+        keys = [key for key in self._cache if key in self._dirty]
+        if len(keys) > 0:
+            self._write_back(keys, [self._cache[key] for key in keys])
+        if self._h5.mode != 'r':
+            self._h5.flush()
+
+    def close(self):
+        """Flushes this library and closes the HDF5 file."""
+        if self._h5.isopen:
+            self.flush()
+            self._h5.close()
+
+    def to_library(self):
+        """Reads all of the materials into a new MaterialLibrary."""
+        return MaterialLibrary([(key, self[key]) for key in self])
+
 ensure_material = lambda m: m if isinstance(m, Material) else Material(m)
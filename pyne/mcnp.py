@@ -14,10 +14,11 @@ available to use.
 from __future__ import print_function, division
 import sys
 import struct
-import math
 import os
 import linecache
 import datetime
+import time
+from itertools import islice
 from warnings import warn
 
 import numpy as np
@@ -27,6 +28,7 @@ from pyne.utils import QAWarning
 from pyne.material import Material
 from pyne.material import MultiMaterial
 from pyne import nucname
+from pyne import ace
 from pyne.binaryreader import _BinaryReader, _FortranRecord
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
@@ -157,6 +159,53 @@ class TrackData(object):
         pass
 
 
+_TRACK_FIELDS = ['nps', 'bitarray', 'wgt', 'erg', 'tme',
+                 'x', 'y', 'z', 'u', 'v', 'cs']
+
+
+def track_dtype(ncrd=11):
+    """track_dtype(ncrd=11)
+    Returns the structured dtype used for arrays of surface source tracks.
+
+    Parameters
+    ----------
+    ncrd : int, optional
+        Number of values in each surface source track record, as given by
+        SurfSrc.ncrd.  Values beyond the usual 11 are named extra0, extra1...
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        One float64 field per value in the track record.
+    """
+    n = abs(ncrd)
+    names = _TRACK_FIELDS[:n] + ['extra{0}'.format(i)
+                                 for i in range(n - len(_TRACK_FIELDS))]
+    return np.dtype([(name, np.float64) for name in names])
+
+
+def _track_record_dtype(ncrd):
+    """The dtype of a whole Fortran track record, including the leading and
+    trailing record length markers.
+    """
+    fields = track_dtype(ncrd).descr
+    return np.dtype([('head', np.intc)] + fields + [('tail', np.intc)])
+
+
+def track_cell(tracks):
+    """Returns the cell numbers encoded in the bitarray of each track."""
+    return np.abs(tracks['bitarray']) // 8 % 100000000
+
+
+def track_w(tracks):
+    """Returns the z-direction cosine of each track, recovered from u, v and
+    the sign carried by the bitarray.
+    """
+    u = tracks['u']
+    v = tracks['v']
+    return np.copysign(np.sqrt(1 - u*u - v*v), tracks['bitarray'])
+
+
 class SurfSrc(_BinaryReader):
     """Enables manipulating both the header and tracklists in surface source
     files.
@@ -447,31 +496,85 @@ class SurfSrc(_BinaryReader):
         self.summary_extra = list()
         while summary_info.num_bytes > summary_info.pos:
             self.summary_extra += summary_info.get_int()
+        self._tracks_start = self.f.tell()
+
+    def iter_tracks(self, chunksize=2**20, where=None):
+        """iter_tracks(chunksize=2**20, where=None)
+        Iterates over the track records following the header a block at a
+        time, without holding the whole track list in memory.  The header
+        must have been read first.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Maximum number of tracks in each block.
+        where : callable, optional
+            Function taking a block of tracks and returning a boolean mask
+            of the tracks to keep.  By default all tracks are kept.
+
+        Yields
+        ------
+        tracks : numpy structured array
+            Block of tracks with the dtype given by track_dtype(self.ncrd).
+        """
+        rec_dtype = _track_record_dtype(self.ncrd)
+        names = track_dtype(self.ncrd).names
+        reclen = rec_dtype.itemsize - 2*np.dtype(np.intc).itemsize
+        nbytes = os.fstat(self.f.fileno()).st_size - self._tracks_start
+        if nbytes < self.nrss*rec_dtype.itemsize:
+            raise ValueError("file holds fewer than the {0} tracks given in "
+                             "its header".format(self.nrss))
+        if self.nrss == 0:
+            return
+        records = np.memmap(self.f, dtype=rec_dtype, mode='r',
+                            offset=self._tracks_start, shape=(self.nrss,))
+        for start in range(0, self.nrss, chunksize):
+            block = records[start:start+chunksize]
+            if (block['head'] != reclen).any() or \
+                    (block['tail'] != reclen).any():
+                raise ValueError("unexpected track record length in tracks "
+                                 "{0} to {1}".format(start, start+len(block)))
+            tracks = np.empty(len(block), dtype=track_dtype(self.ncrd))
+            for name in names:
+                tracks[name] = block[name]
+            if where is not None:
+                tracks = tracks[where(tracks)]
+            yield tracks
+        del records
+        self.f.seek(self._tracks_start + self.nrss*rec_dtype.itemsize)
+
+    def read_tracks(self):
+        """read_tracks()
+        Reads in all track records as a single structured array, see
+        iter_tracks().
+
+        Returns
+        -------
+        tracks : numpy structured array
+            All tracks, with the dtype given by track_dtype(self.ncrd).
+        """
+        tracks = np.empty(self.nrss, dtype=track_dtype(self.ncrd))
+        start = 0
+        for block in self.iter_tracks():
+            tracks[start:start+len(block)] = block
+            start += len(block)
+        return tracks
 
     def read_tracklist(self):
         """Reads in track records for individual particles."""
+        tracks = self.read_tracks()
+        cells = track_cell(tracks).tolist()
+        ws = track_w(tracks).tolist()
         self.tracklist = []
-        for j in range(self.nrss):
-            track_info = self.get_fortran_record()
+        for record, cell, w in zip(tracks.tolist(), cells, ws):
             track_data = TrackData()
-            track_data.record = track_info.get_double(abs(self.ncrd))
-            track_data.nps = track_data.record[0]
-            track_data.bitarray = track_data.record[1]
-            track_data.cell = abs(track_data.bitarray) // 8 % 100000000
-            track_data.wgt = track_data.record[2]
-            track_data.erg = track_data.record[3]
-            track_data.tme = track_data.record[4]
-            track_data.x = track_data.record[5]
-            track_data.y = track_data.record[6]
-            track_data.z = track_data.record[7]
-            track_data.u = track_data.record[8]
-            track_data.v = track_data.record[9]
-            track_data.cs = track_data.record[10]
-            track_data.w = math.copysign(
-                math.sqrt(1 - track_data.u*track_data.u -
-                          track_data.v*track_data.v), track_data.bitarray)
-            # track_data.bitarray = abs(track_data.bitarray)
-
+            track_data.record = list(record)
+            (track_data.nps, track_data.bitarray, track_data.wgt,
+             track_data.erg, track_data.tme, track_data.x, track_data.y,
+             track_data.z, track_data.u, track_data.v,
+             track_data.cs) = record[:11]
+            track_data.cell = cell
+            track_data.w = w
             self.tracklist.append(track_data)
         return
 
@@ -559,27 +662,67 @@ class SurfSrc(_BinaryReader):
         self.put_table_2()
         self.put_surface_info()
         self.put_summary()
+        self._tracks_start = self.f.tell()
+
+    def write_tracks(self, tracks, chunksize=2**20):
+        """write_tracks(tracks, chunksize=2**20)
+        Writes track records following the header, a block at a time.  If the
+        number of tracks written differs from nrss, nrss is updated and the
+        header, when already written, is rewritten in place.
+
+        Parameters
+        ----------
+        tracks : numpy structured array or iterable of them
+            Tracks to write, e.g. as returned by read_tracks() or
+            iter_tracks().  Fields of track_dtype(self.ncrd) which are
+            missing are written as zero.
+        chunksize : int, optional
+            Maximum number of tracks converted and written at a time.
+
+        Returns
+        -------
+        count : int
+            Number of tracks written.
+        """
+        if isinstance(tracks, np.ndarray):
+            tracks = [tracks]
+        rec_dtype = _track_record_dtype(self.ncrd)
+        names = track_dtype(self.ncrd).names
+        reclen = rec_dtype.itemsize - 2*np.dtype(np.intc).itemsize
+        count = 0
+        for block in tracks:
+            for start in range(0, len(block), chunksize):
+                chunk = block[start:start+chunksize]
+                records = np.zeros(len(chunk), dtype=rec_dtype)
+                records['head'] = reclen
+                records['tail'] = reclen
+                for name in names:
+                    if name in chunk.dtype.names:
+                        records[name] = chunk[name]
+                self.f.write(records.tobytes())
+                count += len(chunk)
+        if count != self.nrss:
+            self.nrss = count
+            if hasattr(self, '_tracks_start'):
+                pos = self.f.tell()
+                self.f.seek(0)
+                self.write_header()
+                self.f.seek(pos)
+        return count
 
     def write_tracklist(self):
         """Write track records for individual particles. Second part of the MCNP
         surface source file.  Tracklist is also known as a 'phase space'.
+        The tracklist may be a list of TrackData or a structured array of
+        tracks.
         """
-
-        for j in range(self.nrss):  # nrss is the size of tracklist
-            newrecord = _FortranRecord("", 0)
-            # 11 records comprising particle information
-            newrecord.put_double(self.tracklist[j].nps)
-            newrecord.put_double(self.tracklist[j].bitarray)
-            newrecord.put_double(self.tracklist[j].wgt)
-            newrecord.put_double(self.tracklist[j].erg)
-            newrecord.put_double(self.tracklist[j].tme)
-            newrecord.put_double(self.tracklist[j].x)
-            newrecord.put_double(self.tracklist[j].y)
-            newrecord.put_double(self.tracklist[j].z)
-            newrecord.put_double(self.tracklist[j].u)
-            newrecord.put_double(self.tracklist[j].v)
-            newrecord.put_double(self.tracklist[j].cs)
-            self.put_fortran_record(newrecord)
+        tracklist = self.tracklist[:self.nrss]  # nrss is the size of tracklist
+        if not isinstance(tracklist, np.ndarray):
+            tracks = np.empty(len(tracklist), dtype=track_dtype(11))
+            for name in tracks.dtype.names:
+                tracks[name] = [getattr(t, name) for t in tracklist]
+            tracklist = tracks
+        self.write_tracks(tracklist)
         return
 
     def update_tracklist(self, surf_src):
@@ -838,6 +981,47 @@ class Xsdir(object):
                 tables.append(table)
         return tables
 
+    def load_tables(self, names=None, datapath=None):
+        """Reads ACE tables by seeking straight to the addresses given in the
+        xsdir, rather than scanning each data file for them.  Tables which
+        share a data file are read from a single memory-mapped ace.Library.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Names of the tables to read, e.g. '1001.70c'.  By default, all
+            tables in the xsdir are read.
+        datapath : str, optional
+            Directory that table filenames are relative to.  Defaults to the
+            datapath of the xsdir, if given, and otherwise its directory.
+
+        Returns
+        -------
+        tables : dict
+            Maps table names to ace.AceTable objects.
+        """
+        if datapath is None:
+            datapath = getattr(self, 'datapath', self.directory)
+        if names is not None:
+            names = set(names)
+        byfile = {}
+        for table in self.tables:
+            if names is None or table.name in names:
+                byfile.setdefault(table.filename, []).append(table)
+
+        tables = {}
+        for filename, xstables in byfile.items():
+            lib = ace.Library(os.path.join(datapath, filename), mmap=True)
+            if lib.binary:
+                for t in xstables:
+                    lib.read_at([(t.address - 1)*t.recordlength],
+                                recl_length=t.recordlength,
+                                entries=t.entries)
+            else:
+                lib.read_at(lib.line_offsets([t.address for t in xstables]))
+            tables.update(lib.tables)
+        return tables
+
     def to_xsdata(self, filename):
         """Writes a Serpent xsdata file for all continuous energy xs tables.
 
@@ -1269,30 +1453,140 @@ class PtracReader(object):
                     evt_line[i]
         ptrac_event["event_type"] = event_type
 
-    def write_to_hdf5_table(self, hdf5_table, print_progress=0):
+    def read_event_blocks(self, chunksize=2**26, dtype=None):
+        """Reads the remaining events of the Ptrac file a large block at a
+        time, decoding all records of each event type in a block at once.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of bytes of the file to read at a time.
+        dtype : numpy.dtype, optional
+            Structured dtype of the returned events, by default that of
+            PtracEvent.  Fields which are not PtracEvent columns are left zero.
+
+        Yields
+        ------
+        events : numpy structured array
+            The events of each block, in the order of the file.
+        """
+        if dtype is None:
+            dtype = tables.dtype_from_descr(PtracEvent)
+        isize = 8 if self.eightbytes else 4
+        fdtype = np.dtype(self.endianness + ('f8' if self.eightbytes else 'f4'))
+        nps_fmt = str(self.endianness + 'i' + ('q' if self.eightbytes else 'i')*2)
+        evt_fmt = str(self.endianness + 'i' + ('d' if self.eightbytes else 'f'))
+        kinds = ["src", "bnk", "sur", "col", "ter"]
+        kind_of_event = {1000: 0, 3000: 2, 4000: 3, 5000: 4}
+        nps_len = isize*self.variable_nums["nps"]
+        evt_lens = [isize*self.variable_nums[e] for e in kinds]
+
+        # columns of each record kind, in order so that later variables with
+        # the same name take precedence as they did in read_event_line()
+        columns = []
+        for e in kinds:
+            cols = [(i, self.variable_mappings[v])
+                    for i, v in enumerate(self.variable_ids[e])
+                    if i > 0 and v in self.variable_mappings]
+            columns.append([(i, name) for i, name in cols
+                            if name in dtype.names])
+
+        buf = b''
+        next_event = 9000
+        while True:
+            data = self.f.read(chunksize)
+            buf = buf + data if len(buf) > 0 else data
+            pos = 0
+            nbuf = len(buf)
+            offsets = []
+            event_types = []
+            event_kinds = []
+            while True:
+                if next_event == 9000:
+                    if pos + nps_len + 8 > nbuf:
+                        break
+                    length, nps, next_event = struct.unpack_from(nps_fmt, buf, pos)
+                    if length != nps_len:
+                        raise ValueError("unexpected NPS record length {0} at "
+                                         "byte {1}".format(length, pos))
+                    pos += nps_len + 8
+                    continue
+                k = kind_of_event.get(next_event, 1)
+                if pos + evt_lens[k] + 8 > nbuf:
+                    break
+                offsets.append(pos + 4)
+                event_types.append(next_event)
+                event_kinds.append(k)
+                length, next_event = struct.unpack_from(evt_fmt, buf, pos)
+                next_event = int(next_event)
+                if length != evt_lens[k]:
+                    raise ValueError("unexpected event record length {0} at "
+                                     "byte {1}".format(length, pos))
+                pos += evt_lens[k] + 8
+
+            if len(offsets) > 0:
+                events = np.zeros(len(offsets), dtype=dtype)
+                events["event_type"] = event_types
+                offsets = np.asarray(offsets)
+                event_kinds = np.asarray(event_kinds)
+                for k, cols in enumerate(columns):
+                    rows = np.flatnonzero(event_kinds == k)
+                    if len(rows) == 0 or len(cols) == 0:
+                        continue
+                    # gather one column at a time, so that the index arrays
+                    # stay small next to the block
+                    starts = offsets[rows]
+                    for i, name in cols:
+                        events[name][rows] = _gather(buf, starts + i*isize,
+                                                     fdtype)
+                yield events
+            buf = buf[pos:]
+            if len(data) == 0:
+                break
+        if len(buf) > 0:
+            warn("ignoring {0} bytes of incomplete records at the end of the "
+                 "Ptrac file".format(len(buf)))
+        self.next_event = next_event
+
+    def write_to_hdf5_table(self, hdf5_table, print_progress=0,
+                            chunksize=2**26):
         """Writes the events contained in this Ptrac file to a given HDF5
         table. The table must already exist and have rows that match the
         PtracEvent definition.
         If desired, the number of processed events can be printed to the
-        console each N events by passing the print_progress=N parameter.
+        console each N events by passing the print_progress=N parameter,
+        along with the throughput of the conversion.
+        The file is read and events are appended to the table in blocks of
+        chunksize bytes, see read_event_blocks().
         """
-
-        ptrac_event = hdf5_table.row
         counter = 0
-
-        while True:
-            try:
-                self.read_nps_line()
-            except EOFError:
-                break  # no more entries
-
-            while self.next_event != 9000:
-                self.read_event_line(ptrac_event)
-                ptrac_event.append()
-
-                counter += 1
-                if print_progress > 0 and counter % print_progress == 0:
-                    print("processing event {0}".format(counter))
+        start = time.time()
+        start_pos = self.f.tell()
+        for events in self.read_event_blocks(chunksize=chunksize,
+                                             dtype=hdf5_table.dtype):
+            hdf5_table.append(events)
+            if print_progress > 0 and \
+                    (counter + len(events))//print_progress > counter//print_progress:
+                elapsed = max(time.time() - start, 1e-9)
+                print("processing event {0} ({1:.0f} events/s, {2:.1f} MB/s)"
+                      "".format(counter + len(events),
+                                (counter + len(events))/elapsed,
+                                (self.f.tell() - start_pos)/elapsed/1e6))
+            counter += len(events)
+
+def _gather(buf, pos, dtype):
+    """Returns the values of a numpy dtype at the byte positions pos of buf,
+    which need not be aligned to its itemsize.
+    """
+    size = dtype.itemsize
+    values = np.empty(len(pos), dtype=dtype)
+    rem = pos % size
+    for r in np.unique(rem):
+        sel = rem == r
+        view = np.frombuffer(buf, dtype=dtype, offset=r,
+                             count=(len(buf) - r)//size)
+        values[sel] = view[(pos[sel] - r)//size]
+    return values
 
 def _is_cell_line(line):
     is_cell = False
@@ -1936,10 +2230,13 @@ class Meshtal(object):
         tag name, and the total relative error tag name. If tags is None
         the tags are named 'x_result', 'x_rel_error', 'x_result_total',
         'x_rel_error_total' where x is n or p for neutrons or photons.
+    tallies : set of ints or None
+        The tally numbers read from the file, or None if all are read.
 
     """
 
-    def __init__(self, filename, tags=None, meshes_have_mats=False):
+    def __init__(self, filename, tags=None, meshes_have_mats=False,
+                 tallies=None):
         """Parameters
         ----------
         filename : str
@@ -1953,6 +2250,9 @@ class Meshtal(object):
         meshes_have_mats : bool
              If false, Meshtally objects will be created without PyNE material
              material objects.
+        tallies : iterable of ints, optional
+            Tally numbers to read. The data of any other tally is skipped
+            without being parsed. By default all tallies are read.
         """
 
         if not HAVE_PYTAPS:
@@ -1962,6 +2262,7 @@ class Meshtal(object):
         self.tally = {}
         self.tags = tags
         self._meshes_have_mats = meshes_have_mats
+        self.tallies = None if tallies is None else set(tallies)
 
         with open(filename, 'r') as f:
             self._read_meshtal_head(f)
@@ -1991,15 +2292,19 @@ class Meshtal(object):
         line = f.readline()
 
         while line != "":
-            if line.split()[0:3] == ['Mesh', 'Tally', 'Number']:
+            # the substring test keeps skipped tally data cheap to pass over
+            if 'Mesh Tally Number' in line and \
+                    line.split()[0:3] == ['Mesh', 'Tally', 'Number']:
                 tally_num = int(line.split()[3])
-                if self.tags is not None and tally_num in self.tags.keys():
-                    self.tally[tally_num] = MeshTally(f, tally_num,
-                                                      self.tags[tally_num],
-                                          mesh_has_mats=self._meshes_have_mats)
-                else:
-                    self.tally[tally_num] = MeshTally(f, tally_num,
-                                          mesh_has_mats=self._meshes_have_mats)
+                # unselected tallies are passed over line by line
+                if self.tallies is None or tally_num in self.tallies:
+                    if self.tags is not None and tally_num in self.tags.keys():
+                        self.tally[tally_num] = MeshTally(f, tally_num,
+                                                          self.tags[tally_num],
+                                              mesh_has_mats=self._meshes_have_mats)
+                    else:
+                        self.tally[tally_num] = MeshTally(f, tally_num,
+                                              mesh_has_mats=self._meshes_have_mats)
 
             line = f.readline()
 
@@ -2138,20 +2443,14 @@ class MeshTally(StatMesh):
             * (len(self.z_bounds)-1)
         num_e_groups = len(self.e_bounds)-1
 
-        # get result and relative error data from file
+        # get result and relative error data from file, one energy group
+        # at a time
+        usecols = (self._column_idx["Result"], self._column_idx["Rel_Error"])
         result = np.empty(shape=(num_e_groups, num_vol_elements))
         rel_error = np.empty(shape=(num_e_groups, num_vol_elements))
         for i in range(0, num_e_groups):
-            result_row = []
-            rel_error_row = []
-            for j in range(0, num_vol_elements):
-                line = f.readline().split()
-                result_row.append(float(line[self._column_idx["Result"]]))
-                rel_error_row.append(
-                    float(line[self._column_idx["Rel_Error"]]))
-
-            result[i] = result_row
-            rel_error[i] = rel_error_row
+            result[i], rel_error[i] = _read_columns(f, num_vol_elements,
+                                                    usecols)
 
         # Tag results and error vector to mesh
         res_tag = IMeshTag(num_e_groups, float, mesh=self,
@@ -2168,13 +2467,7 @@ class MeshTally(StatMesh):
         # If "total" data exists (i.e. if there is more than
         # 1 energy group) get it and tag it onto the mesh.
         if num_e_groups > 1:
-            result = []
-            rel_error = []
-            for i in range(0, num_vol_elements):
-                line = f.readline().split()
-                result.append(float(line[self._column_idx["Result"]]))
-                rel_error.append(
-                    float(line[self._column_idx["Rel_Error"]]))
+            result, rel_error = _read_columns(f, num_vol_elements, usecols)
 
             res_tot_tag = IMeshTag(1, float, mesh=self, name=self.tag_names[2])
             rel_err_tot_tag = IMeshTag(1, float, mesh=self,
@@ -2183,6 +2476,18 @@ class MeshTally(StatMesh):
             rel_err_tot_tag[:] = rel_error
 
 
+def _read_columns(f, nrows, usecols):
+    """Parses the usecols columns of the next nrows whitespace delimited lines
+    of f in bulk, returning an array with one row per column.
+    """
+    lines = islice(iter(f.readline, ''), nrows)
+    data = np.loadtxt(lines, usecols=usecols, ndmin=2)
+    if data.shape[0] != nrows:
+        raise ValueError("expected {0} rows of tally data but found {1}"
+                         "".format(nrows, data.shape[0]))
+    return data.T
+
+
 def mesh_to_geom(mesh, frac_type='mass', title_card="Generated from PyNE Mesh"):
     """This function reads a structured Mesh object and returns the geometry
     portion of an MCNP input file (cells, surfaces, materials), prepended by a
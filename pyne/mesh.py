@@ -1,6 +1,8 @@
 from __future__ import print_function, division
+import os
 import sys
 import copy
+import json
 import itertools
 from collections import Iterable, Sequence
 from warnings import warn
@@ -8,6 +10,7 @@ from pyne.utils import QAWarning
 
 import numpy as np
 import tables as tb
+from scipy import sparse
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
@@ -17,6 +20,7 @@ except ImportError:
     warn("the PyTAPS optional dependency could not be imported. "
          "Some aspects of the mesh module may be incomplete.", QAWarning)
 
+from pyne import data
 from pyne.material import Material, MaterialLibrary, MultiMaterial
 
 if sys.version_info[0] > 2:
@@ -216,6 +220,60 @@ class MaterialMethodTag(Tag):
         raise AttributeError(msg)
 
 
+class ColumnarPropertyTag(Tag):
+    """A mesh tag which looks itself up as a column of the ColumnarMaterials
+    store of the mesh.  This makes the following expressions equivalent for a
+    given material property name::
+
+        mesh.name[i] == mesh.mats.name[i]
+
+    It also adds slicing, fancy indexing, boolean masking, and broadcasting
+    features to this process, each of which is a single array operation.
+    """
+
+    def __getitem__(self, key):
+        key = _column_key(key, len(self.mesh))
+        return getattr(self.mesh.mats, self.name)[key]
+
+    def __setitem__(self, key, value):
+        key = _column_key(key, len(self.mesh))
+        if self.name == 'comp':
+            self.mesh.mats.set_comp(key, value)
+        else:
+            getattr(self.mesh.mats, self.name)[key] = value
+
+    def __delitem__(self, key):
+        msg = ("the material property tag {0!r} may "
+               "not be deleted").format(self.name)
+        raise AttributeError(msg)
+
+
+class ColumnarMethodTag(Tag):
+    """A mesh tag which looks itself up by calling a method of the
+    ColumnarMaterials store of the mesh on the selected volume elements.  This
+    makes the following expressions equivalent for a given material method
+    name::
+
+        mesh.name[i] == mesh.mats.name(i) == mesh.mats[i].name()
+
+    It also adds slicing, fancy indexing, and boolean masking features to
+    this process, each of which is a single array operation.
+    """
+
+    def __getitem__(self, key):
+        key = _column_key(key, len(self.mesh))
+        return getattr(self.mesh.mats, self.name)(key)
+
+    def __setitem__(self, key, value):
+        msg = "the material method tag {0!r} may not be set".format(self.name)
+        raise AttributeError(msg)
+
+    def __delitem__(self, key):
+        msg = ("the material method tag {0!r} may not be "
+               "deleted").format(self.name)
+        raise AttributeError(msg)
+
+
 class MetadataTag(Tag):
     """A mesh tag which looks itself up as a material metadata attribute.
     Tags of this are untyped and may have any size.  Use this for catch-all
@@ -237,16 +295,17 @@ class MetadataTag(Tag):
             RuntimeError("Mesh.mats is None, please add a MaterialLibrary.")
         size = len(self.mesh)
         if isinstance(key, _INTEGRAL_TYPES):
-            return mats[key].metadata[name]
+            return _metadata(mats, key)[name]
         elif isinstance(key, slice):
-            return [mats[i].metadata[name] for i in range(*key.indices(size))]
+            return [_metadata(mats, i)[name]
+                    for i in range(*key.indices(size))]
         elif isinstance(key, np.ndarray) and key.dtype == np.bool:
             if len(key) != size:
                 raise KeyError("boolean mask must match the length "
                                "of the mesh.")
-            return [mats[i].metadata[name] for i, b in enumerate(key) if b]
+            return [_metadata(mats, i)[name] for i, b in enumerate(key) if b]
         elif isinstance(key, Iterable):
-            return [mats[i].metadata[name] for i in key]
+            return [_metadata(mats, i)[name] for i in key]
         else:
             raise TypeError("{0} is not an int, slice, mask, "
                             "or fancy index.".format(key))
@@ -258,15 +317,15 @@ class MetadataTag(Tag):
             RuntimeError("Mesh.mats is None, please add a MaterialLibrary.")
         size = len(self.mesh)
         if isinstance(key, _INTEGRAL_TYPES):
-            mats[key].metadata[name] = value
+            _metadata(mats, key)[name] = value
         elif isinstance(key, slice):
             idx = range(*key.indices(size))
             if isinstance(value, _SEQUENCE_TYPES) and len(value) == len(idx):
                 for i, v in zip(idx, value):
-                    mats[i].metadata[name] = v
+                    _metadata(mats, i)[name] = v
             else:
                 for i in idx:
-                    mats[i].metadata[name] = value
+                    _metadata(mats, i)[name] = value
         elif isinstance(key, np.ndarray) and key.dtype == np.bool:
             if len(key) != size:
                 raise KeyError("boolean mask must match the length "
@@ -274,17 +333,17 @@ class MetadataTag(Tag):
             idx = np.where(key)[0]
             if isinstance(value, _SEQUENCE_TYPES) and len(value) == key.sum():
                 for i, v in zip(idx, value):
-                    mats[i].metadata[name] = v
+                    _metadata(mats, i)[name] = v
             else:
                 for i in idx:
-                    mats[i].metadata[name] = value
+                    _metadata(mats, i)[name] = value
         elif isinstance(key, Iterable):
             if isinstance(value, _SEQUENCE_TYPES) and len(value) == len(key):
                 for i, v in zip(key, value):
-                    mats[i].metadata[name] = v
+                    _metadata(mats, i)[name] = v
             else:
                 for i in key:
-                    mats[i].metadata[name] = value
+                    _metadata(mats, i)[name] = value
         else:
             raise TypeError("{0} is not an int, slice, mask, "
                             "or fancy index.".format(key))
@@ -296,20 +355,20 @@ class MetadataTag(Tag):
             RuntimeError("Mesh.mats is None, please add a MaterialLibrary.")
         size = len(self.mesh)
         if isinstance(key, _INTEGRAL_TYPES):
-            del mats[key].metadata[name]
+            del _metadata(mats, key)[name]
         elif isinstance(key, slice):
             for i in range(*key.indices(size)):
-                del mats[i].metadata[name]
+                del _metadata(mats, i)[name]
         elif isinstance(key, np.ndarray) and key.dtype == np.bool:
             if len(key) != size:
                 raise KeyError("boolean mask must match the length "
                                "of the mesh.")
             for i, b in enumerate(key):
                 if b:
-                    del mats[i].metadata[name]
+                    del _metadata(mats, i)[name]
         elif isinstance(key, Iterable):
             for i in key:
-                del mats[i].metadata[name]
+                del _metadata(mats, i)[name]
         else:
             raise TypeError("{0} is not an int, slice, mask, "
                             "or fancy index.".format(key))
@@ -368,26 +427,22 @@ class IMeshTag(Tag):
         self.mesh.mesh.destroyTag(self.name, force=True)
 
     def __getitem__(self, key):
-        m = self.mesh.mesh
         size = len(self.mesh)
         mtag = self.tag
-        miter = self.mesh.iter_ve()
+        ves = self.mesh._ve_handles()
         if isinstance(key, _INTEGRAL_TYPES):
             if key >= size:
                 raise IndexError("key index {0} greater than the size of the "
                                  "mesh {1}".format(key, size))
-            for i_ve in zip(range(key+1), miter):
-                pass
-            return mtag[i_ve[1]]
+            return mtag[ves[key]]
         elif isinstance(key, slice):
-            return mtag[list(miter)[key]]
+            return mtag[ves[key]]
         elif isinstance(key, np.ndarray) and key.dtype == np.bool:
             if len(key) != size:
                 raise KeyError("boolean mask must match the length "
                                "of the mesh.")
-            return mtag[[ve for b, ve in zip(key, miter) if b]]
+            return mtag[[ves[i] for i in np.flatnonzero(key)]]
         elif isinstance(key, Iterable):
-            ves = list(miter)
             return mtag[[ves[i] for i in key]]
         else:
             raise TypeError("{0} is not an int, slice, mask, "
@@ -398,20 +453,17 @@ class IMeshTag(Tag):
         tsize = self.size
         value = np.asarray(value, self.tag.type)
         value = np.atleast_1d(value) if tsize == 1 else np.atleast_2d(value)
-        # set up mesh to be iterated over
-        m = self.mesh.mesh
+        # set up mesh to be indexed into
         msize = len(self.mesh)
         mtag = self.tag
-        miter = self.mesh.iter_ve()
+        ves = self.mesh._ve_handles()
         if isinstance(key, _INTEGRAL_TYPES):
             if key >= msize:
                 raise IndexError("key index {0} greater than the size of the "
                                  "mesh {1}".format(key, msize))
-            for i_ve in zip(range(key+1), miter):
-                pass
-            mtag[i_ve[1]] = value if tsize == 1 else value[0]
+            mtag[ves[key]] = value if tsize == 1 else value[0]
         elif isinstance(key, slice):
-            key = list(miter)[key]
+            key = ves[key]
             v = np.empty((len(key), tsize), self.tag.type)
             if tsize == 1 and len(value.shape) == 1:
                 v.shape = (len(key), )
@@ -421,14 +473,13 @@ class IMeshTag(Tag):
             if len(key) != msize:
                 raise KeyError("boolean mask must match the length "
                                "of the mesh.")
-            key = [ve for b, ve in zip(key, miter) if b]
+            key = [ves[i] for i in np.flatnonzero(key)]
             v = np.empty((len(key), tsize), self.tag.type)
             if tsize == 1 and len(value.shape) == 1:
                 v.shape = (len(key), )
             v[...] = value
             mtag[key] = v
         elif isinstance(key, Iterable):
-            ves = list(miter)
             if tsize != 1 and len(value) != len(key):
                 v = np.empty((len(key), tsize), self.tag.type)
                 v[...] = value
@@ -439,31 +490,50 @@ class IMeshTag(Tag):
                             "or fancy index.".format(key))
 
     def __delitem__(self, key):
-        m = self.mesh.mesh
         size = len(self.mesh)
         mtag = self.tag
-        miter = self.mesh.iter_ve()
+        ves = self.mesh._ve_handles()
         if isinstance(key, _INTEGRAL_TYPES):
             if key >= size:
                 raise IndexError("key index {0} greater than the size of the "
                                  "mesh {1}".format(key, size))
-            for i_ve in zip(range(key+1), miter):
-                pass
-            del mtag[i_ve[1]]
+            del mtag[ves[key]]
         elif isinstance(key, slice):
-            del mtag[list(miter)[key]]
+            del mtag[ves[key]]
         elif isinstance(key, np.ndarray) and key.dtype == np.bool:
             if len(key) != size:
                 raise KeyError("boolean mask must match the "
                                "length of the mesh.")
-            del mtag[[ve for b, ve in zip(key, miter) if b]]
+            del mtag[[ves[i] for i in np.flatnonzero(key)]]
         elif isinstance(key, Iterable):
-            ves = list(miter)
             del mtag[[ves[i] for i in key]]
         else:
             raise TypeError("{0} is not an int, slice, mask, "
                             "or fancy index.".format(key))
 
+    def get_all(self):
+        """Returns the values of this tag on every volume element, in mesh
+        order, with a single iMesh call.
+        """
+        return self.tag[self.mesh._ve_handles()]
+
+    def set_all(self, value):
+        """Sets the values of this tag on every volume element with a single
+        iMesh call.
+
+        Parameters
+        ----------
+        value : array-like
+            Either one value per volume element, with shape (len(mesh),) or
+            (len(mesh), size), or a single value to broadcast.
+
+        """
+        ves = self.mesh._ve_handles()
+        shape = (len(ves),) if self.size == 1 else (len(ves), self.size)
+        v = np.empty(shape, self.tag.type)
+        v[...] = value
+        self.tag[ves] = v
+
     def expand(self):
         """This function creates a group of scalar tags from a vector tag. For
         a vector tag named <tag_name> of length N, scalar tags in the form:
@@ -478,7 +548,7 @@ class IMeshTag(Tag):
             data = [x[j] for x in self[:]]
             tag = self.mesh.mesh.createTag("{0}_{1:03d}".format(self.name, j),
                                            1, self.dtype)
-            tag[list(self.mesh.iter_ve())] = data
+            tag[self.mesh._ve_handles()] = data
 
 
 class ComputedTag(Tag):
@@ -559,6 +629,318 @@ class ComputedTag(Tag):
         raise AttributeError(msg)
 
 
+class ColumnarMaterials(object):
+    """An array-backed store for the materials of a mesh.  Rather than one
+    Material per volume element, the normalized compositions of all volume
+    elements are the rows of a single mass fraction array whose columns are
+    the sorted nuclides in nucs.  This array is either dense or a
+    scipy.sparse CSR matrix and sits alongside mass, density, and
+    atoms_per_molecule vectors and an object array of metadata dicts.
+    Single rows set on a CSR store are buffered and applied to the matrix
+    together the next time comp is read.
+
+    A Mesh which is given this store tags comp, mass, density,
+    atoms_per_molecule, metadata, mass_density, molecular_mass, and
+    number_density with array operations over it.  Indexing the store
+    returns a new Material for that volume element, so changes to that
+    material are only kept once it is set back on the store.
+    """
+
+    def __init__(self, nucs, comp, mass=None, density=None,
+                 atoms_per_molecule=None, metadata=None):
+        """Parameters
+        ----------
+        nucs : sequence of ints
+            The nuclide ids of the columns of comp.
+        comp : 2D array or scipy.sparse matrix
+            The nuclide masses with a row per volume element.  The rows are
+            normalized and, as for Material, the row sums are used as the
+            mass where mass is not given or negative.
+        mass : float or sequence of floats, optional
+            The mass of each volume element.
+        density : float or sequence of floats, optional
+            The density [g/cc] of each volume element.
+        atoms_per_molecule : float or sequence of floats, optional
+            The number of atoms per molecule of each volume element.
+        metadata : sequence of dicts, optional
+            The metadata of each volume element.
+
+        """
+        nucs = np.asarray(nucs, dtype=int)
+        order = np.argsort(nucs)
+        self.nucs = nucs[order]
+        if sparse.issparse(comp):
+            comp = sparse.csr_matrix(comp, dtype=float)[:, order]
+            rowsum = np.asarray(comp.sum(axis=1)).ravel()
+        else:
+            comp = np.array(comp, dtype=float)[:, order]
+            rowsum = comp.sum(axis=1)
+        n = comp.shape[0]
+        norm = np.where(rowsum == 0.0, 1.0, rowsum)
+        if sparse.issparse(comp):
+            comp = sparse.csr_matrix(sparse.diags(1.0 / norm) * comp)
+        else:
+            comp /= norm[:, np.newaxis]
+        self.comp = comp
+        self.mass = _column_array(mass, n)
+        self.mass[self.mass < 0.0] = rowsum[self.mass < 0.0]
+        self.density = _column_array(density, n)
+        self.atoms_per_molecule = _column_array(atoms_per_molecule, n)
+        self.metadata = np.empty(n, dtype=object)
+        for i in range(n):
+            self.metadata[i] = {} if metadata is None else dict(metadata[i])
+        self._atomic_masses = None
+
+    @classmethod
+    def from_library(cls, mats, n=None, csr=False):
+        """Builds a store from a MaterialLibrary or other mapping whose keys
+        are the volume element indices.
+
+        Parameters
+        ----------
+        mats : MaterialLibrary or dict
+            Maps volume element indices to materials.  Missing indices are
+            given empty materials.
+        n : int, optional
+            The number of volume elements, defaults to len(mats).
+        csr : bool, optional
+            Whether to store the compositions as a CSR matrix rather than a
+            dense array.
+
+        Returns
+        -------
+        colmats : ColumnarMaterials
+            The array-backed store.
+
+        """
+        n = len(mats) if n is None else n
+        mats = [mats[i] if i in mats else Material() for i in range(n)]
+        nucs = sorted(set().union(*[mat.comp.keys() for mat in mats]))
+        col = dict((nuc, j) for j, nuc in enumerate(nucs))
+        rows, cols, fracs = [], [], []
+        for i, mat in enumerate(mats):
+            for nuc, frac in mat.comp.items():
+                rows.append(i)
+                cols.append(col[nuc])
+                fracs.append(frac)
+        comp = sparse.csr_matrix((fracs, (rows, cols)), shape=(n, len(nucs)))
+        if not csr:
+            comp = comp.toarray()
+        return cls(nucs, comp,
+                   mass=[mat.mass for mat in mats],
+                   density=[mat.density for mat in mats],
+                   atoms_per_molecule=[mat.atoms_per_molecule for mat in mats],
+                   metadata=[json.loads(repr(mat.metadata)) for mat in mats])
+
+    def to_library(self):
+        """Converts this store into a MaterialLibrary keyed by the volume
+        element indices.
+        """
+        return MaterialLibrary(dict((i, self[i]) for i in range(len(self))))
+
+    def __len__(self):
+        return len(self.mass)
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __contains__(self, i):
+        return 0 <= i < len(self)
+
+    def __getitem__(self, i):
+        if not isinstance(i, _INTEGRAL_TYPES):
+            raise TypeError("{0} is not an int.".format(i))
+        row = self.comp[i]
+        if sparse.issparse(row):
+            row = row.toarray().ravel()
+        nz = np.nonzero(row)[0]
+        comp = dict(zip(self.nucs[nz].tolist(), row[nz].tolist()))
+        return Material(comp, mass=self.mass[i], density=self.density[i],
+                        atoms_per_molecule=self.atoms_per_molecule[i],
+                        metadata=self.metadata[i])
+
+    def __setitem__(self, i, mat):
+        if not isinstance(i, _INTEGRAL_TYPES):
+            raise TypeError("{0} is not an int.".format(i))
+        if not isinstance(mat, Material):
+            mat = Material(mat)
+        self._add_nucs(mat.comp.keys())
+        row = np.zeros(len(self.nucs))
+        row[np.searchsorted(self.nucs, list(mat.comp.keys()))] = \
+            list(mat.comp.values())
+        self.set_comp(i, row)
+        self.mass[i] = mat.mass
+        self.density[i] = mat.density
+        self.atoms_per_molecule[i] = mat.atoms_per_molecule
+        self.metadata[i] = json.loads(repr(mat.metadata))
+
+    def _add_nucs(self, nucs):
+        """Adds zero columns to the composition array for any nuclides which
+        are not yet in the store.
+        """
+        newnucs = np.setdiff1d(np.asarray(list(nucs), dtype=int), self.nucs)
+        if len(newnucs) == 0:
+            return
+        allnucs = np.union1d(self.nucs, newnucs)
+        cols = np.searchsorted(allnucs, self.nucs)
+        if sparse.issparse(self.comp):
+            comp = self.comp
+            self.comp = sparse.csr_matrix((comp.data, cols[comp.indices],
+                                           comp.indptr),
+                                          shape=(len(self), len(allnucs)))
+        else:
+            comp = np.zeros((len(self), len(allnucs)))
+            comp[:, cols] = self.comp
+            self.comp = comp
+        self.nucs = allnucs
+        self._atomic_masses = None
+
+    @property
+    def comp(self):
+        """The normalized mass fraction array, with a row per volume element
+        and a column per nuclide in nucs.
+        """
+        if len(self._rows) > 0:
+            self._flush_rows()
+        return self._comp
+
+    @comp.setter
+    def comp(self, comp):
+        self._rows = {}
+        self._comp = comp
+
+    def _flush_rows(self):
+        """Replaces the buffered rows of the CSR matrix in a single rebuild."""
+        idx = np.array(sorted(self._rows))
+        rows = sparse.csr_matrix(np.array([self._rows[i] for i in idx]))
+        n = len(self)
+        keep = np.ones(n)
+        keep[idx] = 0.0
+        place = sparse.csr_matrix((np.ones(len(idx)),
+                                   (idx, np.arange(len(idx)))),
+                                  shape=(n, len(idx)))
+        comp = sparse.diags(keep) * self._comp + place * rows
+        comp.eliminate_zeros()
+        self.comp = sparse.csr_matrix(comp)
+
+    def set_comp(self, key, value):
+        """Sets the composition rows selected by key, whose columns are
+        ordered as nucs.  Single rows of a CSR store are buffered, while
+        setting other keys rebuilds the matrix, so this is best done for
+        many rows at once.
+        """
+        if not sparse.issparse(self._comp):
+            self._comp[key] = value
+        elif isinstance(key, _INTEGRAL_TYPES):
+            row = np.zeros(len(self.nucs))
+            row[...] = value
+            self._rows[key % len(self)] = row
+        else:
+            comp = self.comp.tolil()
+            comp[key] = value
+            self.comp = comp.tocsr()
+
+    @property
+    def atomic_masses(self):
+        """The atomic masses of nucs."""
+        if self._atomic_masses is None:
+            self._atomic_masses = np.array([data.atomic_mass(nuc)
+                                            for nuc in self.nucs])
+        return self._atomic_masses
+
+    def mass_density(self, key=slice(None)):
+        """Returns the mass densities of the volume elements selected by key,
+        see Material.mass_density().
+        """
+        return self.density[key]
+
+    def molecular_mass(self, key=slice(None)):
+        """Returns the molecular masses of the volume elements selected by
+        key, see Material.molecular_mass().
+        """
+        inverse_a = self.comp[key].dot(1.0 / self.atomic_masses)
+        if sparse.issparse(self.comp) and isinstance(key, _INTEGRAL_TYPES):
+            inverse_a = inverse_a[0]
+        apm = self.atoms_per_molecule[key]
+        atsperm = np.where(0.0 <= apm, apm, 1.0)
+        with np.errstate(divide='ignore'):
+            mw = np.where(inverse_a == 0.0, 0.0, atsperm / inverse_a)
+        return mw[()]
+
+    def number_density(self, key=slice(None)):
+        """Returns the number densities [atoms/cc] of the volume elements
+        selected by key, see Material.number_density().
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.density[key] * data.N_A * \
+                self.atoms_per_molecule[key] / self.molecular_mass(key)
+
+    def write_hdf5(self, filename, datapath="/materials", nucpath="/nucid",
+                   chunksize=10000):
+        """Writes this store to an HDF5 file in the MaterialLibrary layout,
+        with the volume element indices as the material names.
+
+        Parameters
+        ----------
+        filename : str
+            A path to an HDF5 file.
+        datapath : str, optional
+            The path in the heirarchy to the data table in an HDF5 file.
+        nucpath : str, optional
+            The path in the heirarchy to the nuclide array in an HDF5 file.
+        chunksize : int, optional
+            The number of materials converted and written at a time.
+
+        """
+        with tb.open_file(filename, 'a') as f:
+            if nucpath not in f:
+                nucgrp, nucdsname = os.path.split(nucpath)
+                f.create_array(nucgrp, nucdsname,
+                               self.nucs.astype(np.int32), createparents=True)
+        for start in range(0, len(self), chunksize):
+            stop = min(start + chunksize, len(self))
+            lib = MaterialLibrary(dict((i, self[i])
+                                       for i in range(start, stop)))
+            lib.write_hdf5(filename, datapath=datapath, nucpath=nucpath,
+                           chunksize=chunksize)
+
+
+def _column_array(value, n):
+    col = np.empty(n, dtype=float)
+    col[...] = -1.0 if value is None else value
+    return col
+
+
+def _column_key(key, size):
+    """Converts a tag key into an index into the arrays of a
+    ColumnarMaterials store.
+    """
+    if isinstance(key, _INTEGRAL_TYPES):
+        if key >= size:
+            raise IndexError("key index {0} greater than the size of the "
+                             "mesh {1}".format(key, size))
+        return key
+    elif isinstance(key, slice):
+        return key
+    elif isinstance(key, np.ndarray) and key.dtype == np.bool:
+        if len(key) != size:
+            raise KeyError("boolean mask must match the length "
+                           "of the mesh.")
+        return key
+    elif isinstance(key, Iterable):
+        return np.asarray(list(key), dtype=int)
+    else:
+        raise TypeError("{0} is not an int, slice, mask, "
+                        "or fancy index.".format(key))
+
+
+def _metadata(mats, i):
+    """Returns the metadata of the ith material in mats."""
+    if isinstance(mats, ColumnarMaterials):
+        return mats.metadata[i]
+    return mats[i].metadata
+
+
 class MeshError(Exception):
     """Errors related to instantiating mesh objects and utilizing their methods.
     """
@@ -584,7 +966,7 @@ class Mesh(object):
 
     def __init__(self, mesh=None, structured=False,
                  structured_coords=None, structured_set=None,
-                 structured_ordering='xyz', mats=()):
+                 structured_ordering='xyz', mats=(), columnar=False):
         """Parameters
         ----------
         mesh : iMesh instance or str, optional
@@ -601,9 +983,13 @@ class Mesh(object):
         structured_ordering : str, optional
             A three character string denoting the iteration order of the mesh
             (e.g. 'xyz', meaning z changest fastest, then y, then x.)
-        mats : MaterialLibrary or dict or Materials or None, optional
+        mats : MaterialLibrary, dict, ColumnarMaterials, or None, optional
             This is a mapping of volume element handles to Material objects.
             If mats is None, then no empty materials are created for the mesh.
+        columnar : bool, optional
+            Whether to convert mats into a ColumnarMaterials store, whose
+            material tags are array operations rather than per volume element
+            Material lookups.
 
             Unstructured mesh instantiation:
                  - From iMesh instance by specifying: <mesh>
@@ -628,6 +1014,8 @@ class Mesh(object):
             stored in self.dims.
 
         """
+        self._ves = None
+        self._nves = None
         if mesh is None:
             self.mesh = iMesh.Mesh()
         elif isinstance(mesh, basestring):
@@ -714,7 +1102,7 @@ class Mesh(object):
             if mats_in_mesh_file:
                 mats = MaterialLibrary(mesh)
 
-        if mats is None:
+        if mats is None or isinstance(mats, ColumnarMaterials):
             pass
         elif len(mats) == 0 and not mats_in_mesh_file:
             mats = MaterialLibrary()
@@ -724,18 +1112,26 @@ class Mesh(object):
         self.mats = mats
 
         # tag with volume id and ensure mats exist.
-        ves = list(self.iter_ve())
+        ves = self._ve_handles()
         tags = self.mesh.getAllTags(ves[0])
         tags = set(tag.name for tag in tags)
         if 'idx' in tags:
             tag_idx = self.mesh.getTagHandle('idx')
         else:
             tag_idx = self.mesh.createTag('idx', 1, int)
-        for i, ve in enumerate(ves):
-            tag_idx[ve] = i
-            if mats is not None and i not in mats:
-                mats[i] = Material()
-        self._len = i + 1
+        columnar_mats = isinstance(mats, ColumnarMaterials)
+        if columnar_mats and len(mats) != len(ves):
+            raise MeshError("ColumnarMaterials has {0} materials for {1} "
+                            "volume elements".format(len(mats), len(ves)))
+        tag_idx[ves] = np.arange(len(ves))
+        if mats is not None and not columnar_mats:
+            for i in range(len(ves)):
+                if i not in mats:
+                    mats[i] = Material()
+        if columnar and mats is not None and not columnar_mats:
+            mats = ColumnarMaterials.from_library(mats, len(self))
+            self.mats = mats
+            columnar_mats = True
 
         # Default tags
         self.tags = {}
@@ -743,8 +1139,12 @@ class Mesh(object):
             # metadata tags, these should come first so they don't accidentally
             # overwite hard coded tag names.
             metatagnames = set()
-            for mat in mats.values():
-                metatagnames.update(mat.metadata.keys())
+            if columnar_mats:
+                for metadata in mats.metadata:
+                    metatagnames.update(metadata.keys())
+            else:
+                for mat in mats.values():
+                    metatagnames.update(mat.metadata.keys())
             for name in metatagnames:
                 setattr(self, name, MetadataTag(mesh=self, name=name))
         # iMesh.Mesh() tags
@@ -755,31 +1155,42 @@ class Mesh(object):
             setattr(self, name, IMeshTag(mesh=self, name=name))
         if mats is not None:
             # Material property tags
-            self.atoms_per_molecule = MaterialPropertyTag(mesh=self,
+            if columnar_mats:
+                PropertyTag = ColumnarPropertyTag
+                compdoc = ('normalized mass fractions of the nuclides in '
+                           'mats.nucs')
+            else:
+                PropertyTag = MaterialPropertyTag
+                compdoc = ('normalized composition mapping from nuclides to '
+                           'mass fractions')
+            self.atoms_per_molecule = PropertyTag(mesh=self,
                                       name='atoms_per_molecule',
                                       doc='Number of atoms per molecule')
-            self.metadata = MaterialPropertyTag(mesh=self, name='metadata',
+            self.metadata = PropertyTag(mesh=self, name='metadata',
                             doc='metadata attributes, stored on the material')
-            self.comp = MaterialPropertyTag(mesh=self, name='comp',
-                        doc='normalized composition mapping from nuclides to '
-                            'mass fractions')
-            self.mass = MaterialPropertyTag(mesh=self, name='mass',
-                                            doc='the mass of the material')
-            self.density = MaterialPropertyTag(mesh=self, name='density',
-                                               doc='the density [g/cc]')
+            self.comp = PropertyTag(mesh=self, name='comp', doc=compdoc)
+            self.mass = PropertyTag(mesh=self, name='mass',
+                                    doc='the mass of the material')
+            self.density = PropertyTag(mesh=self, name='density',
+                                       doc='the density [g/cc]')
             # Material method tags
             methtagnames = ('expand_elements', 'mass_density',
                             'molecular_mass', 'mult_by_mass',
                             'number_density', 'sub_act', 'sub_fp',
                             'sub_lan', 'sub_ma', 'sub_tru', 'to_atom_frac')
+            columnarmethtagnames = ('mass_density', 'molecular_mass',
+                                    'number_density')
             for name in methtagnames:
                 doc = "see Material.{0}() for more information".format(name)
-                setattr(self, name, MaterialMethodTag(mesh=self, name=name,
-                        doc=doc))
+                if columnar_mats and name in columnarmethtagnames:
+                    MethodTag = ColumnarMethodTag
+                else:
+                    MethodTag = MaterialMethodTag
+                setattr(self, name, MethodTag(mesh=self, name=name, doc=doc))
 
 
     def __len__(self):
-        return self._len
+        return len(self._ve_handles())
 
     def __iter__(self):
         """Iterates through the mesh and at each step yield the volume element
@@ -787,10 +1198,10 @@ class Mesh(object):
         """
         mats = self.mats
         if mats is None:
-            for i, ve in enumerate(self.iter_ve()):
+            for i, ve in enumerate(self._ve_handles()):
                 yield i, None, ve
         else:
-            for i, ve in enumerate(self.iter_ve()):
+            for i, ve in enumerate(self._ve_handles()):
                 yield i, mats[i], ve
 
     def iter_ve(self):
@@ -801,6 +1212,24 @@ class Mesh(object):
         else:
             return self.mesh.iterate(iBase.Type.region, iMesh.Topology.all)
 
+    def _ve_handles(self):
+        """Returns the cached list of volume element handles, in the order
+        of iter_ve().  The list is rebuilt whenever the number of volume
+        elements on the underlying iMesh instance has changed.
+        """
+        nves = self.mesh.getNumOfType(iBase.Type.region)
+        if self._ves is None or nves != self._nves:
+            self._ves = list(self.iter_ve())
+            self._nves = nves
+        return self._ves
+
+    def reset_ve_cache(self):
+        """Drops the cached volume element handles used for tag indexing.
+        Call this after replacing volume elements on the underlying iMesh
+        instance without changing their number.
+        """
+        self._ves = None
+
     def __contains__(self, i):
         return i < len(self)
 
@@ -811,6 +1240,9 @@ class Mesh(object):
             kwargs['mesh'] = self if kwargs['mesh'] is None else kwargs['mesh']
             kwargs['name'] = name if kwargs['name'] is None else kwargs['name']
             value = type(value)(**kwargs)
+        elif name == 'structured_ordering':
+            # the volume element order changes with the iteration order
+            super(Mesh, self).__setattr__('_ves', None)
         super(Mesh, self).__setattr__(name, value)
 
     def tag(self, name, value=None, tagtype=None, doc=None, size=None,
@@ -1191,13 +1623,21 @@ class Mesh(object):
             material each cell is made of.
 
         """
+        bounds = _cell_fracs_bounds(cell_fracs, len(self))
+        # volume elements with the same cells and volume fractions share the
+        # same mixture, so it is only computed once.
+        mixes = {}
         for i in range(len(self)):
-            mat_col = {}  # Collection of materials in the ith ve.
-            for row in cell_fracs[cell_fracs['idx'] == i]:
-                mat_col[cell_mats[row['cell']]] = row['vol_frac']
-
-            mixed = MultiMaterial(mat_col)
-            self.mats[i] = mixed.mix_by_volume()
+            rows = cell_fracs[bounds[i]:bounds[i + 1]]
+            signature = (tuple(rows['cell']), tuple(rows['vol_frac']))
+            mixed = mixes.get(signature, None)
+            if mixed is None:
+                mat_col = {}  # Collection of materials in the ith ve.
+                for row in rows:
+                    mat_col[cell_mats[row['cell']]] = row['vol_frac']
+                mixed = MultiMaterial(mat_col).mix_by_volume()
+                mixes[signature] = mixed
+            self.mats[i] = copy.deepcopy(mixed)
 
     def tag_cell_fracs(self, cell_fracs):
         """This function uses the output from dagmc.discretize_geom() and
@@ -1224,15 +1664,11 @@ class Mesh(object):
         """
 
         num_vol_elements = len(self)
+        bounds = _cell_fracs_bounds(cell_fracs, num_vol_elements)
         # Find the maximum cell number in a voxel
-        max_num_cells = -1
-        for i in range(num_vol_elements):
-            max_num_cells = max(max_num_cells,
-                                len(cell_fracs[cell_fracs['idx'] == i]))
+        max_num_cells = int(np.diff(bounds).max())
 
         # create tag frame with default value
-        cell_largest_frac_number = [-1] * num_vol_elements
-        cell_largest_frac = [0.0] * num_vol_elements
         voxel_cell_number = np.empty(shape=(num_vol_elements, max_num_cells),
                                      dtype=int)
         voxel_cell_fracs = np.empty(shape=(num_vol_elements, max_num_cells),
@@ -1240,17 +1676,17 @@ class Mesh(object):
         voxel_cell_number.fill(-1)
         voxel_cell_fracs.fill(0.0)
 
-        # set the data
-        for i in range(num_vol_elements):
-            for (cell, row) in enumerate(cell_fracs[cell_fracs['idx'] == i]):
-                voxel_cell_number[i, cell] = row['cell']
-                voxel_cell_fracs[i, cell] = row['vol_frac']
-            # cell_largest_frac_tag
-            cell_largest_frac[i] = max(voxel_cell_fracs[i, :])
-            largest_index = \
-                    list(voxel_cell_fracs[i, :]).index(cell_largest_frac[i])
-            cell_largest_frac_number[i] = \
-                    int(voxel_cell_number[i, largest_index])
+        # set the data, each row goes to its position within its voxel
+        rows = cell_fracs[bounds[0]:bounds[-1]]
+        idx = rows['idx']
+        cell = np.arange(bounds[0], bounds[-1]) - bounds[idx]
+        voxel_cell_number[idx, cell] = rows['cell']
+        voxel_cell_fracs[idx, cell] = rows['vol_frac']
+        # cell_largest_frac_tag
+        largest_index = np.argmax(voxel_cell_fracs, axis=1)
+        ves = np.arange(num_vol_elements)
+        cell_largest_frac = voxel_cell_fracs[ves, largest_index]
+        cell_largest_frac_number = voxel_cell_number[ves, largest_index]
 
         # create the tags
         self.tag(name='cell_number', value=voxel_cell_number,
@@ -1270,6 +1706,14 @@ class Mesh(object):
                  size=1, dtype=float)
 
 
+def _cell_fracs_bounds(cell_fracs, num_vol_elements):
+    """Returns the array of num_vol_elements + 1 offsets into the sorted
+    cell_fracs array such that the rows of volume element i are
+    cell_fracs[bounds[i]:bounds[i + 1]].
+    """
+    return np.searchsorted(cell_fracs['idx'], np.arange(num_vol_elements + 1))
+
+
 ######################################################
 # private helper functions for structured mesh methods
 ######################################################
@@ -8,9 +8,12 @@ from cython.operator cimport dereference as deref
 from cython.operator cimport preincrement as inc
 #from cython cimport pointer
 from libcpp.string cimport string as std_string
+from libcpp.vector cimport vector
+cimport numpy as np
 
 # Python imports
 #from collections import Iterable
+import numpy as np
 
 # local imports
 cimport pyne.cpp_utils
@@ -19,6 +22,8 @@ import pyne.pyne_config
 
 from pyne cimport cpp_nucname
 cimport pyne.stlcontainers as conv
+
+np.import_array()
 import pyne.stlcontainers as conv
 
 #
@@ -882,6 +887,87 @@ def ensdf_to_id(nuc):
         return cpp_nucname.ensdf_to_id(<char *> nuc_bytes)
     else:
         raise NucTypeError(nuc)
+
+
+#
+# Array Functions
+#
+
+_STR_FORMS = frozenset(['name', 'zzllaaam', 'fluka', 'serpent', 'nist',
+                        'alara'])
+
+def convert_array(func, nucs):
+    """
+    Applies one of the nuclide conversion functions in this module to every
+    nuclide in an array in a single C++ loop.  Each distinct nuclide is
+    converted only once, so this is much faster than calling the function
+    per nuclide on large arrays with few distinct values.
+
+    Parameters
+    ----------
+    func : str
+        Name of the conversion function, e.g. 'id', 'name', 'zzaaam',
+        'mcnp', 'serpent' or 'alara_to_id'.
+    nucs : array_like of int or str
+        Input nuclides, as an integer array or a sequence of strings.
+
+    Returns
+    -------
+    newnucs : ndarray
+        Output nuclides with the same shape as nucs, of dtype int32 or, for
+        the string forms, of unicode strings.  Unlike the scalar functions,
+        state_id_to_id and id_to_state_id give -1 where no value is found.
+
+    Raises
+    ------
+    ValueError
+        If there is no function func for this type of input.
+
+    """
+    cdef np.ndarray arr = np.asarray(nucs)
+    cdef np.ndarray out
+    shape = arr.shape
+    cdef vector[std_string] forms
+    cdef std_string cpp_func = func.encode()
+    cdef int n = arr.size
+    cdef int itemsize
+    cdef char * strs
+    cdef int * ints
+    cdef int * outptr
+    if arr.dtype.kind == 'O':
+        if all(isinstance(nuc, basestring) for nuc in arr.flat):
+            arr = arr.astype('U')
+        elif all(isinstance(nuc, int) or isinstance(nuc, long)
+                 for nuc in arr.flat):
+            arr = arr.astype(np.int32)
+        else:
+            raise NucTypeError(nucs)
+    if n == 0:
+        arr = arr.astype(np.int32)
+    if arr.dtype.kind == 'U':
+        arr = np.char.encode(arr)
+    out = np.empty(n, dtype=np.int32)
+    outptr = <int *> np.PyArray_DATA(out)
+    if arr.dtype.kind == 'S':
+        arr = np.ascontiguousarray(arr)
+        strs = <char *> np.PyArray_DATA(arr)
+        itemsize = arr.itemsize
+        if func in _STR_FORMS:
+            cpp_nucname.convert(cpp_func, n, strs, itemsize, forms, outptr)
+        else:
+            cpp_nucname.convert(cpp_func, n, strs, itemsize, outptr)
+    elif arr.dtype.kind in 'iu':
+        arr = np.ascontiguousarray(arr, dtype=np.int32)
+        ints = <int *> np.PyArray_DATA(arr)
+        if func in _STR_FORMS:
+            cpp_nucname.convert(cpp_func, n, ints, forms, outptr)
+        else:
+            cpp_nucname.convert(cpp_func, n, ints, outptr)
+    else:
+        raise NucTypeError(nucs)
+    if func in _STR_FORMS:
+        out = np.array([form.decode() for form in forms], dtype='U')[out]
+    return out.reshape(shape)
 #
 # C++ Helper Functions
 #
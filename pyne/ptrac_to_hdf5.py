@@ -24,6 +24,8 @@ def main():
             help="title of the HDF5 table (default is \"Ptrac data\")")
     argparser.add_argument("-s", "--show-progress", action="store_true",
             help="show progress indicator")
+    argparser.add_argument("-c", "--chunk-size", type=int, default=64,
+            help="megabytes of the PTRAC file to convert at a time (default is 64)")
     args = argparser.parse_args()
 
     ptrac_filename = args.ptrac_file
@@ -42,7 +44,8 @@ def main():
     else:
         table = h5file.create_table("/", table_name, mcnp.PtracEvent, table_title)
 
-    ptrac.write_to_hdf5_table(table, print_progress=print_progress)
+    ptrac.write_to_hdf5_table(table, print_progress=print_progress,
+                              chunksize=args.chunk_size * 2**20)
 
     table.flush()
     h5file.close()
@@ -10,6 +10,7 @@
 """
 cimport dtypes
 cimport numpy as np
+from libc.stdint cimport uint64_t
 from libc.stdlib cimport free
 from libc.string cimport memcpy
 from libcpp cimport bool as cpp_bool
@@ -250,6 +251,7 @@ cdef class Sampler:
     normalize_pdf
     num_groups
     particle_birth
+    particle_birth_many
     read_bias_pdf
     sample_e
     sample_w
@@ -346,8 +348,9 @@ cdef class Sampler:
                 e_bounds_proxy,
                 <bint> uniform)
 
-    def _sampler_sampler_2(self, filename, tag_names, e_bounds, mode):
-        """Sampler(self, filename, tag_names, e_bounds, mode)
+    def _sampler_sampler_2(self, filename, tag_names, e_bounds, mode,
+                           cache_file=None):
+        """Sampler(self, filename, tag_names, e_bounds, mode, cache_file=None)
         
         Constuctor for overall Sampler
         
@@ -359,6 +362,14 @@ cdef class Sampler:
         
         e_bounds : std::vector< double >
         
+        mode : int
+
+        cache_file : std::string, optional
+            Sidecar file caching the alias table, edge points, birth weights
+            and energy bounds.  It is read instead of the mesh when it matches
+            the mesh contents and the other arguments, and is written
+            otherwise.  By default nothing is cached.
+
         Returns
         -------
         None
@@ -374,11 +385,15 @@ cdef class Sampler:
         # convert e_bounds
         cdef cpp_vector[double] e_bounds_proxy = convert_nparray_to_vector(e_bounds)
         # construct sampler
+        if cache_file is None:
+            cache_file = ""
+        cache_file_bytes = cache_file.encode()
         self._inst = new cpp_source_sampling.Sampler(
                 std_string(<char *> filename_bytes),
                 <cpp_map[std_string, std_string]> cpp_tag_names,
                 <cpp_vector[double]> e_bounds_proxy,
-                <int> mode)
+                <int> mode,
+                std_string(<char *> cache_file_bytes))
 
     
     _sampler_sampler_0_argtypes = frozenset(((0, str),
@@ -401,10 +416,12 @@ cdef class Sampler:
                                              (1, dict),
                                              (2, np.ndarray),
                                              (3, int),
+                                             (4, str),
                                              ("filename", str),
                                              ("tag_names", dict),
                                              ("e_bounds",  np.ndarray),
-                                             ("mode", int)))
+                                             ("mode", int),
+                                             ("cache_file", str)))
     
     def __init__(self, *args, **kwargs):
         """Sampler(self, filename, src_tag_name, e_bounds, uniform)
@@ -463,6 +480,12 @@ cdef class Sampler:
             free(self._inst)
 
     # attributes
+    property setup_times:
+        """Wall clock seconds spent in each stage of setup, keyed by "load",
+        "geom", "tags", and "total"."""
+        def __get__(self):
+            times = (<cpp_source_sampling.Sampler *> self._inst).setup_times
+            return dict((key.decode(), value) for key, value in times.items())
 
     # methods
     def particle_birth(self, rands):
@@ -502,6 +525,52 @@ cdef class Sampler:
         return SourceParticle(c_src.get_x(), c_src.get_y(), c_src.get_z(), \
                 c_src.get_e(), c_src.get_w(), c_src.get_c())
 
+    def particle_birth_many(self, n, seed, start=0):
+        """particle_birth_many(self, n, seed, start=0)
+        Samples the birth parameters of many particles in one call, filling
+        contiguous arrays.  The random numbers are drawn from a counter-based
+        generator so that particle i of a stream is the same no matter how
+        the stream is split between calls.  The GIL is released while
+        sampling.
+
+        Parameters
+        ----------
+        n : int
+            The number of particles to sample.
+        seed : int
+            The non-negative seed of the random number stream.
+        start : int, optional
+            The index of the first particle within the stream.
+
+        Returns
+        -------
+        x, y, z, e, w : 1D arrays of float64
+            The positions, energies and weights of the particles.
+        c : 1D array of int32
+            The cell numbers of the particles, -1 if not sampling subvoxels.
+
+        """
+        cdef int n_proxy = n
+        cdef uint64_t seed_proxy = seed
+        cdef uint64_t start_proxy = start
+        x = np.empty(n, dtype=np.float64)
+        y = np.empty(n, dtype=np.float64)
+        z = np.empty(n, dtype=np.float64)
+        e = np.empty(n, dtype=np.float64)
+        w = np.empty(n, dtype=np.float64)
+        c = np.empty(n, dtype=np.int32)
+        cdef double* xptr = <double*> np.PyArray_DATA(x)
+        cdef double* yptr = <double*> np.PyArray_DATA(y)
+        cdef double* zptr = <double*> np.PyArray_DATA(z)
+        cdef double* eptr = <double*> np.PyArray_DATA(e)
+        cdef double* wptr = <double*> np.PyArray_DATA(w)
+        cdef int* cptr = <int*> np.PyArray_DATA(c)
+        with nogil:
+            (<cpp_source_sampling.Sampler *> self._inst).particle_birth_many(
+                n_proxy, seed_proxy, xptr, yptr, zptr, eptr, wptr, cptr,
+                start_proxy)
+        return x, y, z, e, w, c
+
 
 cdef class SourceParticle:
     """Constructor for class SourceParticle
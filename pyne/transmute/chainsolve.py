@@ -5,11 +5,12 @@
 """
 from __future__ import division
 from warnings import warn
+from multiprocessing import Pool
 from pyne.utils import QAWarning
 
 import numpy as np
 from scipy import linalg
-#from scipy import sparse  # <-- SPARSE
+from scipy import sparse
 
 from pyne import utils
 from pyne import data
@@ -23,11 +24,13 @@ from pyne.xs.channels import sigma_a
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
+_EPS = np.finfo(float).eps
+
 class Transmuter(object):
     """A class for transmuting materials using an ALARA-like chain solver."""
 
     def __init__(self, t=0.0, phi=0.0, temp=300.0, tol=1e-7, rxs=None, log=None, 
-                 *args, **kwargs):
+                 fast=False, *args, **kwargs):
         """Parameters
         ----------
         t : float
@@ -46,6 +49,11 @@ class Transmuter(object):
         log : file-like or None
             The log file object should be written. A None imples the log is 
             not desired.
+        fast : bool, optional
+            If True, chains are solved with the analytic Bateman solution,
+            updated incrementally along each chain, rather than by taking
+            the dense matrix exponential at every node of the traversal.
+            Nearly degenerate chains fall back to the dense solution.
         args : tuple, optional
             Other arguments ignored for compatibility with other Transmuters.
         kwargs : dict, optional
@@ -58,6 +66,7 @@ class Transmuter(object):
         self.xscache = XSCache(group_struct=gs, data_sources=(eafds, NullDataSource,))
 
         self.t = t
+        self.fast = fast
         self._phi = None
         self.phi = phi
         self.temp = temp
@@ -71,9 +80,32 @@ class Transmuter(object):
                    'z_2na', 'np', 'np_1', 'np_2', 'n2a', 'nd', 'nd_1', 'nd_2', 
                    'nt', 'nt_1', 'nt_2', 'nHe3', 'nHe3_1', 'nHe3_2','z_4n', 
                    'z_4n_1', 'n', 'n_1', 'n_2', 'z_3np']
+        self.rxs = rxs
+
+    @property
+    def temp(self):
+        return self._temp
+
+    @temp.setter
+    def temp(self, temp):
+        """Clears the memoized rates, which depend on the temperature."""
+        self._temp = temp
+        self._reset_caches()
+
+    @property
+    def rxs(self):
+        return self._rxs
+
+    @rxs.setter
+    def rxs(self, rxs):
+        """Stores the reaction ids, less fission, as a frozenset so that they
+        may only be changed through this setter, and clears the memoized
+        rates.
+        """
         rxs = set([rxname.id(rx) for rx in rxs])
         rxs.discard(rxname.id('fission'))
-        self.rxs = rxs
+        self._rxs = frozenset(rxs)
+        self._reset_caches()
 
     @property
     def phi(self):
@@ -82,6 +114,17 @@ class Transmuter(object):
     @phi.setter
     def phi(self, flux):
         """Ensures that the flux is correctly formatted."""
+        flux = self._format_phi(flux)
+        for ds in self.xscache.data_sources:
+            ds.src_phi_g = flux
+        self.xscache['phi_g'] = np.array([flux.sum()])
+        self._phi = flux
+        self._reset_caches()
+
+    def _format_phi(self, flux):
+        """Returns the flux as a 175 group EAF flux vector, raising a
+        ValueError if it is not correctly formatted.
+        """
         flux = np.asarray(flux)
         if flux.ndim == 0:
             _ = np.empty(175, float)
@@ -93,10 +136,17 @@ class Transmuter(object):
             raise ValueError("The flux vector must be 0- or 1-dimensional.")
         if not np.all(flux >= 0.0):
             raise ValueError("Flux entries must be non-negative.")
-        for ds in self.xscache.data_sources:
-            ds.src_phi_g = flux
-        self.xscache['phi_g'] = np.array([flux.sum()])
-        self._phi = flux
+        return flux
+
+    def _reset_caches(self):
+        """Clears the memoized destruction rates, production rates, and
+        unit-density partial solutions.  These all depend on the flux,
+        temperature, and reactions and must be recomputed when they change.
+        """
+        self._dest_cache = {}
+        self._prod_cache = {}
+        self._partial_cache = {}
+        self._partial_key = None
 
     def transmute(self, x, t=None, phi=None, tol=None, log=None, *args, **kwargs):
         """Transmutes a material into its daughters.
@@ -138,7 +188,7 @@ class Transmuter(object):
         for nuc, adens in x_atoms.items():
             # Find output for root of unit density and scale all output by 
             # actual nuclide density and add to final output.
-            partial = self._transmute_partial(nuc)
+            partial = self._cached_partial(nuc)
             for part_nuc, part_adens in partial.items():
                 y_atoms[part_nuc] = part_adens * adens + y_atoms.get(part_nuc, 0.0)
         mw_x = x.molecular_mass()
@@ -148,6 +198,146 @@ class Transmuter(object):
         y.mass *= x.mass / mw_x 
         return y
 
+    def transmute_many(self, mats, t=None, phi_per_mat=None, tol=None,
+                       processes=None, *args, **kwargs):
+        """Transmutes many materials into their daughters.  The unit-density
+        response of every root nuclide is computed only once per unique flux
+        spectrum and then applied to all materials with that flux as a
+        sparse linear map.
+
+        Parameters
+        ----------
+        mats : sequence of Materials or similar
+            Input materials for transmutation.
+        t : float
+            Transmutations time [sec].
+        phi_per_mat : sequence of floats or arrays of floats, optional
+            The neutron flux [n/cm^2/sec] of each material, each of which
+            must either be a scalar or match the group structure of EAF.
+            If None, the current flux is used for all materials.
+        tol : float
+            Tolerance level for chain truncation.
+        processes : int or None, optional
+            If greater than one, the root nuclide responses are computed in
+            a process pool of this size.  Each worker builds its own
+            Transmuter with the same temperature, reactions, and solver.
+
+        The flux of this Transmuter is restored once all materials have been
+        transmuted, though its cached partial solutions may have been
+        cleared.
+
+        Returns
+        -------
+        ys : list of Materials
+            The output materials post-transmutation, in the order of mats.
+
+        """
+        mats = [x if isinstance(x, Material) else Material(x) for x in mats]
+        if t is not None:
+            self.t = t
+        if tol is not None:
+            self.tol = tol
+        if phi_per_mat is None:
+            phi_per_mat = [self.phi] * len(mats)
+        elif len(phi_per_mat) != len(mats):
+            raise ValueError("There must be one flux per material.")
+
+        # group materials by unique flux spectrum
+        fluxes = {}
+        groups = {}
+        for i, flux in enumerate(phi_per_mat):
+            flux = self._format_phi(flux)
+            key = flux.tobytes()
+            fluxes[key] = flux
+            groups.setdefault(key, []).append(i)
+
+        phi = self.phi
+        pool = None
+        if processes is not None and processes > 1:
+            pool = Pool(processes, initializer=_init_pool,
+                        initargs=(self.temp, self.rxs, self.fast))
+        ys = [None] * len(mats)
+        try:
+            for key, idx in groups.items():
+                if not np.array_equal(self.phi, fluxes[key]):
+                    self.phi = fluxes[key]
+                x_atoms = [mats[i].to_atom_frac() for i in idx]
+                roots = sorted(set().union(*x_atoms))
+                partials = self._partials(roots, pool)
+                # sparse map from root densities to output densities
+                out_nucs = sorted(set().union(*partials))
+                out_idx = dict(zip(out_nucs, range(len(out_nucs))))
+                rows, cols, vals = [], [], []
+                for j, partial in enumerate(partials):
+                    rows.extend([out_idx[nuc] for nuc in partial])
+                    cols.extend([j] * len(partial))
+                    vals.extend(partial.values())
+                M = sparse.csr_matrix((vals, (rows, cols)),
+                                      shape=(len(out_nucs), len(roots)))
+                root_idx = dict(zip(roots, range(len(roots))))
+                rows, cols, vals = [], [], []
+                for k, atoms in enumerate(x_atoms):
+                    rows.extend([root_idx[nuc] for nuc in atoms])
+                    cols.extend([k] * len(atoms))
+                    vals.extend(atoms.values())
+                X = sparse.csc_matrix((vals, (rows, cols)),
+                                      shape=(len(roots), len(idx)))
+                Y = sparse.csc_matrix(M * X)
+                for k, i in enumerate(idx):
+                    x = mats[i]
+                    start, stop = Y.indptr[k], Y.indptr[k+1]
+                    y_atoms = dict(zip([out_nucs[n] for n in Y.indices[start:stop]],
+                                       Y.data[start:stop]))
+                    mw_x = x.molecular_mass()
+                    y = from_atom_frac(y_atoms,
+                                       atoms_per_molecule=x.atoms_per_molecule)
+                    y.mass *= x.mass / mw_x
+                    ys[i] = y
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            if not np.array_equal(self.phi, phi):
+                self.phi = phi
+        return ys
+
+    def _partials(self, roots, pool=None):
+        """Returns the unit-density partial solutions for many root nuclides,
+        computing the ones which are not yet cached in the pool, if given.
+        """
+        if pool is not None and self.log is None:
+            self._check_partial_key()
+            missing = [nuc for nuc in roots if nuc not in self._partial_cache]
+            if len(missing) > 1:
+                args = [(self.t, self.tol, self.phi, nuc) for nuc in missing]
+                self._partial_cache.update(zip(missing,
+                                               pool.map(_pool_partial, args)))
+        return [self._cached_partial(nuc) for nuc in roots]
+
+    def _check_partial_key(self):
+        """Clears the partial solution cache if the time, tolerance,
+        temperature, or solver have changed since it was filled.
+        """
+        key = (self.t, self.tol, self.temp, self.fast)
+        if key != self._partial_key:
+            self._partial_cache = {}
+            self._partial_key = key
+
+    def _cached_partial(self, nuc):
+        """Returns the unit-density partial solution for a root nuclide,
+        reusing the result of previous calls when the time, tolerance, and
+        solver are unchanged.  Results are not cached while logging so that
+        the full tree is always written to the log.
+        """
+        if self.log is not None:
+            return self._transmute_partial(nuc)
+        self._check_partial_key()
+        partial = self._partial_cache.get(nuc, None)
+        if partial is None:
+            partial = self._transmute_partial(nuc)
+            self._partial_cache[nuc] = partial
+        return partial
+
     def _transmute_partial(self, nuc):
         """Core method to transmute a material into its daughters.
         This method assumes that the initial nuclide has unit density.
@@ -166,12 +356,16 @@ class Transmuter(object):
             # what is the coupled?.
         """
         dest = self._get_destruction(nuc)
+        rootval = np.exp(-dest * self.t)
+        partial = {nuc: rootval}
+        if self.fast:
+            terms = (np.array([dest]), np.array([0]), np.array([1.0]))
+            self._bateman_traversal(nuc, [], [dest], terms, partial)
+            return partial
         # DENSE
         A = np.empty((1,1), float)
         A[0, 0] = -dest
         #A = sparse.csr_matrix([[-dest]])  # <-- SPARSE
-        rootval = np.exp(-dest * self.t)
-        partial = {nuc: rootval}
         self._traversal(nuc, A, partial)
         return partial
 
@@ -192,13 +386,55 @@ class Transmuter(object):
             Destruction rate of the nuclide.
 
         """
+        key = (nuc, decay)
+        if key in self._dest_cache:
+            return self._dest_cache[key]
         xscache = self.xscache
         sig_a = sigma_a(nuc, xs_cache=xscache)
         d = utils.from_barns(sig_a[0], 'cm2') * xscache['phi_g'][0]
         if decay and not np.isnan(data.decay_const(nuc)):
             d += data.decay_const(nuc) 
+        self._dest_cache[key] = d
         return d
 
+    def _get_production(self, nuc):
+        """Computes the production rates of all children of a nuclide, from
+        both decay and neutron reactions.  The result is memoized per nuclide.
+
+        Parameters
+        ----------
+        nuc : int
+            Name of the parent nuclide.
+
+        Returns
+        -------
+        prod : dict
+            Keys are child nuclide ids, values are production rates [1/sec].
+
+        """
+        if nuc in self._prod_cache:
+            return self._prod_cache[nuc]
+        phi = self.xscache['phi_g'][0]
+        temp = self.temp
+        xscache = self.xscache
+        prod = {}
+        # decay info
+        lam = data.decay_const(nuc)
+        decay_branches = {} if lam == 0 else self._decay_branches(nuc)
+        for decay_child, branch_ratio in decay_branches.items():
+            prod[decay_child] = lam * branch_ratio
+        # reaction daughters
+        for rx in self.rxs:
+            try:
+                child = rxname.child(nuc, rx)
+            except RuntimeError:
+                continue
+            child_xs = xscache[nuc, rx, temp][0]
+            rr = utils.from_barns(child_xs, 'cm2') * phi  # reaction rate
+            prod[child] = rr + prod.get(child, 0.0)
+        self._prod_cache[nuc] = prod
+        return prod
+
     def _grow_matrix(self, A, prod, dest):
         """Grows the given matrix by one row and one column, adding necessary
         production and destruction rates.
@@ -257,26 +493,9 @@ class Transmuter(object):
         """
         t = self.t
         tol = self.tol
-        phi = self.xscache['phi_g'][0]
-        temp = self.temp
-        xscache = self.xscache
         if self.log is not None:
             self._log_tree(depth, nuc, 1.0)
-        prod = {}
-        # decay info
-        lam = data.decay_const(nuc)
-        decay_branches = {} if lam == 0 else self._decay_branches(nuc)
-        for decay_child, branch_ratio in decay_branches.items():
-            prod[decay_child] = lam * branch_ratio
-        # reaction daughters
-        for rx in self.rxs:
-            try:
-                child = rxname.child(nuc, rx)
-            except RuntimeError:
-                continue
-            child_xs = xscache[nuc, rx, temp][0]
-            rr = utils.from_barns(child_xs, 'cm2') * phi  # reaction rate
-            prod[child] = rr + prod.get(child, 0.0)
+        prod = self._get_production(nuc)
         # Cycle production dictionary
         for child in prod:
             # Grow matrix
@@ -300,6 +519,163 @@ class Transmuter(object):
             if 0.0 < outval:
                 out[child] = outval
 
+    def _bateman_traversal(self, nuc, prods, dests, terms, out, depth=0):
+        """Nuclide transmutation traversal using the analytic Bateman solution.
+
+        Every chain followed by the traversal has a lower bidiagonal matrix,
+        so the number density of the last nuclide in a chain is a sum of
+        terms :math:`c \\, t^k e^{-r t}`, where the powers :math:`k` are only
+        nonzero when a destruction rate :math:`r` repeats in the chain (e.g.
+        on cycles).  The terms of a child follow in closed form from those of
+        its parent, which costs O(n) per node rather than a dense matrix
+        exponential.  Nodes where the sum suffers from catastrophic
+        cancellation, because of nearly degenerate destruction rates, are
+        evaluated with the dense solver instead.
+
+        Parameters
+        ----------
+        nuc : int
+            ID of the active nuclide for the traversal.
+        prods : list of floats
+            Production rates along the current chain, starting with the
+            production of the second nuclide.
+        dests : list of floats
+            Destruction rates along the current chain, starting at the root.
+        terms : tuple of three NumPy 1-dimensional arrays
+            The rates, powers, and coefficients of the terms of the active
+            nuclide's solution.
+        out : dict
+            A dictionary containing the final recorded number densities for each
+            nuclide, modified in place.
+        depth : int
+            Current depth of traversal (root at 0). Should never be provided by user.
+
+        """
+        tol = self.tol
+        if self.log is not None:
+            self._log_tree(depth, nuc, 1.0)
+        for child, p in self._get_production(nuc).items():
+            d = self._get_destruction(child)
+            child_terms = self._bateman_terms(terms, p, d)
+            N, err = self._eval_bateman(child_terms)
+            if err > 1e-6 * max(abs(N), tol):
+                # cancellation is too severe for the sum, fall back
+                N = self._dense_last(self._chain_matrix(prods + [p],
+                                                        dests + [d]))
+            if self.log is not None:
+                self._log_tree(depth+1, child, N)
+            if N > tol:
+                self._bateman_traversal(child, prods + [p], dests + [d],
+                                        child_terms, out, depth=depth+1)
+            outval = N + out.get(child, 0.0)
+            if 0.0 < outval:
+                out[child] = outval
+
+    def _bateman_terms(self, terms, prod, dest):
+        """Computes the Bateman terms of a child nuclide from those of its
+        parent by integrating :math:`p \\int_0^t e^{-d (t-s)} N(s) ds`.
+
+        Parameters
+        ----------
+        terms : tuple of three NumPy 1-dimensional arrays
+            The rates, powers, and coefficients of the parent's solution.
+        prod : float
+            The production rate of the child from the parent.
+        dest : float
+            The destruction rate of the child.
+
+        Returns
+        -------
+        child_terms : tuple of three NumPy 1-dimensional arrays
+            The rates, powers, and coefficients of the child's solution.
+        """
+        rates, powers, coefs = terms
+        a = dest - rates
+        same = np.abs(a) <= 1e-10 * np.maximum(abs(dest), np.abs(rates))
+        simple = ~same & (powers == 0)
+        # repeated rates, the power of the term goes up by one
+        new_rates = [rates[same]]
+        new_powers = [powers[same] + 1]
+        new_coefs = [prod * coefs[same] / (powers[same] + 1)]
+        # distinct rates with power zero, the classic Bateman update
+        simple_coefs = prod * coefs[simple] / a[simple]
+        new_rates.append(rates[simple])
+        new_powers.append(powers[simple])
+        new_coefs.append(simple_coefs)
+        dest_coef = -simple_coefs.sum()
+        # distinct rates with higher powers, integrate by parts
+        for i in np.flatnonzero(~same & (powers > 0)):
+            k = powers[i]
+            pc = prod * coefs[i]
+            ratio = 1.0
+            for m in range(k + 1):
+                if m > 0:
+                    ratio *= (k - m + 1)
+                new_rates.append(rates[i:i+1])
+                new_powers.append(np.array([k - m]))
+                new_coefs.append(np.array([pc * (-1)**m * ratio / a[i]**(m + 1)]))
+            dest_coef -= pc * (-1)**k * ratio / a[i]**(k + 1)
+        new_rates.append(np.array([dest]))
+        new_powers.append(np.array([0]))
+        new_coefs.append(np.array([dest_coef]))
+        rates = np.concatenate(new_rates)
+        powers = np.concatenate(new_powers)
+        coefs = np.concatenate(new_coefs)
+        if len(rates) > len(terms[0]) + 1:
+            # merge terms which share both rate and power
+            keys, inv = np.unique(np.column_stack([rates, powers]), axis=0,
+                                  return_inverse=True)
+            coefs = np.bincount(inv.ravel(), weights=coefs)
+            rates = keys[:, 0]
+            powers = keys[:, 1].astype(int)
+        return rates, powers, coefs
+
+    def _eval_bateman(self, terms):
+        """Evaluates a Bateman solution at the transmutation time.
+
+        Parameters
+        ----------
+        terms : tuple of three NumPy 1-dimensional arrays
+            The rates, powers, and coefficients of the solution.
+
+        Returns
+        -------
+        N : float
+            The number density.
+        err : float
+            An estimate of the round-off error in N.
+        """
+        t = self.t
+        rates, powers, coefs = terms
+        vals = coefs * t**powers * np.exp(-rates * t)
+        return vals.sum(), _EPS * len(vals) * np.abs(vals).sum()
+
+    def _chain_matrix(self, prods, dests):
+        """Builds the lower bidiagonal coupled equation matrix of a chain.
+
+        Parameters
+        ----------
+        prods : list of floats
+            Production rates of the second through last nuclides in the chain.
+        dests : list of floats
+            Destruction rates of all nuclides in the chain.
+
+        Returns
+        -------
+        B : NumPy 2-dimensional array
+            The chain matrix.
+        """
+        n = len(dests)
+        B = np.diag(-np.asarray(dests, dtype=float))
+        B[np.arange(1, n), np.arange(n - 1)] = prods
+        return B
+
+    def _dense_last(self, B):
+        """Returns the number density of the last nuclide in a chain whose
+        root starts at unit density, using the dense matrix exponential.
+        """
+        return linalg.expm(B * self.t)[-1, 0]
+
     def _log_tree(self, depth, nuc, numdens):
         """Logging method to track path of _traversal.
 
@@ -346,3 +722,21 @@ class Transmuter(object):
         for child in children:
             decay_branches[child] = data.branch_ratio(nuc, child)
         return decay_branches
+
+
+_pool_transmuter = None
+
+def _init_pool(temp, rxs, fast):
+    """Initializes a transmute_many() worker process."""
+    global _pool_transmuter
+    _pool_transmuter = Transmuter(temp=temp, rxs=rxs, fast=fast)
+
+def _pool_partial(args):
+    """Computes a unit-density partial solution in a worker process."""
+    t, tol, phi, nuc = args
+    tm = _pool_transmuter
+    tm.t = t
+    tm.tol = tol
+    if not np.array_equal(tm.phi, phi):
+        tm.phi = phi
+    return tm._cached_partial(nuc)
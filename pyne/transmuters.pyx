@@ -4,6 +4,7 @@ from libcpp.vector cimport vector as cpp_vector
 
 # Local imports
 cimport cpp_transmuters
+cimport c_cram
 cimport pyne.stlcontainers as conv
 import pyne.stlcontainers as conv
 from pyne cimport nucname
@@ -50,3 +51,118 @@ def cram(A, n0, int order=14):
     cdef conv._MapIntDouble n1 = conv.MapIntDouble()
     n1.map_ptr = new cpp_map[int, double](cpp_n1)
     return n1
+
+
+def cram_many(A, n0, int order=14):
+    """Batched CRAM solver that takes a (flat) A matrix and many initial
+    nuclide atom fraction vectors and returns the transmuted vectors. The
+    GIL is released while solving.
+
+    Parameters
+    ----------
+    A : 1D array-like
+        The transmutation matrix [unitless]
+    n0 : 2D array-like
+        The initial compositions [atom fraction], with shape
+        (number of vectors, N).  The columns are ordered as the nuclides
+        in pyne.cram.NUCS.
+    order : int, optional
+        The order of approximation, default 14.
+
+    Returns
+    -------
+    n1 : 2D array
+        The result of the transmutation [atom fraction], with the same
+        shape as n0.
+    """
+    if order not in (6, 8, 10, 12, 14, 16, 18):
+        raise ValueError("Order selected not available for CRAM, please use"
+                         " order 6, 8, 10, 12, 14, 16, or 18.")
+    # convert A
+    A = np.asarray(A, dtype=np.float64)
+    if A.ndim != 1 or len(A) != c_cram.pyne_cram_transmute_info.nnz:
+        raise ValueError("A must be a flat matrix with {0} entries.".format(
+                         c_cram.pyne_cram_transmute_info.nnz))
+    cdef int Alen = len(A)
+    cdef double* Aptr = <double*> np.PyArray_DATA(A)
+    cdef cpp_vector[double] cpp_A = cpp_vector[double]()
+    cpp_A.reserve(Alen)
+    cpp_A.assign(Aptr, Aptr + Alen)
+    # convert n0
+    n0 = np.ascontiguousarray(n0, dtype=np.float64)
+    if n0.ndim != 2 or n0.shape[1] != c_cram.pyne_cram_transmute_info.n:
+        raise ValueError("n0 must have shape (nvec, {0}).".format(
+                         c_cram.pyne_cram_transmute_info.n))
+    n1 = np.empty_like(n0)
+    cdef int nvec = n0.shape[0]
+    cdef double* n0ptr = <double*> np.PyArray_DATA(n0)
+    cdef double* n1ptr = <double*> np.PyArray_DATA(n1)
+    with nogil:
+        cpp_transmuters.cram(cpp_A, n0ptr, n1ptr, nvec, order)
+    return n1
+
+
+def cram_steps(A, n0, dts=None, int order=14):
+    """Multi-step CRAM solver that transmutes initial nuclide atom fraction
+    vectors through a sequence of steps, e.g. a list of cooling times, and
+    returns the compositions after every step.  The output of each step is
+    fed directly into the next one.  The GIL is released while solving.
+
+    Parameters
+    ----------
+    A : 1D or 2D array-like
+        The (flat) transmutation matrix [unitless] of every step, with shape
+        (number of steps, NNZ), or a single flat matrix shared by all steps.
+    n0 : 1D or 2D array-like
+        The initial compositions [atom fraction], either a single vector of
+        length N or an array with shape (number of vectors, N).  The entries
+        are ordered as the nuclides in pyne.cram.NUCS.
+    dts : 1D array-like, optional
+        The duration of each step.  If given, the matrix of each step is
+        A scaled by its duration, so A should not include the time.
+    order : int, optional
+        The order of approximation, default 14.
+
+    Returns
+    -------
+    n1 : 2D or 3D array
+        The compositions after each step [atom fraction], with shape
+        (number of steps,) + n0.shape.
+    """
+    if order not in (6, 8, 10, 12, 14, 16, 18):
+        raise ValueError("Order selected not available for CRAM, please use"
+                         " order 6, 8, 10, 12, 14, 16, or 18.")
+    cdef int nnz = c_cram.pyne_cram_transmute_info.nnz
+    cdef int n = c_cram.pyne_cram_transmute_info.n
+    # convert A
+    A = np.atleast_2d(np.asarray(A, dtype=np.float64))
+    if A.ndim != 2 or A.shape[1] != nnz:
+        raise ValueError("A must contain flat matrices with {0} entries.".format(
+                         nnz))
+    if dts is not None:
+        dts = np.asarray(dts, dtype=np.float64)
+        if dts.ndim != 1 or A.shape[0] not in (1, len(dts)):
+            raise ValueError("There must be one matrix or one per step.")
+        A = A * dts[:, np.newaxis]
+    A = np.ascontiguousarray(A)
+    cdef int s
+    cdef int nsteps = A.shape[0]
+    cdef double* Aptr
+    cdef cpp_vector[cpp_vector[double]] cpp_As = cpp_vector[cpp_vector[double]](nsteps)
+    for s in range(nsteps):
+        Aptr = <double*> np.PyArray_DATA(A[s])
+        cpp_As[s].assign(Aptr, Aptr + nnz)
+    # convert n0
+    n0 = np.asarray(n0, dtype=np.float64)
+    shape = n0.shape
+    n0 = np.ascontiguousarray(np.atleast_2d(n0))
+    if n0.ndim != 2 or n0.shape[1] != n:
+        raise ValueError("n0 must have shape (N,) or (nvec, N), with N = {0}.".format(n))
+    cdef int nvec = n0.shape[0]
+    n1 = np.empty((nsteps, nvec, n), dtype=np.float64)
+    cdef double* n0ptr = <double*> np.PyArray_DATA(n0)
+    cdef double* n1ptr = <double*> np.PyArray_DATA(n1)
+    with nogil:
+        cpp_transmuters.cram_steps(cpp_As, n0ptr, n1ptr, nvec, order)
+    n1.shape = (nsteps,) + shape
+    return n1
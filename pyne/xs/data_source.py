@@ -848,63 +848,28 @@ class ENDFDataSource(DataSource):
         rx = rxname.mt(rx)
         rxdata = self.reaction(nuc, rx, nuc_i = nuc_i)
         xs = rxdata['xs']
-        dst_group_struct = rxdata['dst_group_struct']
-        intpoints = [intpt for intpt in rxdata['intpoints'][::-1]]
-        intschemes = rxdata['intschemes'][::-1]
+        dst_group_struct = np.asarray(rxdata['dst_group_struct'], dtype=float)
+        intpoints = np.asarray(rxdata['intpoints'], dtype=int)
+        intschemes = rxdata['intschemes']
         e_int = rxdata["e_int"]
 
-        src_bounds = [e_int[intpoint-1] for intpoint in intpoints]
-        src_dict = dict(zip(src_bounds, intschemes))
-        dst_bounds = zip(dst_group_struct[1:], dst_group_struct[:-1])
-        dst_sigma = [self.integrate_dst_group(dst_bound, src_bounds, src_dict, e_int, xs)
-                     for dst_bound in dst_bounds]
-        return dst_sigma
+        # integrate all groups in one pass, in ascending order of energy
+        src_bounds = e_int[intpoints - 1]
+        descending = dst_group_struct[0] > dst_group_struct[-1]
+        edges = dst_group_struct[::-1] if descending else dst_group_struct
+        dst_sigma = endf.integrate(e_int, xs, src_bounds, intschemes,
+                                   edges)/np.diff(edges)
+        if descending:
+            dst_sigma = dst_sigma[::-1]
+        return list(dst_sigma)
 
     def integrate_dst_group(self, dst_bounds, src_bounds, src_dict, e_int, xs):
         dst_low, dst_high = dst_bounds
-        src_bounds = np.array(src_bounds)
-
-        # We're going to have to integrate over each zone bounded by the edges
-        # of a destination bin or by the edges of a source bin
-        internal_src_bounds = [bd for bd in src_bounds if dst_low < bd < dst_high]
-        integration_bounds = [dst_low, dst_high]
-        integration_bounds[1:1] = internal_src_bounds
-        integration_bounds = list(zip(integration_bounds[:-1],
-                                      integration_bounds[1:]))
-
-        schemes = [src_dict[src_bounds[src_bounds >= high][0]] for low,
-                   high in integration_bounds]
-
-        integration_args = [(scheme, e_int, xs, bds[0], bds[1]) for
-                            scheme, bds in zip(schemes, integration_bounds)]
-        return sum([self._integrate_range_nonnormal(*args) for
-                    args in integration_args])/(dst_high-dst_low)
-
-    def _integrate_range_nonnormal(self, scheme, e_int, xs, low, high):
-        """De-normalizes the integral over a certain range. Useful when the
-        range is integrated piecewise over several chunks - you don't want
-        each chunk to be individually normalized.
-
-        Parameters
-        ----------
-        scheme : int
-            ENDF-coded interpolation scheme to be used between the data points.
-        e_int : ndarray
-            Array of energy values to integrate over.
-        xs : ndarray
-            Array of cross-sections corresponding to e_int.
-        low, high : float
-            Lower and upper bounds of integration.
-
-        Returns
-        -------
-        sigma * dE : float
-            Non-normalized integral.
-
-        """
-        dE = high - low
-        sigma = self.library.integrate_tab_range(scheme,e_int, xs, low, high)
-        return sigma * dE
+        src_bounds = np.sort(src_bounds)
+        schemes = [src_dict[bd] for bd in src_bounds]
+        sigma = endf.integrate(e_int, xs, src_bounds, schemes,
+                               [dst_low, dst_high])[0]
+        return sigma/(dst_high - dst_low)
 
 
 class OpenMCDataSource(DataSource):
@@ -995,13 +960,7 @@ class OpenMCDataSource(DataSource):
         elif rx == absrx:
             rawdata = ntab.sigma_a
         else:
-            ntabrx = ntab.reactions[mt]
-            if ntabrx.IE is None or ntabrx.IE == 0:
-                rawdata = ntabrx.sigma
-            else:
-                rawdata = np.empty(len(E_points), dtype='f8')
-                rawdata[:ntabrx.IE] = 0.0
-                rawdata[ntabrx.IE:] = ntabrx.sigma
+            rawdata = ntab.sigma_on_grid(mt)
         if (E_g[0] <= E_g[-1] and E_points[-1] <= E_points[0]) or \
            (E_g[0] >= E_g[-1] and E_points[-1] >= E_points[0]):
             E_points = E_points[::-1]
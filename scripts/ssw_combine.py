@@ -13,7 +13,7 @@ from numpy import copysign
 from pyne.mcnp import SurfSrc
 
 
-def combine_multiple_ss_files(newssrname, ssrnames):
+def combine_multiple_ss_files(newssrname, ssrnames, chunksize=2**20):
     """Method reads headers from ssr1name and ssr2name binary files
     and checks if the headers are 'similar.'  If not, it returns False.
 
@@ -23,6 +23,8 @@ def combine_multiple_ss_files(newssrname, ssrnames):
         Path to new ssr file.
     ssrnames : list of str
         List of paths to ssr files being combined.
+    chunksize : int, optional
+        Maximum number of tracks held in memory at a time.
 
     Returns
     -------
@@ -89,19 +91,16 @@ def combine_multiple_ss_files(newssrname, ssrnames):
     newssr.write_header()
 
     #####################
-    # Write each file's particle tracks in order of their listing.
-    # The nps value is offset for each track by the entries in trackoffsets.
-    ssrfiles[0].read_tracklist()
-    newssr.tracklist = ssrfiles[0].tracklist
-
-    for ssrfile, trackoffset in izip(ssrfiles[1:], trackoffsets[1:]):
-        ssrfile.read_tracklist()
-        for cnt, trackdata in enumerate(ssrfile.tracklist):
-            trackdata.nps += copysign(trackoffset, trackdata.nps)
-            ssrfile.tracklist[cnt] = trackdata
-        newssr.tracklist.extend(ssrfile.tracklist)
-
-    newssr.write_tracklist()
+    # Stream each file's particle tracks in order of their listing, a block
+    # at a time.  The nps value is offset for each track by the entries in
+    # trackoffsets.
+    def offset_tracks():
+        for ssrfile, trackoffset in izip(ssrfiles, trackoffsets):
+            for tracks in ssrfile.iter_tracks(chunksize=chunksize):
+                tracks['nps'] += copysign(trackoffset, tracks['nps'])
+                yield tracks
+
+    newssr.write_tracks(offset_tracks(), chunksize=chunksize)
 
     print("Finished writing to new surface source file '{0}'"
             "".format(newssrname))
@@ -19,6 +19,20 @@ const double pyne::Bq_per_Ci = 3.7e10;
 const double pyne::Ci_per_Bq = 2.7027027e-11;
 
 
+// Sets out[i] = f(nucs[i]), calling f only once for each distinct nuclide.
+static void memoized_access(double (*f)(int), int n, const int * nucs,
+                            double * out) {
+  std::map<int, double> memo;
+  std::map<int, double>::iterator it;
+  for (int i = 0; i < n; ++i) {
+    it = memo.lower_bound(nucs[i]);
+    if (it == memo.end() || it->first != nucs[i])
+      it = memo.insert(it, std::make_pair(nucs[i], f(nucs[i])));
+    out[i] = it->second;
+  }
+}
+
+
 /********************************/
 /*** data_checksums Functions ***/
 /********************************/
@@ -148,6 +162,11 @@ double pyne::atomic_mass(std::string nuc) {
 }
 
 
+void pyne::atomic_mass(int n, const int * nucs, double * out) {
+  memoized_access(static_cast<double (*)(int)>(&atomic_mass), n, nucs, out);
+}
+
+
 /*******************************/
 /*** natural_abund functions ***/
 /*******************************/
@@ -295,6 +314,11 @@ double pyne::q_val(std::string nuc) {
 }
 
 
+void pyne::q_val(int n, const int * nucs, double * out) {
+  memoized_access(static_cast<double (*)(int)>(&q_val), n, nucs, out);
+}
+
+
 /****************************/
 /*** gamma_frac functions ***/
 /****************************/
@@ -625,6 +649,70 @@ std::string pyne::dose_lung_model(std::string nuc, int source) {
   return dose_lung_model(nuc_zz, source);
 }
 
+///
+/// Dose factor tables for array lookups
+///
+
+pyne::dose_table& pyne::get_dose_table(int source) {
+  static dose_table tables[3];
+  std::map<int, pyne::dose>& dm = dose_source_map(source);
+  dose_table& table = tables[(source == 1 || source == 2) ? source : 0];
+  if (table.nucs.size() == dm.size())
+    return table;
+
+  table.nucs.clear();
+  table.doses.clear();
+  table.nucs.reserve(dm.size());
+  table.doses.reserve(dm.size());
+  for (std::map<int, pyne::dose>::iterator it = dm.begin(); it != dm.end();
+       ++it) {
+    table.nucs.push_back(it->first);
+    table.doses.push_back(it->second);
+  }
+  return table;
+}
+
+// Fills out with the dose factor at valoffset of n nuclides, or -1 where a
+// nuclide is not in the dose table of the source.
+static void dose_access(int n, const int * nucs, int source, size_t valoffset,
+                        double * out) {
+  pyne::dose_table& table = pyne::get_dose_table(source);
+  std::vector<int>::iterator begin = table.nucs.begin();
+  std::vector<int>::iterator end = table.nucs.end();
+  std::vector<int>::iterator it;
+  for (int i = 0; i < n; ++i) {
+    it = std::lower_bound(begin, end, nucs[i]);
+    if (it != end && *it == nucs[i])
+      out[i] = *(double *)((char *)&table.doses[it - begin] + valoffset);
+    else
+      out[i] = -1;
+  }
+}
+
+void pyne::ext_air_dose(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, ext_air_dose), out);
+}
+
+void pyne::ext_soil_dose(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, ext_soil_dose), out);
+}
+
+void pyne::ingest_dose(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, ingest_dose), out);
+}
+
+void pyne::inhale_dose(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, inhale_dose), out);
+}
+
+void pyne::dose_ratio(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, ratio), out);
+}
+
+void pyne::dose_fluid_frac(int n, const int * nucs, int source, double * out) {
+  dose_access(n, nucs, source, offsetof(dose, fluid_frac), out);
+}
+
 
 /***********************************/
 /*** scattering length functions ***/
@@ -1076,33 +1164,75 @@ const std::pair<int, double>& rhs) const {
       lhs.first<rhs.first);
 }
 
+template<typename U> pyne::energy_index<U>& pyne::get_energy_index(
+std::map<std::pair<int, double>, U>  &data) {
+  static energy_index<U> index;
+  // Fill up the map with values from the nuc_data.h5, if the map is empty.
+  if (data.empty())
+    _load_data<U>();
+  if (index.entries.size() == data.size())
+    return index;
+
+  typename std::map<std::pair<int, double>, U>::iterator it;
+  std::vector<std::pair<std::pair<double, int>, U*> > sorted;
+  sorted.reserve(data.size());
+  for (it = data.begin(); it != data.end(); ++it)
+    sorted.push_back(std::make_pair(std::make_pair(it->first.second,
+      it->first.first), &(it->second)));
+  std::sort(sorted.begin(), sorted.end());
+
+  index.energies.resize(sorted.size());
+  index.entries.resize(sorted.size());
+  for (int i = 0; i < sorted.size(); ++i) {
+    index.energies[i] = sorted[i].first.first;
+    index.entries[i] = sorted[i].second;
+  }
+  return index;
+}
+
 template<typename T, typename U> std::vector<T> pyne::data_access(
 double energy_min, double energy_max, size_t valoffset, std::map<std::pair<int,
 double>, U>  &data) {
-  typename std::map<std::pair<int, double>, U, swapmapcompare>::iterator
-    nuc_iter, nuc_end, it;
-  std::map<std::pair<int, double>, U, swapmapcompare> dc(data.begin(),
-    data.end());
+  energy_index<U>& index = get_energy_index<U>(data);
+  std::vector<double>::iterator lo, hi;
   std::vector<T> result;
   if (energy_max < energy_min){
     double temp = energy_max;
     energy_max = energy_min;
     energy_min = temp;
   }
-  nuc_iter = dc.lower_bound(std::make_pair(0, energy_min));
-  nuc_end = dc.upper_bound(std::make_pair(9999999999, energy_max));
+  lo = std::lower_bound(index.energies.begin(), index.energies.end(),
+    energy_min);
+  hi = std::upper_bound(lo, index.energies.end(), energy_max);
   T *ret;
-  // First check if we already have the nuc in the map
-  for (it = nuc_iter; it!= nuc_end; ++it){
-    ret = (T *)((char *)&(it->second) + valoffset);
+  for (size_t i = lo - index.energies.begin(); i < hi - index.energies.begin();
+       ++i) {
+    ret = (T *)((char *)index.entries[i] + valoffset);
     result.push_back(*ret);
   }
-  // Next, fill up the map with values from the
-  // nuc_data.h5, if the map is empty.
-  if (data.empty())
-  {
-    _load_data<U>();
-    return data_access<T, U>(energy_min, energy_max, valoffset, data);
+  return result;
+}
+
+template<typename T, typename U> std::vector<std::vector<T> >
+pyne::data_access(const std::vector<std::pair<double, double> > &windows,
+size_t valoffset, std::map<std::pair<int, double>, U>  &data) {
+  energy_index<U>& index = get_energy_index<U>(data);
+  std::vector<double>::iterator begin = index.energies.begin();
+  std::vector<double>::iterator end = index.energies.end();
+  std::vector<double>::iterator lo, hi;
+  std::vector<std::vector<T> > result (windows.size());
+  double energy_min, energy_max;
+  T *ret;
+  for (int w = 0; w < windows.size(); ++w) {
+    energy_min = windows[w].first - fabs(windows[w].second);
+    energy_max = windows[w].first + fabs(windows[w].second);
+    lo = std::lower_bound(begin, end, energy_min);
+    hi = std::upper_bound(lo, end, energy_max);
+    result[w].reserve(hi - lo);
+    for (size_t i = lo - begin; i < hi - begin; ++i) {
+      ret = (T *)((char *)index.entries[i] + valoffset);
+      result[w].push_back(*ret);
+    }
   }
   return result;
 }
@@ -1669,6 +1799,166 @@ double pyne::branch_ratio(std::string from_nuc, std::string to_nuc) {
                                           nucname::id(to_nuc)));
 }
 
+//
+// Decay table for array lookups
+//
+
+pyne::decay_table& pyne::get_decay_table(bool with_children) {
+  static decay_table table;
+  if (level_data_lvl_map.empty())
+    _load_data<level_data>();
+
+  if (table.nucs.empty() || table.lvl_size != level_data_lvl_map.size() ||
+      table.rx_size != level_data_rx_map.size()) {
+    table = decay_table();
+    table.lvl_size = level_data_lvl_map.size();
+    table.rx_size = level_data_rx_map.size();
+    std::map<std::pair<int, double>, level_data>::iterator lvl, run;
+    std::map<std::pair<int, unsigned int>, level_data>::iterator rx;
+    std::map<int, int> metastables;
+    for (lvl = level_data_lvl_map.begin(); lvl != level_data_lvl_map.end();
+         ++lvl) {
+      table.nucs.push_back(lvl->first.first);
+      // metastable_id() gives the first matching level in map order
+      if (0 < lvl->second.metastable)
+        metastables.insert(std::make_pair((lvl->first.first / 10000) * 10000 +
+          lvl->second.metastable, lvl->second.nuc_id));
+    }
+    for (rx = level_data_rx_map.begin(); rx != level_data_rx_map.end(); ++rx)
+      table.nucs.push_back(rx->first.first);
+    std::sort(table.nucs.begin(), table.nucs.end());
+    table.nucs.erase(std::unique(table.nucs.begin(), table.nucs.end()),
+                     table.nucs.end());
+
+    // states are only given a half life if they have exactly one level,
+    // as in half_life() and decay_const()
+    table.half_lifes.assign(table.nucs.size(), 1.0/0.0);
+    table.decay_consts.assign(table.nucs.size(), 0.0);
+    int i;
+    for (lvl = level_data_lvl_map.begin(); lvl != level_data_lvl_map.end();
+         lvl = run) {
+      run = lvl;
+      for (++run; run != level_data_lvl_map.end() &&
+           run->first.first == lvl->first.first; ++run) {}
+      if (std::distance(lvl, run) != 1)
+        continue;
+      i = std::lower_bound(table.nucs.begin(), table.nucs.end(),
+                           lvl->first.first) - table.nucs.begin();
+      table.half_lifes[i] = lvl->second.half_life;
+      table.decay_consts[i] = log(2.0) / lvl->second.half_life;
+    }
+
+    std::map<int, int>::iterator ms;
+    for (ms = metastables.begin(); ms != metastables.end(); ++ms) {
+      table.metastable_ids.push_back(ms->first);
+      table.metastable_states.push_back(ms->second);
+    }
+  }
+
+  if (with_children && table.children_start.size() != table.nucs.size() + 1) {
+    std::set<int> children;
+    std::set<int>::iterator child;
+    std::map<std::pair<int, unsigned int>, level_data>::iterator rx;
+    table.children_start.assign(1, 0);
+    for (int i = 0; i < table.nucs.size(); ++i) {
+      rx = level_data_rx_map.lower_bound(std::make_pair(table.nucs[i], 0u));
+      if (rx != level_data_rx_map.end() && rx->first.first == table.nucs[i]) {
+        children = decay_children(table.nucs[i]);
+        for (child = children.begin(); child != children.end(); ++child) {
+          table.children.push_back(*child);
+          table.branch_ratios.push_back(branch_ratio(std::make_pair(
+            table.nucs[i], *child)));
+        }
+      }
+      table.children_start.push_back(table.children.size());
+    }
+  }
+  return table;
+}
+
+// Returns the state id of nuc, or -1 if it has no such metastable state.
+static int decay_state(const pyne::decay_table& table, int nuc,
+                       bool use_metastable) {
+  if (!use_metastable || nuc % 10000 == 0)
+    return nuc;
+  std::vector<int>::const_iterator it = std::lower_bound(
+    table.metastable_ids.begin(), table.metastable_ids.end(), nuc);
+  if (it == table.metastable_ids.end() || *it != nuc)
+    return -1;
+  return table.metastable_states[it - table.metastable_ids.begin()];
+}
+
+// Returns the compact index of a state id, or -1 if it is not in the table.
+static int decay_index(const pyne::decay_table& table, int state) {
+  std::vector<int>::const_iterator it = std::lower_bound(table.nucs.begin(),
+    table.nucs.end(), state);
+  if (it == table.nucs.end() || *it != state)
+    return -1;
+  return it - table.nucs.begin();
+}
+
+void pyne::half_life(int n, const int * nucs, double * out,
+                     bool use_metastable) {
+  decay_table& table = get_decay_table();
+  int i;
+  for (int k = 0; k < n; ++k) {
+    i = decay_index(table, decay_state(table, nucs[k], use_metastable));
+    out[k] = (i < 0) ? 1.0/0.0 : table.half_lifes[i];
+  }
+}
+
+void pyne::decay_const(int n, const int * nucs, double * out,
+                       bool use_metastable) {
+  decay_table& table = get_decay_table();
+  int i;
+  for (int k = 0; k < n; ++k) {
+    i = decay_index(table, decay_state(table, nucs[k], use_metastable));
+    out[k] = (i < 0) ? 0.0 : table.decay_consts[i];
+  }
+}
+
+void pyne::branch_ratio(int n, const int * from_nucs, const int * to_nucs,
+                        double * out, bool use_metastable) {
+  decay_table& table = get_decay_table(true);
+  std::vector<int>::iterator begin, end, it;
+  int from, to, i;
+  for (int k = 0; k < n; ++k) {
+    from = decay_state(table, from_nucs[k], use_metastable);
+    to = decay_state(table, to_nucs[k], use_metastable);
+    out[k] = 0.0;
+    if (from < 0 || to < 0)
+      continue;
+    i = decay_index(table, from);
+    if (from == to && (i < 0 || table.decay_consts[i] == 0.0)) {
+      out[k] = 1.0;
+      continue;
+    }
+    if (i < 0)
+      continue;
+    begin = table.children.begin() + table.children_start[i];
+    end = table.children.begin() + table.children_start[i + 1];
+    it = std::lower_bound(begin, end, to);
+    if (it != end && *it == to)
+      out[k] = table.branch_ratios[it - table.children.begin()];
+  }
+}
+
+void pyne::decay_children(int n, const int * nucs, int * start,
+                          std::vector<int>& children, bool use_metastable) {
+  decay_table& table = get_decay_table(true);
+  int i;
+  children.clear();
+  start[0] = 0;
+  for (int k = 0; k < n; ++k) {
+    i = decay_index(table, decay_state(table, nucs[k], use_metastable));
+    if (0 <= i)
+      children.insert(children.end(),
+                      table.children.begin() + table.children_start[i],
+                      table.children.begin() + table.children_start[i + 1]);
+    start[k + 1] = children.size();
+  }
+}
+
 std::map<std::pair<int, int>, pyne::decay> pyne::decay_data = \
   std::map<std::pair<int, int>, pyne::decay>();
 
@@ -1913,6 +2203,22 @@ double error) {
   return result;
 }
 
+std::vector<std::vector<std::pair<double, double> > > pyne::gamma_energy(
+const std::vector<std::pair<double, double> > &windows) {
+  std::vector<std::vector<double> > part1 = data_access<double, gamma>(windows,
+    offsetof(gamma, energy), gamma_data);
+  std::vector<std::vector<double> > part2 = data_access<double, gamma>(windows,
+    offsetof(gamma, energy_err), gamma_data);
+  std::vector<std::vector<std::pair<double, double> > > result (windows.size());
+  for(int w = 0; w < windows.size(); ++w){
+    result[w].reserve(part1[w].size());
+    for(int i = 0; i < part1[w].size(); ++i){
+      result[w].push_back(std::make_pair(part1[w][i], part2[w][i]));
+    }
+  }
+  return result;
+}
+
 std::vector<std::pair<double, double> > pyne::gamma_photon_intensity(
 int parent) {
   std::vector<std::pair<double, double> > result;
@@ -1990,6 +2296,22 @@ double error) {
   return result;
 }
 
+std::vector<std::vector<std::pair<int, int> > > pyne::gamma_from_to(
+const std::vector<std::pair<double, double> > &windows) {
+  std::vector<std::vector<int> > part1 = data_access<int, gamma>(windows,
+    offsetof(gamma, from_nuc), gamma_data);
+  std::vector<std::vector<int> > part2 = data_access<int, gamma>(windows,
+    offsetof(gamma, to_nuc), gamma_data);
+  std::vector<std::vector<std::pair<int, int> > > result (windows.size());
+  for(int w = 0; w < windows.size(); ++w){
+    result[w].reserve(part1[w].size());
+    for(int i = 0; i < part1[w].size(); ++i){
+      result[w].push_back(std::make_pair(part1[w][i], part2[w][i]));
+    }
+  }
+  return result;
+}
+
 
 std::vector<std::pair<int, int> > pyne::gamma_parent_child(double energy,
 double error) {
@@ -2004,16 +2326,42 @@ double error) {
   return result;
 }
 
+std::vector<std::vector<std::pair<int, int> > > pyne::gamma_parent_child(
+const std::vector<std::pair<double, double> > &windows) {
+  std::vector<std::vector<int> > part1 = data_access<int, gamma>(windows,
+    offsetof(gamma, parent_nuc), gamma_data);
+  std::vector<std::vector<int> > part2 = data_access<int, gamma>(windows,
+    offsetof(gamma, child_nuc), gamma_data);
+  std::vector<std::vector<std::pair<int, int> > > result (windows.size());
+  for(int w = 0; w < windows.size(); ++w){
+    result[w].reserve(part1[w].size());
+    for(int i = 0; i < part1[w].size(); ++i){
+      result[w].push_back(std::make_pair(part1[w][i], part2[w][i]));
+    }
+  }
+  return result;
+}
+
 std::vector<int> pyne::gamma_parent(double energy, double error) {
   return data_access<int, gamma>(energy+error, energy-error,
     offsetof(gamma, parent_nuc), gamma_data);
 }
 
+std::vector<std::vector<int> > pyne::gamma_parent(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, gamma>(windows, offsetof(gamma, parent_nuc), gamma_data);
+}
+
 std::vector<int> pyne::gamma_child(double energy, double error) {
   return data_access<int, gamma>(energy+error, energy-error,
   offsetof(gamma, child_nuc), gamma_data);
 }
 
+std::vector<std::vector<int> > pyne::gamma_child(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, gamma>(windows, offsetof(gamma, child_nuc), gamma_data);
+}
+
 std::vector<int> pyne::gamma_child(int parent) {
   return data_access<int, gamma>(parent, 0.0, DBL_MAX,
   offsetof(gamma, child_nuc), gamma_data);
@@ -2125,11 +2473,21 @@ std::vector<int> pyne::alpha_parent(double energy, double error) {
                      offsetof(alpha, from_nuc), alpha_data);
 }
 
+std::vector<std::vector<int> > pyne::alpha_parent(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, alpha>(windows, offsetof(alpha, from_nuc), alpha_data);
+}
+
 std::vector<int> pyne::alpha_child(double energy, double error) {
   return data_access<int, alpha>(energy+error, energy-error,
                      offsetof(alpha, to_nuc), alpha_data);
 }
 
+std::vector<std::vector<int> > pyne::alpha_child(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, alpha>(windows, offsetof(alpha, to_nuc), alpha_data);
+}
+
 std::vector<int> pyne::alpha_child(int parent){
   return data_access<int, alpha>(parent, 0.0, DBL_MAX,
                      offsetof(alpha, to_nuc), alpha_data);
@@ -2209,11 +2567,21 @@ std::vector<int> pyne::beta_parent(double energy, double error) {
                      offsetof(beta, from_nuc), beta_data);
 }
 
+std::vector<std::vector<int> > pyne::beta_parent(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, beta>(windows, offsetof(beta, from_nuc), beta_data);
+}
+
 std::vector<int> pyne::beta_child(double energy, double error) {
   return data_access<int, beta>(energy+error, energy-error,
                      offsetof(beta, to_nuc), beta_data);
 }
 
+std::vector<std::vector<int> > pyne::beta_child(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, beta>(windows, offsetof(beta, to_nuc), beta_data);
+}
+
 std::vector<int> pyne::beta_child(int parent){
   return data_access<int, beta>(parent, 0.0, DBL_MAX,
                      offsetof(beta, to_nuc),beta_data);
@@ -2306,11 +2674,21 @@ std::vector<int> pyne::ecbp_parent(double energy, double error) {
                      offsetof(ecbp, from_nuc), ecbp_data);
 }
 
+std::vector<std::vector<int> > pyne::ecbp_parent(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, ecbp>(windows, offsetof(ecbp, from_nuc), ecbp_data);
+}
+
 std::vector<int> pyne::ecbp_child(double energy, double error) {
   return data_access<int, ecbp>(energy+error, energy-error,
                      offsetof(ecbp, to_nuc), ecbp_data);
 }
 
+std::vector<std::vector<int> > pyne::ecbp_child(
+const std::vector<std::pair<double, double> > &windows) {
+  return data_access<int, ecbp>(windows, offsetof(ecbp, to_nuc), ecbp_data);
+}
+
 std::vector<int> pyne::ecbp_child(int parent){
   return data_access<int, ecbp>(parent, 0.0, DBL_MAX,
                      offsetof(ecbp, to_nuc), ecbp_data);
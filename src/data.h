@@ -9,7 +9,9 @@
 #include <string>
 #include <utility>
 #include <map>
+#include <algorithm>
 #include <set>
+#include <vector>
 #include <limits>
 #include <exception>
 #include <stdlib.h>
@@ -80,6 +82,9 @@ namespace pyne
   double atomic_mass(char * nuc);
   /// Returns the atomic mass of a nuclide \a nuc.
   double atomic_mass(std::string nuc);
+  /// Fills \a out with the atomic masses of \a n nuclides, calling
+  /// atomic_mass() only once for each distinct nuclide.
+  void atomic_mass(int n, const int * nucs, double * out);
   /// \}
 
 
@@ -129,6 +134,9 @@ namespace pyne
   double q_val(int nuc);
   double q_val(const char * nuc);
   double q_val(std::string nuc);
+  /// Fills \a out with the q_values of \a n nuclides, calling q_val() only
+  /// once for each distinct nuclide.
+  void q_val(int n, const int * nucs, double * out);
   double gamma_frac(int nuc);
   double gamma_frac(const char * nuc);
   double gamma_frac(std::string nuc);
@@ -185,6 +193,28 @@ namespace pyne
   std::string dose_lung_model(int nuc, int source);
   std::string dose_lung_model(const char * nuc, int source);
   std::string dose_lung_model(std::string nuc, int source);
+
+  /// Dense view of the dose factor map of one source, sorted by nuclide.
+  typedef struct dose_table {
+    std::vector<int> nucs; ///< sorted nuclides in id form, the compact index
+    std::vector<dose> doses; ///< dose factors of each nuclide
+  } dose_table;
+
+  /// Returns the dose table of a source. The table is built once, after the
+  /// dose map of that source has been loaded, and is rebuilt only if the size
+  /// of the map changes.
+  dose_table& get_dose_table(int source);
+
+  /// \brief Fills \a out with the dose factors of \a n nuclides in id form.
+  ///
+  /// These look the nuclides up in the dose table of the source. Nuclides that
+  /// cannot be found are given -1, as in the scalar functions.
+  void ext_air_dose(int n, const int * nucs, int source, double * out);
+  void ext_soil_dose(int n, const int * nucs, int source, double * out);
+  void ingest_dose(int n, const int * nucs, int source, double * out);
+  void inhale_dose(int n, const int * nucs, int source, double * out);
+  void dose_ratio(int n, const int * nucs, int source, double * out);
+  void dose_fluid_frac(int n, const int * nucs, int source, double * out);
   /// \}
 
 
@@ -319,11 +349,30 @@ namespace pyne
                         const std::pair<int, double>& rhs) const;
   };
 
+  /// Energy sorted view of a std::map<std::pair<int, double>, U>. Entries are
+  /// ordered by energy first and nuclide second, matching swapmapcompare.
+  template<typename U> struct energy_index{
+    std::vector<double> energies; ///< sorted energies of the entries
+    std::vector<U*> entries; ///< pointers into the data map
+  };
+
+  /// Returns the energy index for a data map. The index is built once, after
+  /// the map has been loaded with _load_data<U>(), and is rebuilt only if the
+  /// size of the map changes.
+  template<typename U> energy_index<U>& get_energy_index(
+    std::map<std::pair<int, double>, U>  &data);
+
   /// Access data in a std::map<std::pair<int, double> for a range of
   /// values of the second member of the pair. Returns a vector of all
   /// values at valoffset of class U of type T f
   template<typename T, typename U> std::vector<T> data_access(double emin,
     double emax, size_t valoffset, std::map<std::pair<int, double>, U>  &data);
+  /// Access data in a std::map<std::pair<int, double> for many
+  /// (energy, error) windows at once. Returns a vector, one per window, of
+  /// all values at valoffset of class U of type T
+  template<typename T, typename U> std::vector<std::vector<T> > data_access(
+    const std::vector<std::pair<double, double> > &windows, size_t valoffset,
+    std::map<std::pair<int, double>, U>  &data);
   /// Access data in a std::map<std::pair<int, double> for a given
   /// value of the first member of the pair. Returns a vector of all
   /// values at valoffset of class U of type T
@@ -479,6 +528,48 @@ namespace pyne
   /// Returns the decay constant for a nuclide \a nuc.
   std::set<int> decay_children(std::string nuc);
 
+  /// Dense view of the level data, indexed by a compact nuclide index: the
+  /// position of a state id in \a nucs.
+  typedef struct decay_table {
+    std::vector<int> nucs; ///< sorted state ids of all levels and parents
+    std::vector<double> half_lifes; ///< half life of each state [s]
+    std::vector<double> decay_consts; ///< decay constant of each state [1/s]
+    std::vector<int> metastable_ids; ///< sorted ids of metastable states
+    std::vector<int> metastable_states; ///< state id of each metastable id
+    /// offsets of the decay children of each state into \a children; empty
+    /// until the children are first needed
+    std::vector<int> children_start;
+    std::vector<int> children; ///< decay children in id form
+    std::vector<double> branch_ratios; ///< branch ratio to each child
+    size_t lvl_size; ///< size of level_data_lvl_map when built
+    size_t rx_size; ///< size of level_data_rx_map when built
+  } decay_table;
+
+  /// Returns the decay table. The table is built once, after the level data
+  /// has been loaded with _load_data<level_data>(), and is rebuilt only if the
+  /// size of the level maps changes. The decay children and branch ratios are
+  /// only filled in if \a with_children is true.
+  decay_table& get_decay_table(bool with_children=false);
+
+  /// \brief Fills \a out with the half lives of \a n nuclides.
+  ///
+  /// These are the array versions of the decay functions above. They look the
+  /// nuclides up in the decay table rather than searching the level maps for
+  /// each one. If \a use_metastable is true, the state of each nuclide in id
+  /// form is taken to be its metastable state number, as metastable_id() does;
+  /// otherwise the nuclides are state ids.
+  void half_life(int n, const int * nucs, double * out, bool use_metastable);
+  /// Fills \a out with the decay constants of \a n nuclides.
+  void decay_const(int n, const int * nucs, double * out, bool use_metastable);
+  /// Fills \a out with the branch ratios of \a n parent/child nuclide pairs.
+  void branch_ratio(int n, const int * from_nucs, const int * to_nucs,
+                    double * out, bool use_metastable);
+  /// Fills \a children with the decay children of \a n nuclides. Those of
+  /// nucs[i] are children[start[i]] up to children[start[i+1]], so \a start
+  /// holds n + 1 offsets.
+  void decay_children(int n, const int * nucs, int * start,
+                      std::vector<int>& children, bool use_metastable);
+
   /// a struct matching the '/decay/decays' table in nuc_data.h5.
   typedef struct decay{
     int parent; ///< state id of decay parent
@@ -545,6 +636,8 @@ namespace pyne
   std::vector<std::pair<double, double> > gamma_energy(int parent);
   std::vector<std::pair<double, double> > gamma_energy(double energy,
    double error);
+  std::vector<std::vector<std::pair<double, double> > > gamma_energy(
+   const std::vector<std::pair<double, double> > &windows);
   //returns a list of gamma photon intensities from input parent nuclide
   std::vector<std::pair<double, double> > gamma_photon_intensity(int parent);
   std::vector<std::pair<double, double> > gamma_photon_intensity(double energy,
@@ -557,12 +650,18 @@ namespace pyne
   std::vector<std::pair<int, int> > gamma_from_to(int parent);
   //returns a list of pairs of excited state transitions from an decay energy
   std::vector<std::pair<int, int> > gamma_from_to(double energy, double error);
+  std::vector<std::vector<std::pair<int, int> > > gamma_from_to(
+   const std::vector<std::pair<double, double> > &windows);
   //returns a list of parent/child pairs associated with an input decay energy
   std::vector<std::pair<int, int> > gamma_parent_child(double energy, double error);
+  std::vector<std::vector<std::pair<int, int> > > gamma_parent_child(
+   const std::vector<std::pair<double, double> > &windows);
   //returns a list of parent nuclides associated with an input decay energy
   std::vector<int> gamma_parent(double energy, double error);
+  std::vector<std::vector<int> > gamma_parent(const std::vector<std::pair<double, double> > &windows);
   // returns a list of child state_id's based on a gamma-ray energy
   std::vector<int> gamma_child(double energy, double error);
+  std::vector<std::vector<int> > gamma_child(const std::vector<std::pair<double, double> > &windows);
   // returns a list of child state_id's based on a parent state_id
   std::vector<int> gamma_child(int parent);
   //returns an array of arrays of X-ray energies and intesities for a
@@ -595,8 +694,10 @@ namespace pyne
   std::vector<double> alpha_intensity(int parent);
   //returns a list of alpha decay parents from input decay energy range
   std::vector<int> alpha_parent(double energy, double error);
+  std::vector<std::vector<int> > alpha_parent(const std::vector<std::pair<double, double> > &windows);
   //returns a list of alpha decay children from input decay energy range
   std::vector<int> alpha_child(double energy, double error);
+  std::vector<std::vector<int> > alpha_child(const std::vector<std::pair<double, double> > &windows);
   //returns a list of alpha decay children from input parent nuclide
   std::vector<int> alpha_child(int parent);
 
@@ -622,8 +723,10 @@ namespace pyne
   std::vector<double> beta_intensity(int parent);
   //returns a list of beta decay parents from input decay energy range
   std::vector<int> beta_parent(double energy, double error);
+  std::vector<std::vector<int> > beta_parent(const std::vector<std::pair<double, double> > &windows);
   //returns a list of beta decay children from input decay energy range
   std::vector<int> beta_child(double energy, double error);
+  std::vector<std::vector<int> > beta_child(const std::vector<std::pair<double, double> > &windows);
   //returns a list of beta decay children from input parent nuclide
   std::vector<int> beta_child(int parent);
 
@@ -660,9 +763,11 @@ namespace pyne
   //returns a list of electron capture /beta plus decay parents from input
   //decay energy range
   std::vector<int> ecbp_parent(double energy, double error);
+  std::vector<std::vector<int> > ecbp_parent(const std::vector<std::pair<double, double> > &windows);
   //returns a list of electron capture /beta plus decay children from input
   //decay energy range
   std::vector<int> ecbp_child(double energy, double error);
+  std::vector<std::vector<int> > ecbp_child(const std::vector<std::pair<double, double> > &windows);
   //returns a list of electron capture /beta plus decay children from input
   //parent nuclide
   std::vector<int> ecbp_child(int parent);
@@ -1457,3 +1457,185 @@ int pyne::nucname::ensdf_to_id(std::string nuc) {
 
 }
 
+
+
+/**************************/
+/*** Array Form Functions ***/
+/**************************/
+
+namespace {
+  typedef int (*int_int_func)(int);
+  typedef int (*str_int_func)(std::string);
+  typedef std::string (*int_str_func)(int);
+  typedef std::string (*str_str_func)(std::string);
+
+  // Reads the i-th entry of an integer array.
+  struct int_keys {
+    const int * nucs;
+    int operator()(int i) const {return nucs[i];}
+  };
+
+  // Reads the i-th entry of an array of NUL padded fixed-width strings.
+  struct str_keys {
+    const char * nucs;
+    int itemsize;
+    std::string operator()(int i) const {
+      const char * s = nucs + (size_t) i * itemsize;
+      int len = 0;
+      while (len < itemsize && s[len] != '\0')
+        len++;
+      return std::string(s, len);
+    }
+  };
+
+  template <typename F>
+  F find_func(const std::map<std::string, F>& funcs, const std::string& func) {
+    typename std::map<std::string, F>::const_iterator it = funcs.find(func);
+    if (it == funcs.end())
+      throw std::invalid_argument("no nucname function '" + func +
+                                  "' for these input and output types");
+    return it->second;
+  }
+
+  // Sets out[i] = f(keys(i)), calling f only once per distinct key.
+  template <typename K, typename V, typename Keys>
+  void memoized(V (*f)(K), const Keys& keys, int n, V * out) {
+    std::map<K, V> memo;
+    typename std::map<K, V>::iterator it;
+    for (int i = 0; i < n; ++i) {
+      K key = keys(i);
+      it = memo.lower_bound(key);
+      if (it == memo.end() || memo.key_comp()(key, it->first))
+        it = memo.insert(it, std::make_pair(key, f(key)));
+      out[i] = it->second;
+    }
+  }
+
+  // Sets forms[idx[i]] = f(keys(i)), calling f only once per distinct key
+  // and storing each distinct string only once.
+  template <typename K, typename Keys>
+  void memoized(std::string (*f)(K), const Keys& keys, int n,
+                std::vector<std::string>& forms, int * idx) {
+    std::map<K, int> memo;
+    std::map<std::string, int> form_idx;
+    typename std::map<K, int>::iterator it;
+    std::map<std::string, int>::iterator fit;
+    forms.clear();
+    for (int i = 0; i < n; ++i) {
+      K key = keys(i);
+      it = memo.lower_bound(key);
+      if (it == memo.end() || memo.key_comp()(key, it->first)) {
+        std::string form = f(key);
+        fit = form_idx.find(form);
+        if (fit == form_idx.end()) {
+          fit = form_idx.insert(std::make_pair(form, (int) forms.size())).first;
+          forms.push_back(form);
+        }
+        it = memo.insert(it, std::make_pair(key, fit->second));
+      }
+      idx[i] = it->second;
+    }
+  }
+
+  std::map<std::string, int_int_func> get_int_int_funcs() {
+    using namespace pyne::nucname;
+    std::map<std::string, int_int_func> funcs;
+    funcs["id"] = static_cast<int_int_func>(&id);
+    funcs["znum"] = static_cast<int_int_func>(&znum);
+    funcs["anum"] = static_cast<int_int_func>(&anum);
+    funcs["snum"] = static_cast<int_int_func>(&snum);
+    funcs["zzaaam"] = static_cast<int_int_func>(&zzaaam);
+    funcs["zzaaam_to_id"] = static_cast<int_int_func>(&zzaaam_to_id);
+    funcs["zzzaaa"] = static_cast<int_int_func>(&zzzaaa);
+    funcs["zzzaaa_to_id"] = static_cast<int_int_func>(&zzzaaa_to_id);
+    funcs["mcnp"] = static_cast<int_int_func>(&mcnp);
+    funcs["mcnp_to_id"] = static_cast<int_int_func>(&mcnp_to_id);
+    funcs["cinder"] = static_cast<int_int_func>(&cinder);
+    funcs["cinder_to_id"] = static_cast<int_int_func>(&cinder_to_id);
+    funcs["sza"] = static_cast<int_int_func>(&sza);
+    funcs["sza_to_id"] = static_cast<int_int_func>(&sza_to_id);
+    funcs["groundstate"] = static_cast<int_int_func>(&groundstate);
+    funcs["state_id_to_id"] = &state_id_to_id;
+    funcs["id_to_state_id"] = &id_to_state_id;
+    return funcs;
+  }
+
+  std::map<std::string, str_int_func> get_str_int_funcs() {
+    using namespace pyne::nucname;
+    std::map<std::string, str_int_func> funcs;
+    funcs["id"] = static_cast<str_int_func>(&id);
+    funcs["znum"] = static_cast<str_int_func>(&znum);
+    funcs["anum"] = static_cast<str_int_func>(&anum);
+    funcs["snum"] = static_cast<str_int_func>(&snum);
+    funcs["zzaaam"] = static_cast<str_int_func>(&zzaaam);
+    funcs["zzaaam_to_id"] = static_cast<str_int_func>(&zzaaam_to_id);
+    funcs["zzzaaa"] = static_cast<str_int_func>(&zzzaaa);
+    funcs["zzzaaa_to_id"] = static_cast<str_int_func>(&zzzaaa_to_id);
+    funcs["zzllaaam_to_id"] = static_cast<str_int_func>(&zzllaaam_to_id);
+    funcs["mcnp"] = static_cast<str_int_func>(&mcnp);
+    funcs["mcnp_to_id"] = static_cast<str_int_func>(&mcnp_to_id);
+    funcs["fluka_to_id"] = static_cast<str_int_func>(&fluka_to_id);
+    funcs["serpent_to_id"] = static_cast<str_int_func>(&serpent_to_id);
+    funcs["nist_to_id"] = static_cast<str_int_func>(&nist_to_id);
+    funcs["cinder"] = static_cast<str_int_func>(&cinder);
+    funcs["cinder_to_id"] = static_cast<str_int_func>(&cinder_to_id);
+    funcs["alara_to_id"] = static_cast<str_int_func>(&alara_to_id);
+    funcs["sza"] = static_cast<str_int_func>(&sza);
+    funcs["sza_to_id"] = static_cast<str_int_func>(&sza_to_id);
+    funcs["groundstate"] = static_cast<str_int_func>(&groundstate);
+    funcs["ensdf_to_id"] = static_cast<str_int_func>(&ensdf_to_id);
+    return funcs;
+  }
+
+  std::map<std::string, int_str_func> get_int_str_funcs() {
+    using namespace pyne::nucname;
+    std::map<std::string, int_str_func> funcs;
+    funcs["name"] = static_cast<int_str_func>(&name);
+    funcs["zzllaaam"] = static_cast<int_str_func>(&zzllaaam);
+    funcs["fluka"] = &fluka;
+    funcs["serpent"] = static_cast<int_str_func>(&serpent);
+    funcs["nist"] = static_cast<int_str_func>(&nist);
+    funcs["alara"] = static_cast<int_str_func>(&alara);
+    return funcs;
+  }
+
+  std::map<std::string, str_str_func> get_str_str_funcs() {
+    using namespace pyne::nucname;
+    std::map<std::string, str_str_func> funcs;
+    funcs["name"] = static_cast<str_str_func>(&name);
+    funcs["zzllaaam"] = static_cast<str_str_func>(&zzllaaam);
+    funcs["serpent"] = static_cast<str_str_func>(&serpent);
+    funcs["nist"] = static_cast<str_str_func>(&nist);
+    funcs["alara"] = static_cast<str_str_func>(&alara);
+    return funcs;
+  }
+}
+
+void pyne::nucname::convert(std::string func, int n, const int * nucs,
+                            int * out) {
+  static const std::map<std::string, int_int_func> funcs = get_int_int_funcs();
+  int_keys keys = {nucs};
+  memoized(find_func(funcs, func), keys, n, out);
+}
+
+void pyne::nucname::convert(std::string func, int n, const char * nucs,
+                            int itemsize, int * out) {
+  static const std::map<std::string, str_int_func> funcs = get_str_int_funcs();
+  str_keys keys = {nucs, itemsize};
+  memoized(find_func(funcs, func), keys, n, out);
+}
+
+void pyne::nucname::convert(std::string func, int n, const int * nucs,
+                            std::vector<std::string>& forms, int * idx) {
+  static const std::map<std::string, int_str_func> funcs = get_int_str_funcs();
+  int_keys keys = {nucs};
+  memoized(find_func(funcs, func), keys, n, forms, idx);
+}
+
+void pyne::nucname::convert(std::string func, int n, const char * nucs,
+                            int itemsize, std::vector<std::string>& forms,
+                            int * idx) {
+  static const std::map<std::string, str_str_func> funcs = get_str_str_funcs();
+  str_keys keys = {nucs, itemsize};
+  memoized(find_func(funcs, func), keys, n, forms, idx);
+}
@@ -6,7 +6,9 @@
 #include <string>
 #include <map>
 #include <set>
+#include <vector>
 #include <exception>
+#include <stdexcept>
 #include <stdlib.h>
 #include <stdio.h>
 
@@ -600,6 +602,30 @@ namespace nucname
   int ensdf_to_id(std::string nuc);
   /// \}
 
+  /// \name Array Form Functions
+  /// \{
+  /// These apply one of the functions above, selected by its name (e.g.
+  /// "id", "zzaaam" or "mcnp_to_id"), to many nuclides in a single call.
+  /// Each distinct nuclide is converted only once; repeats are looked up in
+  /// a memoization table. std::invalid_argument is thrown if there is no
+  /// function of that name for the given input and output types.
+  /// \param func name of the conversion function
+  /// \param n number of nuclides
+  /// \param nucs n integer nuclides, or n strings of itemsize characters
+  ///        each, padded with NULs
+  /// \param itemsize width of each string in nucs
+  /// \param out n integer outputs
+  /// \param forms distinct string outputs, in order of first appearance
+  /// \param idx n indices of the string outputs into forms
+  void convert(std::string func, int n, const int * nucs, int * out);
+  void convert(std::string func, int n, const char * nucs, int itemsize,
+               int * out);
+  void convert(std::string func, int n, const int * nucs,
+               std::vector<std::string>& forms, int * idx);
+  void convert(std::string func, int n, const char * nucs, int itemsize,
+               std::vector<std::string>& forms, int * idx);
+  /// \}
+
 }
 }
 
@@ -5,11 +5,16 @@
 // Global sampler instance
 static pyne::Sampler* sampler = NULL;
 
+// Wall clock seconds elapsed since start
+static double seconds_since(std::chrono::steady_clock::time_point start) {
+  return std::chrono::duration<double>(
+      std::chrono::steady_clock::now() - start).count();
+}
+
 // Fortran API
 void pyne::sampling_setup_(int* mode) {
   if (sampler == NULL) {
     std::string filename ("source.h5m");
-    std::string src_tag_name ("source_density");
     std::string e_bounds_file ("e_bounds");
     std::vector<double> e_bounds = read_e_bounds(e_bounds_file);
     std::map<std::string, std::string> tag_names;
@@ -21,16 +26,8 @@ void pyne::sampling_setup_(int* mode) {
           "cell_number"));
     tag_names.insert(std::pair<std::string, std::string> ("cell_fracs_tag_name",
           "cell_fracs"));
-    if (*mode == 0) {
-      sampler = new pyne::Sampler(filename, src_tag_name, e_bounds, false);
-    } else if (*mode == 1) {
-      sampler = new pyne::Sampler(filename, src_tag_name, e_bounds, true);
-    } else if (*mode == 2) {
-      std::string bias_tag_name ("biased_source_density");
-      sampler = new pyne::Sampler(filename, src_tag_name, e_bounds, bias_tag_name);
-    } else {
-      sampler = new pyne::Sampler(filename, tag_names, e_bounds, *mode);
-    }
+    sampler = new pyne::Sampler(filename, tag_names, e_bounds, *mode,
+                                filename + ".sampler");
   }
 }
 
@@ -51,6 +48,18 @@ void pyne::particle_birth_(double* rands,
     *c = src.get_c();
 }
 
+double pyne::counter_rand(uint64_t seed, uint64_t counter) {
+  // SplitMix64: the state after counter steps is seed + counter*gamma, which
+  // is then mixed. See G. L. Steele, D. Lea, and C. H. Flood, "Fast
+  // Splittable Pseudorandom Number Generators," OOPSLA (2014).
+  uint64_t z = seed + (counter + 1)*0x9E3779B97F4A7C15ULL;
+  z = (z ^ (z >> 30))*0xBF58476D1CE4E5B9ULL;
+  z = (z ^ (z >> 27))*0x94D049BB133111EBULL;
+  z = z ^ (z >> 31);
+  // top 53 bits give a double uniform in [0, 1)
+  return (z >> 11)*(1.0/9007199254740992.0);
+}
+
 std::vector<double> pyne::read_e_bounds(std::string e_bounds_file){
   std::vector<double> e_bounds;
   std::ifstream inputFile(e_bounds_file.c_str());
@@ -90,9 +99,11 @@ pyne::Sampler::Sampler(std::string filename,
 pyne::Sampler::Sampler(std::string filename,
                  std::map<std::string, std::string> tag_names,
                  std::vector<double> e_bounds, 
-                 int mode)
+                 int mode,
+                 std::string cache_file)
   : filename(filename),
-    e_bounds(e_bounds) {
+    e_bounds(e_bounds),
+    cache_file(cache_file) {
   // determine the bias_mode and sub_mode
   if (mode == 0){
     bias_mode = ANALOG; 
@@ -153,34 +164,71 @@ pyne::Sampler::Sampler(std::string filename,
   setup();
 }
 
-pyne::SourceParticle pyne::Sampler::particle_birth(std::vector<double> rands) {
+pyne::SourceParticle pyne::Sampler::particle_birth(
+    const std::vector<double>& rands) {
+  double x, y, z, e, w;
+  int c;
+  sample_birth(&rands[0], &x, &y, &z, &e, &w, &c);
+  return SourceParticle(x, y, z, e, w, c);
+}
+
+void pyne::Sampler::particle_birth_many(int n, uint64_t seed,
+                                        double* x, double* y, double* z,
+                                        double* e, double* w, int* c,
+                                        uint64_t start) {
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
+  for (int i = 0; i < n; ++i) {
+    double rands[6];
+    uint64_t counter = 6*(start + i);
+    for (int j = 0; j < 6; ++j)
+      rands[j] = counter_rand(seed, counter + j);
+    sample_birth(rands, x + i, y + i, z + i, e + i, w + i, c + i);
+  }
+}
+
+void pyne::Sampler::sample_birth(const double* rands, double* x, double* y,
+                                 double* z, double* e, double* w, int* c) {
   // select mesh volume and energy group
   // In DEFAULT mode, max_num_cells = 1
   int pdf_idx =at->sample_pdf(rands[0], rands[1]);
   int ve_idx = pdf_idx/max_num_cells/num_e_groups;
   int c_idx = (pdf_idx/num_e_groups)%max_num_cells;
   int e_idx = pdf_idx % num_e_groups;
-  int cell_id;
 
   // Sample uniformly within the selected mesh volume element and energy
   // group.
-  std::vector<double> xyz_rands;
-  xyz_rands.push_back(rands[2]);
-  xyz_rands.push_back(rands[3]);
-  xyz_rands.push_back(rands[4]);
-  moab::CartVect pos = sample_xyz(ve_idx, xyz_rands);
+  moab::CartVect pos = sample_xyz(ve_idx, rands + 2);
+  *x = pos[0];
+  *y = pos[1];
+  *z = pos[2];
+  *e = sample_e(e_idx, rands[5]);
+  *w = sample_w(pdf_idx);
   // cell_number
   if (sub_mode == SUBVOXEL) {
-     cell_id = cell_number[ve_idx*max_num_cells + c_idx];
+     *c = cell_number[ve_idx*max_num_cells + c_idx];
   } else {
-     cell_id = -1;
+     *c = -1;
   }
-  pyne::SourceParticle src = SourceParticle(pos[0], pos[1], pos[2],
-      sample_e(e_idx, rands[5]), sample_w(pdf_idx), cell_id);
-  return src;
 }
 
 void pyne::Sampler::setup() {
+  std::chrono::steady_clock::time_point start = std::chrono::steady_clock::now();
+  std::chrono::steady_clock::time_point step = start;
+  mesh = NULL;
+  at = NULL;
+  uint64_t key = 0;
+  if (!cache_file.empty())
+    key = cache_key();
+  if (!cache_file.empty() && read_cache(key)) {
+    setup_times["load"] = seconds_since(step);
+    setup_times["geom"] = 0.0;
+    setup_times["tags"] = 0.0;
+    setup_times["total"] = seconds_since(start);
+    return;
+  }
+
   moab::ErrorCode rval;
   moab::EntityHandle loaded_file_set;
   // Create MOAB instance
@@ -207,14 +255,176 @@ void pyne::Sampler::setup() {
     verts_per_ve = 4;
   }
   else throw std::invalid_argument("Mesh file must contain only tets or hexes.");
+  setup_times["load"] = seconds_since(step);
 
   // Process all the spatial and tag data and create an alias table.
+  step = std::chrono::steady_clock::now();
   std::vector<double> volumes(num_ves);
   mesh_geom_data(ves, volumes);
+  setup_times["geom"] = seconds_since(step);
+  step = std::chrono::steady_clock::now();
   mesh_tag_data(ves, volumes);
+  setup_times["tags"] = seconds_since(step);
+  if (!cache_file.empty())
+    write_cache(key);
+  setup_times["total"] = seconds_since(start);
+}
+
+// Setup cache file layout, in native byte order: the magic string, the
+// format version, the cache key, the sizes of the arrays and the sampling
+// modes as int64 values, then the arrays themselves. Arrays are written and
+// read whole, so that loading costs a few large reads.
+static const char cache_magic[8] = {'P', 'Y', 'N', 'E', 'S', 'A', 'M', 'P'};
+static const int64_t cache_version = 1;
+static const int cache_num_ints = 10;
+
+// Mixes the bytes of data into the 64-bit hash h, eight bytes at a time
+static uint64_t hash_bytes(uint64_t h, const void* data, size_t n) {
+  const unsigned char* bytes = static_cast<const unsigned char*>(data);
+  size_t i = 0;
+  for (; i + 8 <= n; i += 8) {
+    uint64_t word;
+    memcpy(&word, bytes + i, 8);
+    h = (h ^ word)*0x100000001B3ULL;
+    h ^= h >> 29;
+  }
+  for (; i < n; ++i)
+    h = (h ^ bytes[i])*0x100000001B3ULL;
+  return h;
+}
+
+static uint64_t hash_string(uint64_t h, const std::string& s) {
+  uint64_t size = s.size();
+  h = hash_bytes(h, &size, sizeof(size));
+  return hash_bytes(h, s.data(), s.size());
+}
+
+uint64_t pyne::Sampler::cache_key() {
+  uint64_t h = 0xCBF29CE484222325ULL;
+  std::ifstream f(filename.c_str(), std::ios::binary);
+  if (!f)
+    throw std::invalid_argument("Could not load mesh file.");
+  std::vector<char> buf(1 << 20);
+  while (f) {
+    f.read(&buf[0], buf.size());
+    h = hash_bytes(h, &buf[0], f.gcount());
+  }
+  int64_t modes[2] = {bias_mode, sub_mode};
+  h = hash_bytes(h, modes, sizeof(modes));
+  h = hash_string(h, src_tag_name);
+  h = hash_string(h, bias_mode == USER ? bias_tag_name : "");
+  h = hash_string(h, sub_mode == SUBVOXEL ? cell_number_tag_name : "");
+  h = hash_string(h, sub_mode == SUBVOXEL ? cell_fracs_tag_name : "");
+  return hash_bytes(h, &e_bounds[0], e_bounds.size()*sizeof(double));
+}
+
+bool pyne::Sampler::read_cache(uint64_t key) {
+  std::ifstream f(cache_file.c_str(), std::ios::binary);
+  if (!f)
+    return false;
+  char magic[8];
+  int64_t version;
+  uint64_t cached_key;
+  int64_t ints[cache_num_ints];
+  f.read(magic, sizeof(magic));
+  f.read(reinterpret_cast<char*>(&version), sizeof(version));
+  f.read(reinterpret_cast<char*>(&cached_key), sizeof(cached_key));
+  f.read(reinterpret_cast<char*>(ints), sizeof(ints));
+  if (!f || memcmp(magic, cache_magic, sizeof(magic)) != 0 ||
+      version != cache_version || cached_key != key ||
+      ints[0] != (int64_t) sizeof(edge_points))
+    return false;
+
+  num_ves = ints[1];
+  num_e_groups = ints[2];
+  max_num_cells = ints[3];
+  ve_type = static_cast<moab::EntityType>(ints[4]);
+  verts_per_ve = ints[5];
+  size_t num_pdf = ints[6];
+  size_t num_e_bounds = ints[7];
+  size_t num_weights = ints[8];
+  size_t num_cell_numbers = ints[9];
+  if (num_e_bounds != e_bounds.size())
+    return false;
+
+  std::vector<double> cached_e_bounds(num_e_bounds);
+  AliasTable* cached_at = new AliasTable();
+  cached_at->n = num_pdf;
+  cached_at->prob.resize(num_pdf);
+  cached_at->alias.resize(num_pdf);
+  all_edge_points.resize(num_ves);
+  biased_weights.resize(num_weights);
+  cell_number.resize(num_cell_numbers);
+  if (num_e_bounds > 0)
+    f.read(reinterpret_cast<char*>(&cached_e_bounds[0]),
+           num_e_bounds*sizeof(double));
+  if (num_pdf > 0) {
+    f.read(reinterpret_cast<char*>(&cached_at->prob[0]),
+           num_pdf*sizeof(double));
+    f.read(reinterpret_cast<char*>(&cached_at->alias[0]), num_pdf*sizeof(int));
+  }
+  if (num_ves > 0)
+    f.read(reinterpret_cast<char*>(&all_edge_points[0]),
+           num_ves*sizeof(edge_points));
+  if (num_weights > 0)
+    f.read(reinterpret_cast<char*>(&biased_weights[0]),
+           num_weights*sizeof(double));
+  if (num_cell_numbers > 0)
+    f.read(reinterpret_cast<char*>(&cell_number[0]),
+           num_cell_numbers*sizeof(int));
+  if (!f || f.peek() != EOF || cached_e_bounds != e_bounds) {
+    delete cached_at;
+    all_edge_points.clear();
+    biased_weights.clear();
+    cell_number.clear();
+    return false;
+  }
+  at = cached_at;
+  return true;
+}
+
+void pyne::Sampler::write_cache(uint64_t key) {
+  // Write to a file of our own and move it into place, so that readers,
+  // e.g. other ranks of a parallel run, never see a partial cache.
+  std::ostringstream tmp_name;
+  tmp_name << cache_file << ".tmp" << std::hex
+           << reinterpret_cast<uintptr_t>(this) << "_"
+           << std::chrono::steady_clock::now().time_since_epoch().count();
+  std::ofstream f(tmp_name.str().c_str(), std::ios::binary);
+  if (!f)
+    return;  // caching is optional
+  int64_t ints[cache_num_ints] = {(int64_t) sizeof(edge_points), num_ves,
+      num_e_groups, max_num_cells, ve_type, verts_per_ve, at->n,
+      (int64_t) e_bounds.size(), (int64_t) biased_weights.size(),
+      (int64_t) cell_number.size()};
+  f.write(cache_magic, sizeof(cache_magic));
+  f.write(reinterpret_cast<const char*>(&cache_version), sizeof(cache_version));
+  f.write(reinterpret_cast<const char*>(&key), sizeof(key));
+  f.write(reinterpret_cast<const char*>(ints), sizeof(ints));
+  if (!e_bounds.empty())
+    f.write(reinterpret_cast<const char*>(&e_bounds[0]),
+            e_bounds.size()*sizeof(double));
+  if (at->n > 0) {
+    f.write(reinterpret_cast<const char*>(&at->prob[0]),
+            at->n*sizeof(double));
+    f.write(reinterpret_cast<const char*>(&at->alias[0]), at->n*sizeof(int));
+  }
+  if (num_ves > 0)
+    f.write(reinterpret_cast<const char*>(&all_edge_points[0]),
+            num_ves*sizeof(edge_points));
+  if (!biased_weights.empty())
+    f.write(reinterpret_cast<const char*>(&biased_weights[0]),
+            biased_weights.size()*sizeof(double));
+  if (!cell_number.empty())
+    f.write(reinterpret_cast<const char*>(&cell_number[0]),
+            cell_number.size()*sizeof(int));
+  f.close();
+  if (!f || rename(tmp_name.str().c_str(), cache_file.c_str()) != 0)
+    remove(tmp_name.str().c_str());
 }
 
-void pyne::Sampler::mesh_geom_data(moab::Range ves, std::vector<double> &volumes) {
+void pyne::Sampler::mesh_geom_data(const moab::Range& ves,
+                                   std::vector<double> &volumes) {
   // Get connectivity.
   moab::ErrorCode rval;
   std::vector<moab::EntityHandle> connect;
@@ -222,36 +432,37 @@ void pyne::Sampler::mesh_geom_data(moab::Range ves, std::vector<double> &volumes
   if (rval != moab::MB_SUCCESS)
     throw std::runtime_error("Problem getting mesh connectivity.");
 
-  // Grab the coordinates that define 4 connected points within a mesh volume
-  // element and setup a data structure to allow uniform sampling with each 
-  // mesh volume element.
-  double coords[verts_per_ve*3];
+  // Grab the coordinates of the vertices of all mesh volume elements at once.
+  int n = verts_per_ve*3;
+  std::vector<double> coords((size_t) num_ves*n);
+  rval = mesh->get_coords(&connect[0], connect.size(), &coords[0]);
+  if (rval != moab::MB_SUCCESS)
+    throw std::runtime_error("Problem vertex coordinates.");
+
+  // Use 4 connected points within each mesh volume element to setup a data
+  // structure to allow uniform sampling with each mesh volume element. The
+  // offsets are of the points at the ends of the x, y, and z edges.
+  int yi = (ve_type == moab::MBHEX) ? 9 : 6;
+  int zi = (ve_type == moab::MBHEX) ? 12 : 9;
+  all_edge_points.resize(num_ves);
   int v;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
   for (v=0; v<num_ves; ++v) {
-    rval = mesh->get_coords(&connect[verts_per_ve*v], verts_per_ve, &coords[0]);
-    if (rval != moab::MB_SUCCESS)
-      throw std::runtime_error("Problem vertex coordinates.");
-    volumes[v] = measure(ve_type, verts_per_ve, &coords[0]);
-    if (ve_type == moab::MBHEX) {
-      moab::CartVect o(coords[0], coords[1], coords[2]);
-      moab::CartVect x(coords[3], coords[4], coords[5]);
-      moab::CartVect y(coords[9], coords[10], coords[11]);
-      moab::CartVect z(coords[12], coords[13], coords[14]);
-      edge_points ep = {o, x-o, y-o, z-o};
-      all_edge_points.push_back(ep);
-    } else if (ve_type == moab::MBTET) {
-      moab::CartVect o(coords[0], coords[1], coords[2]);
-      moab::CartVect x(coords[3], coords[4], coords[5]);
-      moab::CartVect y(coords[6], coords[7], coords[8]);
-      moab::CartVect z(coords[9], coords[10], coords[11]);
-      edge_points ep = {o, x-o, y-o, z-o};
-      all_edge_points.push_back(ep);
-    }
+    const double* c = &coords[(size_t) v*n];
+    volumes[v] = measure(ve_type, verts_per_ve, c);
+    moab::CartVect o(c[0], c[1], c[2]);
+    moab::CartVect x(c[3], c[4], c[5]);
+    moab::CartVect y(c[yi], c[yi + 1], c[yi + 2]);
+    moab::CartVect z(c[zi], c[zi + 1], c[zi + 2]);
+    edge_points ep = {o, x-o, y-o, z-o};
+    all_edge_points[v] = ep;
   }
 }
 
-void pyne::Sampler::mesh_tag_data(moab::Range ves, 
-                                  const std::vector<double> volumes) {
+void pyne::Sampler::mesh_tag_data(const moab::Range& ves,
+                                  const std::vector<double>& volumes) {
   moab::ErrorCode rval;
   moab::Tag src_tag;
   moab::Tag cell_number_tag;
@@ -302,10 +513,13 @@ void pyne::Sampler::mesh_tag_data(moab::Range ves,
     throw std::runtime_error("Problem getting source tag data.");
 
   // Multiply the source densities by the VE volumes
-  int v, c, e;
+  int v;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
   for (v=0; v<num_ves; ++v) {
-      for (c=0; c<max_num_cells; ++c) {
-          for (e=0; e<num_e_groups; ++e) {
+      for (int c=0; c<max_num_cells; ++c) {
+          for (int e=0; e<num_e_groups; ++e) {
               pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] *=
                   volumes[v]*cell_fracs[v*max_num_cells + c];
           }
@@ -320,41 +534,48 @@ void pyne::Sampler::mesh_tag_data(moab::Range ves,
     std::vector<double> bias_pdf = read_bias_pdf(ves, volumes, pdf);
     normalize_pdf(bias_pdf);
     //  Create alias table based off biased pdf and calculate birth weights.
-    biased_weights.resize(num_ves*num_e_groups*max_num_cells);
-    for (int i=0; i<biased_weights.size(); ++i) {
+    int n = num_ves*num_e_groups*max_num_cells;
+    biased_weights.resize(n);
+    int i;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
+    for (i=0; i<n; ++i) {
       biased_weights[i] = pdf[i]/bias_pdf[i];
     }
     at = new AliasTable(bias_pdf);
   }
 }
 
-std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves, 
-                                                 std::vector<double> volumes,
-                                                 std::vector<double> pdf) {
+std::vector<double> pyne::Sampler::read_bias_pdf(
+    const moab::Range& ves, const std::vector<double>& volumes,
+    const std::vector<double>& pdf) {
     std::vector<double> bias_pdf(num_ves*max_num_cells*num_e_groups);
-    int v, c, e;
+    int v;
     moab::ErrorCode rval;
     if (bias_mode == UNIFORM) {
       // Sub-voxel Uniform sampling: uniform in space, analog in energy. Biased PDF is
       // found by normalizing the total photon emission density to 1 in each
       // mesh volume element and multiplying by the volume of the element.
-      double q_in_group;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
       for (v=0; v<num_ves; ++v) {
-        for (c=0; c<max_num_cells; ++c) {
-            q_in_group = 0.0;
-            for (e=0; e<num_e_groups; ++e) {
+        for (int c=0; c<max_num_cells; ++c) {
+            double q_in_group = 0.0;
+            for (int e=0; e<num_e_groups; ++e) {
                 q_in_group += pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e];
             }
 
             if (q_in_group > 0) {
-                for (e=0; e<num_e_groups; ++e) {
+                for (int e=0; e<num_e_groups; ++e) {
                     bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] =
                         volumes[v]*cell_fracs[v*max_num_cells + c]*
                         pdf[v*max_num_cells*num_e_groups +
                         c*num_e_groups + e]/q_in_group;
                 }
             } else {
-                for (e=0; e<num_e_groups; ++e) {
+                for (int e=0; e<num_e_groups; ++e) {
                   bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] = 0.0;
                 }
             }
@@ -376,9 +597,12 @@ std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves,
         rval = mesh->tag_get_data(bias_tag, ves, &bias_pdf[0]);
         if (rval != moab::MB_SUCCESS)
           throw std::runtime_error("Problem getting bias tag data.");
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
         for (v=0; v<num_ves; ++v) {
-            for (c=0; c<max_num_cells; c++) {
-                for (e=0; e<num_e_groups; ++e)
+            for (int c=0; c<max_num_cells; c++) {
+                for (int e=0; e<num_e_groups; ++e)
                     bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] *=
                        volumes[v]*cell_fracs[v*max_num_cells + c];
             }
@@ -391,17 +615,19 @@ std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves,
         rval = mesh->tag_get_data(bias_tag, ves, &spatial_pdf[0]);
         if (rval != moab::MB_SUCCESS)
           throw std::runtime_error("Problem getting bias tag data.");
-        double q_in_group;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
         for (v=0; v<num_ves; ++v) {
-          q_in_group = 0;
-          for (c=0; c<max_num_cells; ++c){
-              for (e=0; e<num_e_groups; ++e){
+          double q_in_group = 0;
+          for (int c=0; c<max_num_cells; ++c){
+              for (int e=0; e<num_e_groups; ++e){
                 q_in_group += pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e];
               }
           }
           if (q_in_group > 0){
-            for (c=0; c<max_num_cells; ++c){
-                for (e=0; e<num_e_groups; ++e){
+            for (int c=0; c<max_num_cells; ++c){
+                for (int e=0; e<num_e_groups; ++e){
                     bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] =
                         spatial_pdf[v]*volumes[v]*cell_fracs[v*max_num_cells + c]*
                         pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e]/
@@ -409,8 +635,8 @@ std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves,
                 }
             }
           } else {
-            for (c=0; c<max_num_cells; ++c)
-                for (e=0; e<num_e_groups; ++e){
+            for (int c=0; c<max_num_cells; ++c)
+                for (int e=0; e<num_e_groups; ++e){
                     bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] =  0;
                 }
           }
@@ -421,21 +647,23 @@ std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves,
         rval = mesh->tag_get_data(bias_tag, ves, &spa_erg_pdf[0]);
         if (rval != moab::MB_SUCCESS)
           throw std::runtime_error("Problem getting bias tag data.");
-        double q_in_group;
+#ifdef _OPENMP
+#pragma omp parallel for
+#endif
         for (v=0; v<num_ves; ++v) {
-            for (e=0; e<num_e_groups; ++e) {
-                q_in_group = 0.0;
-                for (c=0; c<max_num_cells; ++c) {
+            for (int e=0; e<num_e_groups; ++e) {
+                double q_in_group = 0.0;
+                for (int c=0; c<max_num_cells; ++c) {
                     q_in_group += pdf[v*max_num_cells*num_e_groups + c*num_e_groups +e];
                 }
                 if (q_in_group >0) {
-                    for (c=0; c<max_num_cells; ++c) {
+                    for (int c=0; c<max_num_cells; ++c) {
                         bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups +e] =
                             spa_erg_pdf[v*num_e_groups+e]*volumes[v]*cell_fracs[v*max_num_cells + c]*
                             pdf[v*max_num_cells*num_e_groups + c*num_e_groups +e]/q_in_group;
                     }
                 } else {
-                    for (c=0; c<max_num_cells; ++c) {
+                    for (int c=0; c<max_num_cells; ++c) {
                         bias_pdf[v*max_num_cells*num_e_groups + c*num_e_groups + e] = 0.0;
                     }
                 }
@@ -456,7 +684,7 @@ std::vector<double> pyne::Sampler::read_bias_pdf(moab::Range ves,
 }
 
 
-moab::CartVect pyne::Sampler::sample_xyz(int ve_idx, std::vector<double> rands) {
+moab::CartVect pyne::Sampler::sample_xyz(int ve_idx, const double* rands) {
   double s = rands[0];
   double t = rands[1];
   double u = rands[2];
@@ -20,6 +20,9 @@
 /// the unbiased distribution. Alternatively, it may have exactly 1 energy
 /// group, in which case only spatial biasing is done, and energies are sampled
 /// in analog.
+/// The result of this setup may be cached in a binary sidecar file keyed by a
+/// hash of the mesh file contents and the sampling settings, so that later
+/// runs, and parallel ranks sharing the file, can skip reading the mesh.
  
 #ifndef PYNE_6OR6BJURKJHHTOFWXO2VMQM5EY
 #define PYNE_6OR6BJURKJHHTOFWXO2VMQM5EY
@@ -29,11 +32,14 @@
 #include <fstream>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
+#include <stdint.h>
 #include <vector>
 #include <stdexcept> 
 #include <sstream>
 #include <string>
 #include <map>
+#include <chrono>
 
 #include "moab/Range.hpp"
 #include "moab/Core.hpp"
@@ -46,7 +52,8 @@ extern "C" {
 
 namespace pyne {
 
-  /// MCNP interface for source sampling setup
+  /// MCNP interface for source sampling setup. The setup is cached in
+  /// source.h5m.sampler.
   /// \param mode The sampling mode: 
   /// Voxel(DEFAULT) R2S: 0 = analog, 1 = uniform, 2 = user-specified
   /// SubVoxel(SUBVOXEL) R2S: 3 = analog, 4 = uniform, 5 = user-specified
@@ -70,6 +77,14 @@ namespace pyne {
   /// \param e_bounds_file A file containing the energy group boundaries.
   std::vector<double> read_e_bounds(std::string e_bounds_file);
 
+  /// Counter-based pseudo-random number generator. Each (seed, counter) pair
+  /// maps to a fixed number through the SplitMix64 finalizer, so any random
+  /// number in a stream can be computed independently of all others.
+  /// \param seed The seed selecting the stream.
+  /// \param counter The position of the random number within the stream.
+  /// \return A pseudo-random number in range [0, 1).
+  double counter_rand(uint64_t seed, uint64_t counter);
+
   /// Stores 4 connected points in a mesh volume element
   struct edge_points {
     moab::CartVect o_point;
@@ -84,6 +99,8 @@ namespace pyne {
     /// Constructor
     /// \param p A normalized probability distribution function
     AliasTable(std::vector<double> p);
+    /// Constructor for an empty table, to be filled in directly
+    AliasTable() : n(0) {};
     /// Samples the alias table
     /// \param rand1 A random number in range [0, 1].
     /// \param rand2 A random number in range [0, 1].
@@ -168,16 +185,46 @@ namespace pyne {
     /// \param e_bounds The energy boundaries, note there are N + 1 energy
     ///                 bounds for N energy groups
     /// \param mode The mode number, 0, 1, 2, 3, 4 or 5
+    /// \param cache_file Path of a sidecar file caching the alias table, edge
+    ///                   points, birth weights, and energy bounds. It is read
+    ///                   instead of the mesh if it matches the mesh contents and
+    ///                   the other arguments, and is (re)written otherwise. An
+    ///                   empty string disables caching.
     Sampler(std::string filename,
             std::map<std::string, std::string> tag_names,
             std::vector<double> e_bounds,
-            int mode);
+            int mode,
+            std::string cache_file="");
 
     /// Samples particle birth parameters
     /// \param rands Six pseudo-random numbers in range [0, 1].
     /// \return A SourceParticle object containing the x position, y, position,
     ///         z, position, e, energy and w, weight of a particle.
-    pyne::SourceParticle particle_birth(std::vector<double> rands);
+    pyne::SourceParticle particle_birth(const std::vector<double>& rands);
+
+    /// Samples the birth parameters of many particles into contiguous arrays.
+    /// The six random numbers of particle i are counter_rand(seed, 6*(start+i))
+    /// through counter_rand(seed, 6*(start+i)+5), so results do not depend on
+    /// how the particles are split between calls or, when compiled with
+    /// OpenMP, between threads.
+    /// \param n The number of particles to sample.
+    /// \param seed The seed of the random number stream.
+    /// \param x Array of n x positions filled by this function
+    /// \param y Array of n y positions filled by this function
+    /// \param z Array of n z positions filled by this function
+    /// \param e Array of n energies filled by this function
+    /// \param w Array of n statistical weights filled by this function
+    /// \param c Array of n cell numbers filled by this function
+    /// \param start The index of the first particle within the stream.
+    void particle_birth_many(int n, uint64_t seed,
+                             double* x, double* y, double* z,
+                             double* e, double* w, int* c,
+                             uint64_t start=0);
+
+    /// Wall clock seconds spent in each stage of setup: "load" (reading the
+    /// mesh, or the cache file), "geom" (volumes and edge points), "tags"
+    /// (source and bias PDFs and the alias table), and "total".
+    std::map<std::string, double> setup_times;
 
     ~Sampler() {
       delete mesh;
@@ -193,6 +240,7 @@ namespace pyne {
     std::string cell_number_tag_name; ///< Cell number tag
     std::string cell_fracs_tag_name; ///< Cell volume fraction tag
     std::vector<double> e_bounds;  ///< Energy boundaries
+    std::string cache_file; ///< Sidecar file caching the setup, empty for none
     int num_e_groups; ///< Number of groups in tag \a _src_tag_name
     int num_bias_groups; ///< Number of groups tag \a _bias_tag_name
     int max_num_cells; /// Max number of cells in voxels
@@ -214,17 +262,25 @@ namespace pyne {
   private:
     // instantiation
     void setup();
-    void mesh_geom_data(moab::Range ves, std::vector<double> &volumes);
-    void mesh_tag_data(moab::Range ves, const std::vector<double> volumes);
+    void mesh_geom_data(const moab::Range& ves, std::vector<double> &volumes);
+    void mesh_tag_data(const moab::Range& ves,
+                       const std::vector<double>& volumes);
     // select birth parameters
-    moab::CartVect sample_xyz(int ve_idx, std::vector<double> rands);
+    void sample_birth(const double* rands, double* x, double* y, double* z,
+                      double* e, double* w, int* c);
+    moab::CartVect sample_xyz(int ve_idx, const double* rands);
     double sample_e(int e_idx, double rand);
     double sample_w(int pdf_idx);
+    // setup cache
+    uint64_t cache_key();
+    bool read_cache(uint64_t key);
+    void write_cache(uint64_t key);
     // helper functions
     void normalize_pdf(std::vector<double> & pdf);
     int num_groups(moab::Tag tag);
-    std::vector<double> read_bias_pdf(moab::Range ves, std::vector<double> volumes, 
-                                      std::vector<double> pdf);
+    std::vector<double> read_bias_pdf(const moab::Range& ves,
+                                      const std::vector<double>& volumes,
+                                      const std::vector<double>& pdf);
   };
 } //end namespace pyne
 
@@ -4,6 +4,35 @@ extern "C" {
 #include "utils.h"
 #include "transmuters.h"
 
+namespace {
+
+typedef void (*expm_multiply_t)(double*, double*, double*);
+
+// Returns the CRAM expm_multiply function of the given order
+expm_multiply_t expm_multiply_func(const int order) {
+  switch(order) {
+    case 6:
+      return pyne_cram_expm_multiply6;
+    case 8:
+      return pyne_cram_expm_multiply8;
+    case 10:
+      return pyne_cram_expm_multiply10;
+    case 12:
+      return pyne_cram_expm_multiply12;
+    case 14:
+      return pyne_cram_expm_multiply14;
+    case 16:
+      return pyne_cram_expm_multiply16;
+    case 18:
+      return pyne_cram_expm_multiply18;
+    default:
+      throw pyne::ValueError("Order selected not available for CRAM, please use"
+                             " order 6, 8, 10, 12, 14, 16, or 18.");
+  }
+}
+
+} // namespace
+
 
 std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
                                               const std::map<int, double>& n0,
@@ -24,33 +53,7 @@ std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
 
   // perform decay
   vector<double> x (pyne_cram_transmute_info.n);
-  switch(order) {
-    case 6:
-      pyne_cram_expm_multiply6(A.data(), b.data(), x.data());
-      break;
-    case 8:
-      pyne_cram_expm_multiply8(A.data(), b.data(), x.data());
-      break;
-    case 10:
-      pyne_cram_expm_multiply10(A.data(), b.data(), x.data());
-      break;
-    case 12:
-      pyne_cram_expm_multiply12(A.data(), b.data(), x.data());
-      break;
-    case 14:
-      pyne_cram_expm_multiply14(A.data(), b.data(), x.data());
-      break;
-    case 16:
-      pyne_cram_expm_multiply16(A.data(), b.data(), x.data());
-      break;
-    case 18:
-      pyne_cram_expm_multiply18(A.data(), b.data(), x.data());
-      break;
-    default:
-      throw pyne::ValueError("Order selected not available for CRAM, please use"
-                             " order 6, 8, 10, 12, 14, 16, or 18.");
-      break;
-  }
+  expm_multiply_func(order)(A.data(), b.data(), x.data());
 
   // convert back to map
   map<int, double> n1;
@@ -60,4 +63,44 @@ std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
     }
   }
   return n1;
-}
\ No newline at end of file
+}
+
+
+void pyne::transmuters::cram(std::vector<double>& A, const double* n0,
+                             double* n1, int nvec, const int order) {
+  expm_multiply_t expm_multiply = expm_multiply_func(order);
+  int n = pyne_cram_transmute_info.n;
+  double* Aptr = A.data();
+  int v;
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic)
+#endif
+  for (v = 0; v < nvec; ++v) {
+    // copy since the solvers do not declare b as const
+    std::vector<double> b (n0 + (size_t) v * n, n0 + (size_t) (v + 1) * n);
+    expm_multiply(Aptr, b.data(), n1 + (size_t) v * n);
+  }
+}
+
+
+void pyne::transmuters::cram_steps(std::vector<std::vector<double> >& As,
+                                   const double* n0, double* n1, int nvec,
+                                   const int order) {
+  expm_multiply_t expm_multiply = expm_multiply_func(order);
+  int n = pyne_cram_transmute_info.n;
+  int nsteps = As.size();
+  size_t stride = (size_t) nvec * n;
+  int v, s;
+#ifdef _OPENMP
+#pragma omp parallel for private(s) schedule(dynamic)
+#endif
+  for (v = 0; v < nvec; ++v) {
+    std::vector<double> b (n0 + (size_t) v * n, n0 + (size_t) (v + 1) * n);
+    for (s = 0; s < nsteps; ++s) {
+      double* x = n1 + s * stride + (size_t) v * n;
+      expm_multiply(As[s].data(), b.data(), x);
+      // chain the output into the next step
+      b.assign(x, x + n);
+    }
+  }
+}
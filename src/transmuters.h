@@ -18,6 +18,32 @@ std::map<int, double> cram(std::vector<double>& A,
                            const std::map<int, double>& n0,
                            const int order=14);
 
+/// Batched CRAM solver that takes a (flat) A matrix and many initial
+/// condition vectors, ordered as the nuclides in pyne_cram_transmute_info,
+/// and writes the transmuted vectors. The vectors are stored contiguously
+/// (row-major), one after another. The A matrix is shared by all vectors,
+/// which are solved in parallel when compiled with OpenMP.
+/// \param A The transmutation matrix [unitless]
+/// \param n0 The initial compositions, nvec * N values [atom fraction]
+/// \param n1 The result of the transmutation, nvec * N values [atom fraction]
+/// \param nvec The number of initial condition vectors
+/// \param order The order of approximation, default 14.
+void cram(std::vector<double>& A, const double* n0, double* n1, int nvec,
+          const int order=14);
+
+/// Multi-step CRAM solver that transmutes many initial condition vectors
+/// through a sequence of steps, each with its own (flat) A matrix already
+/// scaled by the step time. The output of each step is the input of the next,
+/// and the compositions after every step are written to n1, which holds
+/// nsteps * nvec * N values ordered by step, then vector, then nuclide.
+/// \param As The transmutation matrices of each step [unitless]
+/// \param n0 The initial compositions, nvec * N values [atom fraction]
+/// \param n1 The compositions after each step [atom fraction]
+/// \param nvec The number of initial condition vectors
+/// \param order The order of approximation, default 14.
+void cram_steps(std::vector<std::vector<double> >& As, const double* n0,
+                double* n1, int nvec, const int order=14);
+
 } // namespace transmuters
 } // namespace pyne
-#endif // PYNE_DQKIQSJ4SNG7VAB5LX36BLIYMA
\ No newline at end of file
+#endif // PYNE_DQKIQSJ4SNG7VAB5LX36BLIYMA
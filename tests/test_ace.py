@@ -2,9 +2,13 @@
 from __future__ import unicode_literals
 import os
 
-from nose.tools import assert_equal, assert_in, assert_almost_equal
+from nose.tools import assert_equal, assert_in, assert_almost_equal, \
+    assert_true, assert_not_in
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 import pyne.ace
+import pyne.mcnp
+from pyne.material import Material
 
 def setup():
     try:
@@ -95,6 +99,143 @@ def test_read_c12_binary():
     assert_equal(table.reactions[2].sigma[0], 78.04874)
     assert_equal(table.reactions[2].sigma[-1], 1.00772)
 
+def test_read_c12_binary_mmap():
+    c12 = pyne.ace.Library('C12-binary.ace', mmap=True)
+    c12.read('6000.00c')
+
+    assert_in('6000.00c', c12.toc)
+    assert_in('6000.00c', c12.tables)
+    table = c12.tables['6000.00c']
+
+    assert_equal(table.nxs[1], 38937)
+    assert_equal(table.nxs[2], 6000)
+    assert_equal(table.nxs[3], 1513)
+    assert_equal(table.jxs[1], 1)
+    assert_equal(len(table.xss), 38938)
+    assert_equal(table.xss[0], 0.0)
+
+    assert_in(2, table.reactions)
+    assert_in(107, table.reactions)
+    assert_in(204, table.reactions)
+    assert_in(444, table.reactions)
+
+    assert_almost_equal(table.energy[0], 1.0e-11)
+
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+    assert_equal(table.reactions[2].sigma[-1], 1.00772)
+
+def test_read_c12_ascii_index():
+    if os.path.exists('C012-n.ace.idx'):
+        os.remove('C012-n.ace.idx')
+    c12 = pyne.ace.Library('C012-n.ace', index=True)
+    c12.read()
+    assert_true(os.path.isfile('C012-n.ace.idx'))
+
+    # second library reads the table of contents from the index
+    c12idx = pyne.ace.Library('C012-n.ace', index=True)
+    c12idx.read('6000.00c')
+    assert_equal(list(c12idx.toc), list(c12.toc))
+    table = c12idx.tables['6000.00c']
+    exp = c12.tables['6000.00c']
+    assert_array_equal(table.nxs, exp.nxs)
+    assert_array_equal(table.jxs, exp.jxs)
+    assert_array_equal(table.xss, exp.xss)
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+
+    c12at = pyne.ace.Library('C012-n.ace')
+    c12at.read_at(c12at.line_offsets([1]))
+    assert_array_equal(c12at.tables['6000.00c'].xss, exp.xss)
+
+def test_read_c12_lazy_blocks():
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c')
+    table = c12.tables['6000.00c']
+    assert_equal(list(table.decode_times), ['cross_sections'])
+
+    # first access decodes the angular distributions only
+    assert_true(len(table.reactions[2].ang_energy_in) > 0)
+    assert_in('angular', table.decode_times)
+    assert_not_in('energy', table.decode_times)
+
+    # the table-level energy distribution attributes decode their block
+    getattr(table, 'e_dist_LP', None)
+    assert_in('energy', table.decode_times)
+
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c', blocks='all')
+    table = c12.tables['6000.00c']
+    assert_equal(set(table.decode_times), set(table.blocks))
+
+def test_evaluate_c12():
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c')
+    table = c12.tables['6000.00c']
+    sigma = table.evaluate([1, 2], table.energy)
+    assert_equal(sigma.shape, (2, len(table.energy)))
+    assert_array_almost_equal(sigma[0], table.sigma_t)
+    assert_array_almost_equal(sigma[1], table.reactions[2].sigma)
+
+    # halfway between the first two grid points
+    E = 0.5 * (table.energy[0] + table.energy[1])
+    assert_almost_equal(table.evaluate(2, [E])[0, 0],
+                        0.5 * (table.reactions[2].sigma[0] +
+                               table.reactions[2].sigma[1]))
+
+def test_macroscopic_total_c12():
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c')
+    table = c12.tables['6000.00c']
+    mat = Material({'C12': 1.0}, density=2.0)
+    E, sigma_t = pyne.ace.macroscopic_total(mat, {'C12': table})
+    assert_array_equal(E, pyne.ace.union_grid([table]))
+    N = mat.to_atom_dens()[60120000]
+    assert_array_almost_equal(sigma_t / (N * 1e-24), table.evaluate(1, E)[0])
+
+def test_read_c12_unequal_lines():
+    with open('C012-n.ace') as f:
+        lines = f.readlines()
+    # a padded first XSS line, followed by a second table
+    padded = lines[:12] + [lines[12].rstrip('\n') + '     \n'] + lines[13:]
+    renamed = [lines[0].replace('6000.00c', '6000.01c')] + lines[1:]
+    with open('C12-unequal.ace', 'w') as f:
+        f.writelines(padded + renamed)
+
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c')
+    exp = c12.tables['6000.00c']
+    c12 = pyne.ace.Library('C12-unequal.ace')
+    c12.read()
+    assert_equal(set(c12.tables), set(['6000.00c', '6000.01c']))
+    for table in c12.tables.values():
+        assert_array_equal(table.xss, exp.xss)
+
+def test_xsdir_load_tables():
+    pyne.ace.ascii_to_binary('C012-n.ace', 'C12-xsdir.ace')
+    with open('xsdir_c12', 'w') as f:
+        f.write('DATAPATH={0}\n'
+                'atomic weight ratios\n'
+                '   6000  11.896900\n'
+                'directory\n'
+                '6000.00c 11.896900 C012-n.ace 0 1 1 38937\n'
+                '6000.01c 11.896900 C12-xsdir.ace 0 2 1 38937 4096 512\n'
+                .format(os.getcwd()))
+    xsdir = pyne.mcnp.Xsdir('xsdir_c12')
+
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read('6000.00c')
+    exp = c12.tables['6000.00c']
+    # ASCII tables are found by line number, binary tables by record
+    for name in ['6000.00c', '6000.01c']:
+        tables = xsdir.load_tables([name])
+        assert_equal(list(tables), ['6000.00c'])
+        table = tables['6000.00c']
+        assert_array_equal(table.nxs, exp.nxs)
+        assert_array_equal(table.jxs, exp.jxs)
+        assert_array_equal(table.xss, exp.xss)
+        assert_equal(table.reactions[2].sigma[0], 78.04874)
+
 def teardown():
-    if os.path.exists('C12-binary.ace'):
-        os.remove('C12-binary.ace')
+    for filename in ['C12-binary.ace', 'C012-n.ace.idx', 'C12-unequal.ace',
+                     'C12-xsdir.ace', 'xsdir_c12']:
+        if os.path.exists(filename):
+            os.remove(filename)
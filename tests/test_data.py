@@ -356,6 +356,66 @@ def test_gamma_parent():
                   982520000])
 
 
+def test_energy_windows_many():
+    ens = [661.65, 103.5, 1173.2]
+    errs = [0.1, 0.05, 0.5]
+    exp = [data.gamma_parent(e, de) for e, de in zip(ens, errs)]
+    assert_equal(data.gamma_parent_many(ens, errs), exp)
+    exp = [data.gamma_parent_child(e, de) for e, de in zip(ens, errs)]
+    assert_equal(data.gamma_parent_child_many(ens, errs), exp)
+    exp = [data.gamma_child_byen(e) for e in ens]
+    assert_equal(data.gamma_child_byen_many(np.array(ens)), exp)
+    assert_equal(data.alpha_parent_many([5322.0, 4784.34], 0.1),
+                 [data.alpha_parent(5322.0, 0.1),
+                  data.alpha_parent(4784.34, 0.1)])
+    assert_equal(data.gamma_parent_many([]), [])
+
+
+def test_decay_data_many():
+    nucs = ['H1', 'U235', 'U235M', 'Am242M', 'Cs137', 'Eu151']
+    npt.assert_array_equal(data.half_life_many(nucs),
+                           [data.half_life(nuc) for nuc in nucs])
+    ids = np.array([[10010000, 922350001], [611460000, 932400001]])
+    npt.assert_array_equal(data.decay_const_many(ids),
+                           [[data.decay_const(nuc) for nuc in row]
+                            for row in ids.tolist()])
+    npt.assert_array_equal(data.half_life_many([922350001], False),
+                           [data.half_life(922350001, False)])
+
+    froms = ['H1', 'U235M', 'U235M', 'Pm146', 'Se86', 'Np240M']
+    tos = ['H1', 'U235', 'U236', 'Sm146', 'Br86M', 'Np240']
+    npt.assert_array_equal(data.branch_ratio_many(froms, tos),
+                           [data.branch_ratio(f, t) for f, t in zip(froms, tos)])
+    children = sorted(data.decay_children('U235'))
+    npt.assert_array_equal(data.branch_ratio_many('U235', children),
+                           [data.branch_ratio('U235', c) for c in children])
+
+    nucs = ['H1', 'U235M', 'Pm146', 'O16', 'U-235']
+    children, offsets = data.decay_children_many(nucs)
+    assert_equal(len(offsets), len(nucs) + 1)
+    for i, nuc in enumerate(nucs):
+        assert_equal(set(children[offsets[i]:offsets[i + 1]]),
+                     data.decay_children(nuc))
+    children, offsets = data.decay_children_many(['80166'], False)
+    assert_equal(set(children), data.decay_children('80166', False))
+
+
+def test_nuc_data_many():
+    nucs = [80160, 922350, 952421, 922350]
+    npt.assert_array_equal(data.atomic_mass_many(nucs),
+                           [data.atomic_mass(nuc) for nuc in nucs])
+    nucs = ['U235', 'Pu239', 'H1']
+    npt.assert_array_equal(data.q_val_many(nucs),
+                           [data.q_val(nuc) for nuc in nucs])
+    nucs = [40100000, 10030000, 25054]
+    for f in ['ext_air_dose', 'dose_ratio', 'ext_soil_dose', 'ingest_dose',
+              'dose_fluid_frac', 'inhale_dose']:
+        for source in range(3):
+            exp = [getattr(data, f)(nuc, source) for nuc in nucs]
+            obs = getattr(data, f + '_many')(nucs, source)
+            npt.assert_array_equal(obs, exp)
+
+
 def test_alpha_energy():
     assert_equal(data.alpha_energy(952410000),
                  [4758.0, 4800.0, 4834.0, 4889.0, 4956.0, 4962.0, 4964.0,
@@ -5,7 +5,7 @@ from math import e
 from hashlib import md5
 
 import nose
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true, assert_raises
 
 import numpy as np
 from numpy.testing import assert_array_equal, assert_allclose, \
@@ -14,7 +14,7 @@ from numpy.testing import assert_array_equal, assert_allclose, \
 from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 
-from pyne.endf import Library, Evaluation
+from pyne.endf import Library, Evaluation, Tab1, section_index, read_fields
 from pyne.utils import endftod
 from pyne.rxdata import DoubleSpinDict
 from pyne.xs.data_source import ENDFDataSource
@@ -632,6 +632,47 @@ def test_int_loglog_only_interpolate_one_endpoint():
     assert_allclose(exp, obs, rtol=1e-12)
 
 
+def test_int_loglin_zero():
+    # the piece with a zero cross section has no log-lin interpolant
+    exp_Eint = np.array([0, 2, 4], dtype="float64")
+    exp_xs = np.array([0, e**2, e**4])
+    obs = library.integrate_tab_range(4, exp_Eint, exp_xs)
+    exp = (e**4 - e**2)/4
+    assert_allclose(exp, obs, rtol=1e-12)
+    endfds = ENDFDataSource(tape1path)
+    endfds.rxcache[922350000, 1, 922350000] = {
+        'e_int': exp_Eint, 'xs': exp_xs, 'intpoints': [3], 'intschemes': [4],
+        'dst_group_struct': [4., 2., 0.]}
+    obs = endfds.discretize('U235', 'total')
+    assert_allclose([(e**4 - e**2)/2, 0.], obs, rtol=1e-12)
+
+
+def test_int_loglog_zero():
+    # y = e * x ** 2 above 3, zero below
+    exp_Eint = np.array([1, 3, 5, 7], dtype="float64")
+    exp_xs = np.array([0, 9*e, 25*e, 49*e])
+    obs = library.integrate_tab_range(5, exp_Eint, exp_xs)
+    exp = e/3 * (7**3 - 3**3) / (7-1)
+    assert_allclose(exp, obs, rtol=1e-12)
+    endfds = ENDFDataSource(tape1path)
+    endfds.rxcache[922350000, 1, 922350000] = {
+        'e_int': exp_Eint, 'xs': exp_xs, 'intpoints': [4], 'intschemes': [5],
+        'dst_group_struct': [7., 3., 1.]}
+    obs = endfds.discretize('U235', 'total')
+    assert_allclose([e/3 * (7**3 - 3**3) / 4, 0.], obs, rtol=1e-12)
+
+
+def test_tab1_integrate():
+    # linear-linear below 4, log-log above
+    tab = Tab1([1., 4., 8., 16.], [2., 8., 2., 0.5], [2, 4], [2, 5])
+    assert_allclose(tab([1., 2.5, 4., 8., 16.]), [2., 5., 8., 2., 0.5])
+    assert_allclose(tab(12.), 2.*(12./8.)**-2)
+    assert_allclose(tab.integral(), [0., 15., 31., 39.])
+    obs = tab.integrate([0., 2., 4., 12., 20.])
+    exp = [3., 12., 16. + 128./24., 128./48.]
+    assert_allclose(obs, exp, rtol=1e-12)
+
+
 def test_discretize():
     from os.path import isfile
     try:
@@ -866,5 +907,48 @@ def test_evaluation_relaxation():
     assert data['O3']['transitions'] == []
 
 
+def test_read_fields():
+    lines = (" 1.000000+0 2.500000-3          3          4 5.000000+1"
+             "          6 128 3  1    1\n"
+             "          7 8.000000+2                                 "
+             "            128 3  1    2\n")
+    fh = io.StringIO(lines)
+    obs = read_fields(fh, 8)
+    assert_array_equal(obs, [1.0, 2.5e-3, 3, 4, 50.0, 6, 7, 800.0])
+    assert_equal(fh.readline(), '')
+
+
+def test_section_index():
+    sections = section_index(tape1path, cache=False)
+    assert_equal(sections[0][:3], (128, 0, 0))
+    assert_equal(sections[1][:3], (128, 1, 451))
+    indexed = Library(tape1path, index='sampletape1.idx')
+    assert os.path.isfile('sampletape1.idx')
+    assert_array_equal(indexed.get_rx(nuc40000, 4, 2),
+                       library.get_rx(nuc40000, 4, 2))
+    # reuse the cached index
+    assert_equal(section_index(tape1path, cache='sampletape1.idx'), sections)
+    os.remove('sampletape1.idx')
+
+
+def test_evaluation_index():
+    download_file('http://t2.lanl.gov/nis/data/data/ENDFB-VII.1-neutron/U/235',
+                  'U235.txt', "1b71da3769d8b1e675c3c579ba5cb2d3")
+    u235 = Evaluation('U235.txt', verbose=False)
+    u235.read([(3, 102), (3, 18)])
+    u235idx = Evaluation('U235.txt', verbose=False, index='U235.txt.idx')
+    assert_true(u235idx._sections is not None)
+    u235idx.read([(3, 102), (3, 18)])
+    os.remove('U235.txt.idx')
+    with open('U235.txt') as f:
+        text = f.read()
+    assert_raises(ValueError, Evaluation, io.StringIO(text), verbose=False,
+                  index=True)
+    assert_equal(list(u235idx.reactions), list(u235.reactions))
+    for mt in (18, 102):
+        assert_array_equal(u235idx.reactions[mt].xs.x, u235.reactions[mt].xs.x)
+        assert_array_equal(u235idx.reactions[mt].xs.y, u235.reactions[mt].xs.y)
+
+
 if __name__ == "__main__":
     nose.runmodule()
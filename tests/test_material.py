@@ -13,7 +13,7 @@ from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne import nuc_data
 from pyne.material import Material, from_atom_frac, from_hdf5, from_text, \
-    MapStrMaterial, MultiMaterial, MaterialLibrary
+    MapStrMaterial, MultiMaterial, MaterialLibrary, LazyMaterialLibrary
 from pyne import jsoncpp
 from pyne import data
 from pyne import nucname
@@ -1449,6 +1449,77 @@ def test_matlib_hdf5():
     os.remove(filename)
 
 
+def test_matlib_hdf5_chunked():
+    filename = "matlib_chunked.h5"
+    if filename in os.listdir('.'):
+        os.remove(filename)
+    lib = dict(("m{0}".format(i), Material({"U235": 0.01 * i, "U238": 1.0},
+                                           mass=1.0 + i, density=10.0))
+               for i in range(7))
+    lib["nucvec"] = nucvec
+    wmatlib = MaterialLibrary(lib)
+    wmatlib.write_hdf5(filename, chunksize=3)
+    # single material reads see the same table
+    mat = Material()
+    mat.from_hdf5(filename, "/materials", 0)
+    assert_true(mat.metadata["name"] in wmatlib)
+    assert_mat_almost_equal(wmatlib[mat.metadata["name"]], mat)
+    rmatlib = MaterialLibrary(filename)
+    assert_equal(set(wmatlib), set(rmatlib))
+    for key in rmatlib:
+        assert_mat_almost_equal(wmatlib[key], rmatlib[key])
+    # appending to an existing table reuses the nucid array
+    MaterialLibrary({"extra": Material({"U235": 1.0})}).write_hdf5(filename)
+    rmatlib = MaterialLibrary(filename)
+    assert_equal(len(rmatlib), len(wmatlib) + 1)
+    assert_mat_almost_equal(rmatlib["extra"], Material({"U235": 1.0}))
+    os.remove(filename)
+
+
+def test_lazy_matlib_hdf5():
+    filename = "lazy_matlib.h5"
+    if filename in os.listdir('.'):
+        os.remove(filename)
+    lib = dict(("m{0}".format(i), Material({"U235": 0.01 * i, "U238": 1.0},
+                                           mass=1.0 + i))
+               for i in range(5))
+    MaterialLibrary(lib).write_hdf5(filename)
+    with LazyMaterialLibrary(filename, cache_size=2) as lazylib:
+        assert_equal(set(lib), set(lazylib))
+        for key in lazylib:
+            assert_mat_almost_equal(lib[key], lazylib[key])
+        assert_true(len(lazylib._cache) <= 2)
+        assert_raises(IOError, lazylib.__setitem__, "m0", Material())
+    with LazyMaterialLibrary(filename, cache_size=2, mode='a') as lazylib:
+        lazylib["m0"] = Material({"U238": 1.0}, mass=42.0)
+        lazylib["m1"] = Material({"U235": 1.0}, mass=1.0,
+                                 metadata={"comment": "x" * 100})
+        lazylib["new"] = Material({"U235": 1.0}, mass=7.0)
+        del lazylib["m4"]
+        del lazylib["m1"]
+        assert_equal(len(lazylib), 4)
+    exp = set(["m0", "m2", "m3", "new"])
+    rmatlib = MaterialLibrary(filename)
+    assert_equal(set(rmatlib), exp)
+    assert_mat_almost_equal(rmatlib["m0"], Material({"U238": 1.0}, mass=42.0))
+    assert_equal(rmatlib["new"].mass, 7.0)
+    with LazyMaterialLibrary(filename, mode='a') as lazylib:
+        assert_equal(set(lazylib), exp)
+        assert_raises(KeyError, lazylib.__delitem__, "m4")
+        lazylib["m1"] = Material({"U235": 1.0}, mass=3.0)
+    assert_equal(MaterialLibrary(filename)["m1"].mass, 3.0)
+
+    # unsaved materials are written out when the library is collected
+    lazylib = LazyMaterialLibrary(filename, mode='a')
+    lazylib["m5"] = Material({"U235": 1.0}, mass=5.0)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        del lazylib
+    assert_equal(len(w), 1)
+    assert_equal(MaterialLibrary(filename)["m5"].mass, 5.0)
+    os.remove(filename)
+
+
 def test_material_gammas():
     leu = {"U238": 0.96, "U235": 0.04}
     mat = Material(leu)
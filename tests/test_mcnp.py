@@ -10,6 +10,7 @@ from nose.tools import assert_almost_equal, assert_equal, assert_true, \
     assert_not_equal, assert_false, assert_raises
 from nose.plugins.skip import SkipTest
 
+import numpy as np
 import tables
 
 from pyne.utils import QAWarning
@@ -382,6 +383,53 @@ def test_read_tracklist_into_different_surface_errors():
     return
 
 
+def test_iter_tracks():
+    """Tracks streamed as structured arrays match the track list, and can be
+    filtered and written back out.
+    """
+    ssr = mcnp.SurfSrc(ssrname1, "rb")
+    try:
+        ssr.read_header()
+    except:
+        raise SkipTest
+    blocks = list(ssr.iter_tracks(chunksize=50))
+    tracks = np.concatenate(blocks)
+    assert_equal(len(blocks), 4)
+    assert_equal(len(tracks), ssr.nrss)
+
+    ssr = mcnp.SurfSrc(ssrname1, "rb")
+    ssr.read_header()
+    ssr.read_tracklist()
+    assert_array_equal(tracks['erg'], [t.erg for t in ssr.tracklist])
+    assert_array_equal(mcnp.track_cell(tracks),
+                       [t.cell for t in ssr.tracklist])
+    assert_array_equal(mcnp.track_w(tracks), [t.w for t in ssr.tracklist])
+
+    # write only the tracks above 1 MeV; nrss in the header is updated
+    sswname = os.path.join(thisdir, "filtered_mcnp5_surfsrc.w")
+    ssw = mcnp.SurfSrc(sswname, "wb")
+    for attr in ['kod', 'ver', 'loddat', 'idtm', 'probid', 'aid', 'knod',
+                 'nrss', 'ncrd', 'njsw', 'niss', 'table1extra', 'niwr',
+                 'mipts', 'kjaq', 'table2extra', 'surflist', 'summary_table',
+                 'summary_extra']:
+        setattr(ssw, attr, getattr(ssr, attr))
+    ssw.np1 = ssr.orignp1
+    ssw.write_header()
+    ssr = mcnp.SurfSrc(ssrname1, "rb")
+    ssr.read_header()
+    count = ssw.write_tracks(ssr.iter_tracks(
+        chunksize=50, where=lambda t: t['erg'] > 1.0))
+    ssw.close()
+
+    sswr = mcnp.SurfSrc(sswname, "rb")
+    sswr.read_header()
+    assert_equal(count, (tracks['erg'] > 1.0).sum())
+    assert_equal(sswr.nrss, count)
+    assert_array_equal(sswr.read_tracks(), tracks[tracks['erg'] > 1.0])
+    sswr.close()
+    os.remove(sswname)
+
+
 def test_print_header():
     """Check SurfSrc.print_header() against expected resulting string.
     We use a file with a single track for this test, but only use the
@@ -686,6 +734,20 @@ def test_write_to_hdf5():
             os.unlink("mcnp_ptrac_hdf5_file.h5")
 
 
+def test_read_event_blocks():
+    for test_file in ["mcnp_ptrac_i4_little.ptrac",
+                      "mcnp_ptrac_i8_little.ptrac"]:
+        p = mcnp.PtracReader(test_file)
+        # small blocks split records between reads
+        blocks = list(p.read_event_blocks(chunksize=64))
+        events = np.concatenate(blocks)
+        assert_true(len(blocks) > 1)
+        assert_equal(len(events), 15)
+        assert_equal((events["event_type"] == 1000).sum(), 5)
+        assert_equal(events["xxx"][0], 0.0)
+        del p
+
+
 # Test Wwinp class. All three function are tested at once because their inputs
 # and ouputs are easily strung together.
 def test_wwinp_n():
@@ -1194,6 +1256,32 @@ def test_multiple_meshtally_meshtal():
         assert_array_equal(written, expected)
 
 
+def test_meshtal_select_tallies():
+    """Only the selected tallies of a meshtal file are read."""
+
+    if not HAVE_PYTAPS:
+        raise SkipTest
+
+    thisdir = os.path.dirname(__file__)
+    meshtal_file = os.path.join(thisdir, "mcnp_meshtal_multiple_meshtal.txt")
+    expected_h5m_24 = os.path.join(thisdir, "mcnp_meshtal_tally_24.h5m")
+    expected_sm_24 = Mesh(mesh=expected_h5m_24, structured=True)
+
+    tags = {24: ["p_result", "p_rel_error",
+                 "p_total_result", "p_total_rel_error"]}
+    meshtal_object = mcnp.Meshtal(meshtal_file, tags, tallies=[24])
+    assert_equal(list(meshtal_object.tally.keys()), [24])
+    assert_equal(meshtal_object.tally[24].particle, "photon")
+
+    for v_e, expected_v_e in zip(
+            meshtal_object.tally[24].structured_iterate_hex("xyz"),
+            expected_sm_24.structured_iterate_hex("xyz")):
+        for tag in tags[24]:
+            written = meshtal_object.tally[24].mesh.getTagHandle(tag)[v_e]
+            expected = expected_sm_24.mesh.getTagHandle(tag)[expected_v_e]
+            assert_array_equal(written, expected)
+
+
 def test_mesh_to_geom():
     if not HAVE_PYTAPS:
         raise SkipTest
@@ -19,7 +19,7 @@ except ImportError:
 from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne.mesh import Mesh, StatMesh, MeshError, Tag, MetadataTag, IMeshTag, \
-    ComputedTag
+    ComputedTag, ColumnarMaterials, ColumnarPropertyTag, ColumnarMethodTag
 from pyne.material import Material, MaterialLibrary
 
 def try_rm_file(filename):
@@ -543,6 +543,106 @@ def test_matmethtag():
     assert_array_equal(m.molecular_mass[mask], mws[mask])
     assert_array_equal(m.molecular_mass[1, 0, 1, 3], mws[[1, 0, 1, 3]])
 
+def test_columnar_matproptag():
+    mats = {
+        0: Material({'H1': 1.0, 'K39': 1.0}, density=42.0),
+        1: Material({'H1': 0.1, 'O16': 1.0}, density=43.0),
+        2: Material({'He4': 42.0}, density=44.0),
+        3: Material({'Tm171': 171.0}, density=45.0),
+        }
+    for csr in (False, True):
+        m = gen_mesh(mats=ColumnarMaterials.from_library(mats, csr=csr))
+        assert_is_instance(m.mats, ColumnarMaterials)
+
+        # Getting tags
+        assert_equal(m.density[0], 42.0)
+        assert_array_equal(m.density[::2], np.array([42.0, 44.0]))
+        mask = np.array([True, False, True, True], dtype=bool)
+        assert_array_equal(m.density[mask], np.array([42.0, 44.0, 45.0]))
+        assert_array_equal(m.density[1, 0, 1, 3],
+                           np.array([43.0, 42.0, 43.0, 45.0]))
+        assert_array_equal(m.mass, [mat.mass for mat in mats.values()])
+
+        # setting tags
+        m.density[::2] = 18.0
+        m.density[1::2] = [36.0, 54.0]
+        assert_array_equal(m.density[:], np.array([18.0, 36.0, 18.0, 54.0]))
+        m.density[3, 1] = 6.0, 4128.0
+        assert_array_equal(m.density[1:], np.array([4128.0, 18.0, 6.0]))
+
+        # materials round trip through the store
+        for i, mat, ve in m:
+            assert_equal(len(mat.comp), len(mats[i].comp))
+            for key in mats[i].iterkeys():
+                assert_almost_equal(mat.comp[key], mats[i].comp[key])
+        m.mats[2] = Material({'U235': 1.0}, density=19.0)
+        assert_in(922350000, m.mats.nucs)
+        assert_equal(m.density[2], 19.0)
+        lib = m.mats.to_library()
+        assert_equal(set(lib[2].comp.keys()), set([922350000]))
+        assert_almost_equal(lib[3].comp[691710000], 1.0)
+
+def test_columnar_matmethtag():
+    mats = {
+        0: Material({'H1': 1.0, 'K39': 1.0}, density=42.0),
+        1: Material({'H1': 0.1, 'O16': 1.0}, density=43.0,
+                    atoms_per_molecule=3.0),
+        2: Material({'He4': 42.0}, density=44.0),
+        3: Material({'Tm171': 171.0}, density=45.0),
+        }
+    mws = np.array([mat.molecular_mass() for i, mat in mats.items()])
+    nds = np.array([mat.number_density() for i, mat in mats.items()])
+    for csr in (False, True):
+        m = gen_mesh(mats=ColumnarMaterials.from_library(mats, csr=csr))
+        assert_almost_equal(m.molecular_mass[0], mws[0])
+        assert_array_almost_equal(m.molecular_mass[::2], mws[::2])
+        mask = np.array([True, False, True, True], dtype=bool)
+        assert_array_almost_equal(m.molecular_mass[mask], mws[mask])
+        assert_array_almost_equal(m.molecular_mass[1, 0, 1, 3],
+                                  mws[[1, 0, 1, 3]])
+        assert_array_almost_equal(m.number_density[:] / nds, np.ones(4))
+        assert_array_equal(m.mass_density[:], [42.0, 43.0, 44.0, 45.0])
+
+def test_columnar_mesh():
+    mats = {
+        0: Material({'H1': 1.0, 'K39': 1.0}, density=42.0),
+        1: Material({'H1': 0.1, 'O16': 1.0}, density=43.0),
+        2: Material({'He4': 42.0}, density=44.0),
+        3: Material({'Tm171': 171.0}, density=45.0),
+        }
+    # the mesh converts the materials into a dense store itself
+    for store in (dict(mats), ColumnarMaterials.from_library(mats, csr=True)):
+        m = Mesh(structured_coords=[[-1, 0, 1], [-1, 0, 1], [0, 1]],
+                 structured=True, mats=store, columnar=True)
+        assert_is_instance(m.mats, ColumnarMaterials)
+        assert_is_instance(m.comp, ColumnarPropertyTag)
+        assert_is_instance(m.molecular_mass, ColumnarMethodTag)
+        for i, mat, ve in m:
+            assert_equal(set(mat.comp.keys()), set(mats[i].comp.keys()))
+            for key in mats[i].iterkeys():
+                assert_almost_equal(mat.comp[key], mats[i].comp[key])
+            assert_equal(m.density[i], mats[i].density)
+            assert_almost_equal(m.molecular_mass[i],
+                                mats[i].molecular_mass())
+
+        # rows set one at a time through the tag and the store
+        row = np.zeros(len(m.mats.nucs))
+        row[np.searchsorted(m.mats.nucs, 80160000)] = 1.0
+        m.comp[0] = row
+        m.comp[1] = row
+        m.mats[3] = Material({'U235': 1.0}, density=19.0)
+        exp = Material({'O16': 1.0})
+        assert_almost_equal(m.molecular_mass[0], exp.molecular_mass())
+        assert_almost_equal(m.molecular_mass[1], exp.molecular_mass())
+        assert_almost_equal(m.molecular_mass[3],
+                            Material({'U235': 1.0}).molecular_mass())
+        lib = m.mats.to_library()
+        assert_equal(set(lib[0].comp.keys()), set([80160000]))
+        assert_equal(set(lib[1].comp.keys()), set([80160000]))
+        assert_equal(set(lib[2].comp.keys()), set([20040000]))
+        assert_equal(set(lib[3].comp.keys()), set([922350000]))
+        assert_equal(m.density[3], 19.0)
+
 def test_metadatatag():
     mats = {
         0: Material({'H1': 1.0, 'K39': 1.0}, density=42.0),
@@ -621,6 +721,26 @@ def test_imeshtag():
     # deleting tag
     del m.f[:]
 
+def test_imeshtag_get_set_all():
+    m = gen_mesh()
+    m.f = IMeshTag(mesh=m, name='f')
+    m.f.set_all([1.0, 2.0, 3.0, 4.0])
+    assert_array_equal(m.f.get_all(), [1.0, 2.0, 3.0, 4.0])
+    assert_array_equal(m.f.get_all(), m.f[:])
+    m.f.set_all(7.0)
+    assert_array_equal(m.f[:], [7.0, 7.0, 7.0, 7.0])
+
+    m.g = IMeshTag(3, float, mesh=m, name='g')
+    m.g.set_all([[1.0, 2.0, 3.0]] * 4)
+    assert_array_equal(m.g.get_all(), [[1.0, 2.0, 3.0]] * 4)
+    assert_array_equal(m.g[3], [1.0, 2.0, 3.0])
+
+    # changing the iteration order reorders the volume elements
+    flux = m.mesh.getTagHandle('flux')
+    m.f.set_all(flux[list(m.structured_iterate_hex('zyx'))])
+    m.structured_ordering = 'xyz'
+    assert_array_equal(m.f[:], [1.0, 2.0, 3.0, 4.0])
+
 def test_imeshtag_fancy_indexing():
     m = gen_mesh()
 
@@ -753,6 +873,23 @@ def test_iter_ve():
     ves2 = set(m.iter_ve())
 
 
+def test_ve_cache_added_ves():
+    mesh = iMesh.Mesh()
+    verts = mesh.createVtx([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    mesh.createEnt(iMesh.Topology.tetrahedron, verts)
+    m = Mesh(structured=False, mesh=mesh, mats=None)
+    m.src = IMeshTag(1, float)
+    m.src[:] = [1.0]
+    assert_equal(len(m), 1)
+
+    # volume elements added to the iMesh instance are indexed by tags
+    verts = mesh.createVtx([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, -1]])
+    mesh.createEnt(iMesh.Topology.tetrahedron, verts)
+    assert_equal(len(m), 2)
+    m.src[1] = 2.0
+    assert_array_equal(m.src[:], [1.0, 2.0])
+    assert_equal(len(list(m.iter_ve())), 2)
+
 def test_contains():
     m = gen_mesh()
     assert_in(1, m)
@@ -785,6 +922,29 @@ def test_cell_fracs_to_mats():
         assert_equal(mat.density, 1.0)
 
 
+def test_cell_fracs_to_mats_repeated_mixture():
+    m = gen_mesh()
+    cell_fracs = np.zeros(6, dtype=[('idx', np.int64),
+                                    ('cell', np.int64),
+                                    ('vol_frac', np.float64),
+                                    ('rel_error', np.float64)])
+    cell_mats = {11: Material({'H': 1.0}, density = 1.0),
+                 12: Material({'He': 1.0}, density = 2.0)}
+
+    cell_fracs[:] = [(0, 11, 0.5, 0.0), (0, 12, 0.5, 0.0), (1, 11, 1.0, 0.0),
+                     (2, 11, 0.5, 0.0), (2, 12, 0.5, 0.0), (3, 11, 1.0, 0.0)]
+
+    m.cell_fracs_to_mats(cell_fracs, cell_mats)
+
+    # volume elements with the same mixture get equal but separate materials
+    for i, j in [(0, 2), (1, 3)]:
+        assert_true(m.mats[i] is not m.mats[j])
+        assert_equal(m.mats[i].comp, m.mats[j].comp)
+        assert_equal(m.mats[i].density, m.mats[j].density)
+    assert_equal(m.mats[0].density, 1.5)
+    m.mats[0].metadata['name'] = 'zero'
+    assert_not_in('name', m.mats[2].metadata)
+
 def test_tag_cell_fracs():
     m = gen_mesh()
     cell_fracs = np.zeros(7, dtype=[('idx', np.int64),
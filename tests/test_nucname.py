@@ -4,6 +4,8 @@ from unittest import TestCase
 import nose
 import warnings
 
+import numpy as np
+
 from nose.tools import assert_equal, assert_not_equal, assert_raises, raises, assert_in, \
     assert_true, assert_false
 
@@ -540,6 +542,23 @@ def test_ensdf_to_id():
     assert_equal(nucname.ensdf_to_id('269Hs'), 1082690000)
 
 
+def test_convert_array():
+    nucs = ['U235', 'H1', 'U235', 'Am242m', 'H1']
+    ids = nucname.convert_array('id', nucs)
+    assert_equal(ids.dtype, np.int32)
+    assert_equal(list(ids), [nucname.id(nuc) for nuc in nucs])
+    names = nucname.convert_array('name', ids.reshape(5, 1))
+    assert_equal(names.shape, (5, 1))
+    assert_equal(list(names[:, 0]), [nucname.name(nuc) for nuc in nucs])
+    for func in ['zzaaam', 'mcnp', 'serpent', 'alara']:
+        expected = [getattr(nucname, func)(nuc) for nuc in nucs]
+        assert_equal(list(nucname.convert_array(func, nucs)), expected)
+        assert_equal(list(nucname.convert_array(func, ids)), expected)
+    assert_equal(nucname.convert_array('id', []).shape, (0,))
+    assert_raises(ValueError, nucname.convert_array, 'serpent_to_id', ids)
+    assert_raises(nucname.NucTypeError, nucname.convert_array, 'id', [1.5])
+
+
 if __name__ == "__main__":
     nose.runmodule()
 
@@ -163,6 +163,82 @@ def test_analog_multiple_hex():
             halfspace_sum = np.sum(np.rollaxis(tally, i)[j,:,:,:])
             assert(abs(halfspace_sum - 0.5)/0.5 < 0.1)
 
+@with_setup(None, try_rm_file('sampling_mesh.h5m'))
+def test_particle_birth_many():
+    """This test tests that particles sampled in a batch are reproducible,
+    independent of how the batch is split, and sampled uniformly from a uniform
+    source on eight mesh volume elements in two energy groups.
+    """
+    m = Mesh(structured=True,
+             structured_coords=[[0, 0.5, 1], [0, 0.5, 1], [0, 0.5, 1]],
+             mats = None)
+    m.src = IMeshTag(2, float)
+    m.src[:] = np.ones(shape=(8,2))
+    filename = "sampling_mesh.h5m"
+    m.mesh.save(filename)
+    tag_names = {"src_tag_name": "src"}
+    sampler = Sampler(filename, tag_names, np.array([0, 0.5, 1]), DEFAULT_ANALOG)
+
+    num_samples = 5000
+    x, y, z, e, w, c = sampler.particle_birth_many(num_samples, 1953)
+    assert_equal(len(x), num_samples)
+    assert_array_equal(w, np.ones(num_samples))
+    assert_array_equal(c, -np.ones(num_samples))
+
+    # same seed, same particles, however the stream is split
+    again = sampler.particle_birth_many(num_samples, 1953)
+    first = sampler.particle_birth_many(2000, 1953)
+    second = sampler.particle_birth_many(3000, 1953, start=2000)
+    for a, b, b1, b2 in zip((x, y, z, e, w, c), again, first, second):
+        assert_array_equal(a, b)
+        assert_array_equal(a, np.concatenate([b1, b2]))
+    assert(not np.array_equal(x, sampler.particle_birth_many(num_samples, 7)[0]))
+
+    # each half-space of phase space is sampled about half the time
+    for v in (x, y, z, e):
+        assert(abs(np.mean(v < 0.5) - 0.5)/0.5 < 0.1)
+
+    times = sampler.setup_times
+    assert_equal(sorted(times), ["geom", "load", "tags", "total"])
+    assert(times["total"] >= times["geom"] + times["tags"])
+
+def try_rm_cache():
+    try_rm_file('sampling_mesh.h5m')()
+    try_rm_file('sampling_mesh.h5m.sampler')()
+
+@with_setup(None, try_rm_cache)
+def test_cache_file():
+    """This test tests that a sampler set up from a cache file samples the same
+    particles as the sampler that wrote it, and that the cache is only used
+    with the settings it was written for.
+    """
+    m = Mesh(structured=True,
+             structured_coords=[[0, 0.5, 1], [0, 0.5, 1], [0, 0.5, 1]],
+             mats = None)
+    m.src = IMeshTag(2, float)
+    m.src[:] = np.arange(16).reshape(8, 2)
+    m.bias = IMeshTag(2, float)
+    m.bias[:] = np.ones(shape=(8,2))
+    filename = "sampling_mesh.h5m"
+    cache_file = "sampling_mesh.h5m.sampler"
+    m.mesh.save(filename)
+    tag_names = {"src_tag_name": "src", "bias_tag_name": "bias"}
+    e_bounds = np.array([0, 0.5, 1])
+
+    built = Sampler(filename, tag_names, e_bounds, DEFAULT_USER, cache_file)
+    assert(os.path.exists(cache_file))
+    cached = Sampler(filename, tag_names, e_bounds, DEFAULT_USER, cache_file)
+    assert_equal(cached.setup_times["geom"], 0.0)
+    for a, b in zip(built.particle_birth_many(1000, 1953),
+                    cached.particle_birth_many(1000, 1953)):
+        assert_array_equal(a, b)
+
+    # a different mode rebuilds the setup from the mesh
+    analog = Sampler(filename, tag_names, e_bounds, DEFAULT_ANALOG, cache_file)
+    assert(analog.setup_times["geom"] > 0.0)
+    assert_array_equal(analog.particle_birth_many(1000, 1953)[4],
+                       np.ones(1000))
+
 @with_setup(None, try_rm_file('tet.h5m'))
 def test_analog_single_tet():
     """This test tests uniform sampling within a single tetrahedron. This is
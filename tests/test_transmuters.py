@@ -1,5 +1,6 @@
 """Transmuter tests"""
-from nose.tools import assert_equal, assert_almost_equal
+import numpy as np
+from nose.tools import assert_equal, assert_almost_equal, assert_raises
 
 from pyne import data
 from pyne import cram
@@ -15,6 +16,51 @@ def test_transmuters_cram():
     assert_almost_equal(0.5, n1[nucname.id('He3')])
 
 
+def test_transmuters_cram_many():
+    A = -cram.DECAY_MATRIX * data.half_life('H3')
+    idx = dict([(nucname.id(nuc), i) for i, nuc in enumerate(cram.NUCS)])
+    h3 = idx[nucname.id('H3')]
+    he3 = idx[nucname.id('He3')]
+    n0 = np.zeros((3, cram.N))
+    n0[0, h3] = 1.0
+    n0[1, h3] = 2.0
+    n0[2, he3] = 1.0
+    n1 = transmuters.cram_many(A, n0, order=16)
+    assert_equal(n0.shape, n1.shape)
+    assert_almost_equal(0.5, n1[0, h3])
+    assert_almost_equal(0.5, n1[0, he3])
+    assert_almost_equal(1.0, n1[1, h3])
+    assert_almost_equal(1.0, n1[1, he3])
+    assert_almost_equal(1.0, n1[2, he3])
+    exp = transmuters.cram(A, {'H3': 2.0}, order=16)
+    for nuc, val in exp.items():
+        assert_almost_equal(val, n1[1, idx[nuc]])
+    assert_raises(ValueError, transmuters.cram_many, A, n0, 7)
+    assert_raises(ValueError, transmuters.cram_many, A, n0[:, 1:])
+
+
+def test_transmuters_cram_steps():
+    A = -cram.DECAY_MATRIX
+    idx = dict([(nucname.id(nuc), i) for i, nuc in enumerate(cram.NUCS)])
+    h3 = idx[nucname.id('H3')]
+    he3 = idx[nucname.id('He3')]
+    n0 = np.zeros(cram.N)
+    n0[h3] = 1.0
+    t12 = data.half_life('H3')
+    n1 = transmuters.cram_steps(A, n0, dts=[t12, t12, 2*t12], order=16)
+    assert_equal((3, cram.N), n1.shape)
+    for i, frac in enumerate([0.5, 0.25, 0.0625]):
+        assert_almost_equal(frac, n1[i, h3])
+        assert_almost_equal(1.0 - frac, n1[i, he3])
+    # a matrix per step, and many vectors
+    As = np.array([A * t12, A * 3 * t12])
+    n1 = transmuters.cram_steps(As, np.array([n0, 2*n0]), order=16)
+    assert_equal((2, 2, cram.N), n1.shape)
+    assert_almost_equal(0.5, n1[0, 0, h3])
+    assert_almost_equal(0.125, n1[1, 1, h3])
+    assert_raises(ValueError, transmuters.cram_steps, As, n0, [1.0, 2.0, 3.0])
+
+
 # Run as script
 #
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne import nuc_data
 from pyne import nucname as nn
+from pyne import rxname
 from pyne import data
 from pyne.material import Material
 from pyne.transmute.chainsolve import Transmuter
@@ -135,6 +136,93 @@ def test_tm171_decay():
     obs = tm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
     assert_equal(exp, obs['TM171'])
 
+def test_bateman_terms():
+    "Tests the analytic chain terms against the dense matrix exponential"
+    tm.t = 3.0
+    terms = (np.array([0.5]), np.array([0]), np.array([1.0]))
+    prods = []
+    dests = [0.5]
+    # includes a repeated destruction rate and a stable nuclide
+    for p, d in [(0.25, 0.3), (0.1, 0.5), (0.2, 1.2), (0.3, 0.0)]:
+        terms = tm._bateman_terms(terms, p, d)
+        prods.append(p)
+        dests.append(d)
+        obs, err = tm._eval_bateman(terms)
+        exp = linalg.expm(tm._chain_matrix(prods, dests) * tm.t)[-1, 0]
+        assert_almost_equal(exp, obs, places=12)
+        assert_less(err, 1e-12)
+
+def test_fast_matches_dense():
+    "Tests that the fast chain solver agrees with the dense solver"
+    phi = 1e12 * np.ones(175)
+    inp = Material({'FE56': 0.9, 'MN55': 0.1}, mass=1.0)
+    exp = Transmuter(t=1e5, phi=phi, tol=1e-10).transmute(inp)
+    obs = Transmuter(t=1e5, phi=phi, tol=1e-10, fast=True).transmute(inp)
+    assert_equal(set(exp.comp.keys()), set(obs.comp.keys()))
+    for nuc, frac in exp.comp.items():
+        assert_almost_equal(frac / obs[nuc], 1.0, places=6)
+
+def test_partial_cache():
+    "Tests that per-root results are reused and reset with the flux"
+    tm.transmute(Material({'CO59': 1.0}, mass=1.0), t=1e4, phi=1e10)
+    partial = tm._partial_cache[nn.id('CO59')]
+    tm.transmute(Material({'CO59': 1.0}, mass=2.0), t=1e4)
+    assert_is(partial, tm._partial_cache[nn.id('CO59')])
+    tm.phi = 1e11
+    assert_equal(tm._partial_cache, {})
+
+def test_rate_caches():
+    "Tests that memoized rates are reset with the temperature and reactions"
+    tm_rates = Transmuter(phi=1e12)
+    co59 = nn.id('CO59')
+    prod = tm_rates._get_production(co59)
+    tm_rates._get_destruction(co59)
+    tm_rates.rxs = ['gamma', 'fission']
+    assert_equal(tm_rates.rxs, frozenset([rxname.id('gamma')]))
+    assert_equal(tm_rates._prod_cache, {})
+    assert_equal(tm_rates._dest_cache, {})
+    assert_true(set(tm_rates._get_production(co59)) < set(prod))
+    tm_rates.temp = 600.0
+    assert_equal(tm_rates._prod_cache, {})
+    assert_equal(tm_rates._partial_cache, {})
+
+def test_transmute_many():
+    "Tests that batched transmutation matches one material at a time"
+    phi1 = 1e12 * np.ones(175)
+    phi2 = 1e10 * np.ones(175)
+    mats = [Material({'FE56': 1.0}, mass=1.0),
+            Material({'FE56': 0.5, 'CO59': 0.5}, mass=2.0),
+            Material({'CO59': 1.0}, mass=3.0)]
+    phis = [phi1, phi2, phi1]
+    tm_many = Transmuter(t=1e5, tol=1e-10)
+    obs = tm_many.transmute_many(mats, phi_per_mat=phis)
+    assert_equal(len(obs), len(mats))
+    for x, phi, y in zip(mats, phis, obs):
+        exp = Transmuter(t=1e5, phi=phi, tol=1e-10).transmute(x)
+        assert_almost_equal(exp.mass, y.mass)
+        assert_equal(set(exp.comp.keys()), set(y.comp.keys()))
+        for nuc, frac in exp.comp.items():
+            assert_almost_equal(frac / y[nuc], 1.0, places=10)
+    assert_raises(ValueError, tm_many.transmute_many, mats, phi_per_mat=[phi1])
+
+def test_transmute_many_processes():
+    "Tests that a process pool matches serial batched transmutation"
+    phi = 1e12 * np.ones(175)
+    mats = [Material({'FE56': 1.0}, mass=1.0),
+            Material({'FE56': 0.5, 'CO59': 0.5}, mass=2.0),
+            Material({'MN55': 0.5, 'CO59': 0.5}, mass=3.0)]
+    phis = [phi, 1e10 * np.ones(175), phi]
+    exp = Transmuter(t=1e5, tol=1e-10).transmute_many(mats, phi_per_mat=phis)
+    tm_pool = Transmuter(t=1e5, phi=1e11, tol=1e-10)
+    obs = tm_pool.transmute_many(mats, phi_per_mat=phis, processes=2)
+    for x, y in zip(exp, obs):
+        assert_almost_equal(x.mass, y.mass)
+        assert_equal(set(x.comp.keys()), set(y.comp.keys()))
+        for nuc, frac in x.comp.items():
+            assert_almost_equal(frac / y[nuc], 1.0, places=10)
+    # the original flux is restored
+    assert_array_equal(tm_pool.phi, np.ones(175) * 1e11 / 175)
+
 #
 # Run as script
 #